@@ -5,8 +5,31 @@ import os
 from datetime import datetime, timedelta
 import json
 from dotenv import load_dotenv
-import requests
 import time
+import threading
+import uuid
+from search_index import InvertedIndex
+from refresh_scheduler import RefreshScheduler
+from fanout import FanOut
+from provider_client import ProviderClient, extract_items
+from cache_backend import make_cache_backend
+from prepared_response import PreparedResponse
+from career_scoring import CareerScorer
+from batch_scoring import parse_answers, iter_batch_results
+from response_cache import ResponseCache
+from chat_context import ConversationContext
+from storage import Storage
+from session_store import make_session_interface
+from llm_dispatch import HedgedDispatcher, LatencyHistogram
+from circuit_breaker import CircuitBreaker
+from llm_clients import LLMClientRegistry, make_openai_client, make_gemini_model, call_options
+from keyword_matcher import KeywordMatcher
+from college_index import CollegeIndex, KEYWORD_FIELDS, NUMERIC_FIELDS
+from money import normalize_records
+from facet_index import FacetIndex, days_until
+from deadline_index import DeadlineIndex, iter_reminders
+from pagination import (parse_fields, parse_limit, project, encode_cursor, decode_cursor, page_bounds,
+                        paginate, iter_ndjson)
 
 # Load environment variables
 load_dotenv()
@@ -21,29 +44,156 @@ OPENROUTER_API_KEY = os.environ.get('OPENAI_API_KEY', '')  # Using same key for
 GEMINI_API_KEY = os.environ.get('GEMINI_API_KEY', '')
 USE_FREE_API = os.environ.get('USE_FREE_API', 'True').lower() == 'true'
 
+OPENAI_BASE_URL = os.environ.get('OPENAI_BASE_URL', '')
+LLM_TIMEOUT_SECONDS = float(os.environ.get('LLM_TIMEOUT_SECONDS', '30'))
+# Pooled connections per LLM client; raise it under gevent workers, where every open stream holds one
+LLM_MAX_CONNECTIONS = int(os.environ.get('LLM_MAX_CONNECTIONS', '50'))
+GEMINI_MODEL = 'gemini-2.0-flash'
+
+SYSTEM_PROMPT = """You are a helpful career guidance counselor named SmartCareer AI Mentor. 
+Provide advice about careers, education, skills, colleges, scholarships, and professional development. 
+Keep responses concise, actionable, and engaging. Use emojis to make responses friendly. 
+Focus on Indian context but include global opportunities. Be encouraging and motivational."""
+
+# Chatbot answer cache (LLM answers only; rule-based answers are already cheap)
+CHAT_CACHE_SIZE = int(os.environ.get('CHAT_CACHE_SIZE', '1000'))
+CHAT_CACHE_TTL_SECONDS = int(os.environ.get('CHAT_CACHE_TTL_SECONDS', '86400'))
+CHAT_CACHE_FILE = os.environ.get('CHAT_CACHE_FILE', '')
+
+# Conversation context sent with each LLM call: recent turns verbatim, older ones summarized
+CHAT_CONTEXT_TOKENS = int(os.environ.get('CHAT_CONTEXT_TOKENS', '1200'))
+CHAT_SUMMARY_TOKENS = int(os.environ.get('CHAT_SUMMARY_TOKENS', '250'))
+
+# Application database (users, quiz results, chat history, progress)
+STORAGE_DB_PATH = os.environ.get('STORAGE_DB_PATH', 'smartcareer.db')
+# Where session data lives: sqlite (in the storage database), redis (REDIS_URL) or cookie
+SESSION_BACKEND = os.environ.get('SESSION_BACKEND', 'sqlite')
+# Chat history bounds: turns kept per conversation (also the LLM context window), turns kept in total, max age
+CHAT_HISTORY_TURNS = int(os.environ.get('CHAT_HISTORY_TURNS', '50'))
+CHAT_HISTORY_MAX_TURNS = int(os.environ.get('CHAT_HISTORY_MAX_TURNS', '100000'))
+CHAT_HISTORY_MAX_AGE_HOURS = float(os.environ.get('CHAT_HISTORY_MAX_AGE_HOURS', '168'))
+
+# Hedged provider dispatch: start the next provider after the hedge delay, give up after the budget
+CHAT_HEDGE_DELAY_SECONDS = float(os.environ.get('CHAT_HEDGE_DELAY_SECONDS', '2'))
+CHAT_LATENCY_BUDGET_SECONDS = float(os.environ.get('CHAT_LATENCY_BUDGET_SECONDS', '10'))
+# Chat requests one process serves at once; the dispatch pool holds a thread per provider for each
+CHAT_CONCURRENT_REQUESTS = int(os.environ.get('CHAT_CONCURRENT_REQUESTS', '16'))
+CHAT_PROVIDER_COUNT = 3  # openai, openrouter, gemini
+
+# Circuit breakers: trip a provider on >=50% errors or slow calls, retry it after a cool-down
+CHAT_BREAKER_SLOW_CALL_SECONDS = float(os.environ.get('CHAT_BREAKER_SLOW_CALL_SECONDS', '8'))
+CHAT_BREAKER_OPEN_SECONDS = float(os.environ.get('CHAT_BREAKER_OPEN_SECONDS', '30'))
+
 # Scholarship & Opportunity APIs
 NSP_API_KEY = os.environ.get('NSP_API_KEY', '')
 BUDDY4STUDY_API_KEY = os.environ.get('BUDDY4STUDY_API_KEY', '')
 INTERNSHALA_API_KEY = os.environ.get('INTERNSHALA_API_KEY', '')
 NAUKRI_API_KEY = os.environ.get('NAUKRI_API_KEY', '')
+NSP_API_URL = os.environ.get('NSP_API_URL', '')
+BUDDY4STUDY_API_URL = os.environ.get('BUDDY4STUDY_API_URL', '')
+INTERNSHALA_API_URL = os.environ.get('INTERNSHALA_API_URL', '')
+NAUKRI_API_URL = os.environ.get('NAUKRI_API_URL', '')
+# Time one provider fetch may take in total (retries and backoff included), and each HTTP attempt within it
+PROVIDER_TIMEOUT_SECONDS = float(os.environ.get('PROVIDER_TIMEOUT_SECONDS', '5'))
+PROVIDER_ATTEMPT_TIMEOUT_SECONDS = float(os.environ.get('PROVIDER_ATTEMPT_TIMEOUT_SECONDS', '2'))
+
+# Shared cache backend: memory (per worker), sqlite (shared file) or redis
+CACHE_BACKEND = os.environ.get('CACHE_BACKEND', 'memory')
+CACHE_DB_PATH = os.environ.get('CACHE_DB_PATH', 'smartcareer_cache.db')
+REDIS_URL = os.environ.get('REDIS_URL', '')
+CACHE_LEASE_SECONDS = 60
 
 # API Cache for performance
+cache_backend = make_cache_backend(CACHE_BACKEND, CACHE_DB_PATH, REDIS_URL)
 scholarships_cache = {'data': [], 'last_updated': None}
 internships_cache = {'data': [], 'last_updated': None}
 jobs_cache = {'data': [], 'last_updated': None}
 
-# In-memory storage (replaces database)
-users_storage = {}
-quiz_results_storage = []
-chat_history_storage = []
-progress_storage = []
+# Search indexes, rebuilt whenever the matching cache refreshes
+scholarships_index = InvertedIndex(['title', 'provider', 'eligibility'], 'state')
+internships_index = InvertedIndex(['title', 'company', 'category'], 'location')
+jobs_index = InvertedIndex(['title', 'company', 'category'], 'location')
+
+# Facet bitmaps, rebuilt alongside the search indexes
+DEADLINE_WINDOWS = [('closed', None, 0), ('week', 0, 8), ('month', 8, 31), ('quarter', 31, 91), ('later', 91, None)]
+opportunity_facets = {
+    'scholarships': FacetIndex(
+        {'education_level': 'education_level', 'category': 'category', 'state': 'state'},
+        {'deadline': (lambda item: days_until(item.get('deadline')), DEADLINE_WINDOWS),
+         'amount': (lambda item: item.get('amount_max_inr'),
+                    [('under_25k', None, 25000), ('25k_50k', 25000, 50000), ('50k_plus', 50000, None)])}),
+    'internships': FacetIndex(
+        {'category': 'category', 'location': 'location'},
+        {'deadline': (lambda item: days_until(item.get('deadline')), DEADLINE_WINDOWS),
+         'stipend': (lambda item: item.get('stipend_max_inr'),
+                     [('under_1l', None, 100000), ('1l_2l', 100000, 200000), ('2l_plus', 200000, None)])}),
+    'jobs': FacetIndex(
+        {'category': 'category', 'location': 'location', 'skills': 'skills'},
+        {'salary': (lambda item: item.get('salary_max_inr'),
+                    [('under_3l', None, 300000), ('3l_5l', 300000, 500000), ('5l_plus', 500000, None)])})
+}
+
+# Deadline-sorted views for "closing soon" queries and reminders
+deadline_indexes = {
+    'scholarships': DeadlineIndex(),
+    'internships': DeadlineIndex()
+}
+
+# Pre-serialized endpoint bodies, rebuilt whenever a cache refreshes
+prepared_responses = {}
+
+# Background refresh coordinator (single-flight per cache)
+refresh_scheduler = RefreshScheduler()
+
+# Shared keep-alive HTTP transport for every provider integration
+provider_http = ProviderClient(timeout=PROVIDER_ATTEMPT_TIMEOUT_SECONDS, budget=PROVIDER_TIMEOUT_SECONDS)
+
+# Concurrent fan-out: one pool for upstream providers, one for the combined caches.
+# A source gets a second beyond the HTTP budget, so its last retry can still make the merge
+provider_fanout = FanOut(max_workers=8, name='provider', default_timeout=PROVIDER_TIMEOUT_SECONDS + 1)
+cache_fanout = FanOut(max_workers=3, name='cache', default_timeout=PROVIDER_TIMEOUT_SECONDS * 2)
+
+chat_response_cache = ResponseCache(CHAT_CACHE_SIZE, CHAT_CACHE_TTL_SECONDS, CHAT_CACHE_FILE)
+chat_context = ConversationContext(CHAT_CONTEXT_TOKENS, CHAT_SUMMARY_TOKENS)
+
+chat_dispatcher = HedgedDispatcher(
+    CHAT_HEDGE_DELAY_SECONDS,
+    CHAT_LATENCY_BUDGET_SECONDS,
+    max_workers=CHAT_CONCURRENT_REQUESTS * CHAT_PROVIDER_COUNT,
+    breaker_factory=lambda name: CircuitBreaker(
+        name,
+        slow_call_ms=CHAT_BREAKER_SLOW_CALL_SECONDS * 1000,
+        open_seconds=CHAT_BREAKER_OPEN_SECONDS
+    )
+)
+
+# Time to first byte of /chat/stream, per answer source
+stream_ttfb = {}
+
+# LLM clients are built once per process and reused across requests and threads
+llm_clients = LLMClientRegistry()
+llm_clients.register('openai', lambda: make_openai_client(OPENAI_API_KEY, OPENAI_BASE_URL, LLM_TIMEOUT_SECONDS, LLM_MAX_CONNECTIONS))
+llm_clients.register('openrouter', lambda: make_openai_client(OPENROUTER_API_KEY, 'https://openrouter.ai/api/v1', LLM_TIMEOUT_SECONDS,
+                                                                   LLM_MAX_CONNECTIONS))
+llm_clients.register('gemini', lambda: make_gemini_model(GEMINI_API_KEY, GEMINI_MODEL))
+
+# Persistent storage shared by every worker (SQLite in WAL mode)
+storage = Storage(STORAGE_DB_PATH, CHAT_HISTORY_MAX_AGE_HOURS * 3600, CHAT_HISTORY_TURNS, CHAT_HISTORY_MAX_TURNS)
+
+# Server-side sessions: the cookie holds only an id, the data is loaded on first use
+session_interface = make_session_interface(SESSION_BACKEND, STORAGE_DB_PATH, REDIS_URL)
+if session_interface:
+    app.session_interface = session_interface
 
 # API Integration Functions
 
 def fetch_nsp_scholarships():
     """Fetch scholarships from National Scholarships Portal"""
     try:
-        # Mock data for demonstration - replace with actual API call
+        if NSP_API_URL:
+            return extract_items(provider_http.get_json(NSP_API_URL, api_key=NSP_API_KEY))
+        
+        # Mock data used when no provider URL is configured
         scholarships = [
             {
                 'id': 'nsp_001',
@@ -90,7 +240,10 @@ def fetch_nsp_scholarships():
 def fetch_buddy4study_scholarships():
     """Fetch scholarships from Buddy4Study API"""
     try:
-        # Mock data for demonstration - replace with actual API call
+        if BUDDY4STUDY_API_URL:
+            return extract_items(provider_http.get_json(BUDDY4STUDY_API_URL, api_key=BUDDY4STUDY_API_KEY))
+        
+        # Mock data used when no provider URL is configured
         scholarships = [
             {
                 'id': 'buddy_001',
@@ -125,7 +278,10 @@ def fetch_buddy4study_scholarships():
 def fetch_internships():
     """Fetch internships from Internshala API"""
     try:
-        # Mock data for demonstration - replace with actual API call
+        if INTERNSHALA_API_URL:
+            return extract_items(provider_http.get_json(INTERNSHALA_API_URL, api_key=INTERNSHALA_API_KEY))
+        
+        # Mock data used when no provider URL is configured
         internships = [
             {
                 'id': 'intern_001',
@@ -172,7 +328,10 @@ def fetch_internships():
 def fetch_fresher_jobs():
     """Fetch fresher jobs from Naukri API"""
     try:
-        # Mock data for demonstration - replace with actual call
+        if NAUKRI_API_URL:
+            return extract_items(provider_http.get_json(NAUKRI_API_URL, api_key=NAUKRI_API_KEY))
+        
+        # Mock data used when no provider URL is configured
         jobs = [
             {
                 'id': 'job_001',
@@ -223,56 +382,186 @@ def should_update_cache(last_updated, cache_duration_hours=1):
     update_time = datetime.fromisoformat(last_updated) + timedelta(hours=cache_duration_hours)
     return datetime.now() > update_time
 
-def get_scholarships():
-    """Get scholarships with caching"""
-    global scholarships_cache
+def refresh_scholarships():
+    """Fetch and merge scholarships from every provider"""
+    print("Updating scholarships cache...")
+    # Query both providers at once; a slow one is dropped from this refresh
+    all_scholarships, _ = provider_fanout.merge({
+        'nsp': fetch_nsp_scholarships,
+        'buddy4study': fetch_buddy4study_scholarships
+    })
     
-    if should_update_cache(scholarships_cache['last_updated']):
-        print("Updating scholarships cache...")
-        nsp_scholarships = fetch_nsp_scholarships()
-        buddy_scholarships = fetch_buddy4study_scholarships()
-        
-        all_scholarships = nsp_scholarships + buddy_scholarships
-        
-        # Sort by deadline (urgent first)
-        all_scholarships.sort(key=lambda x: x.get('deadline', '9999-12-31'))
-        
-        scholarships_cache['data'] = all_scholarships
-        scholarships_cache['last_updated'] = datetime.now().isoformat()
+    # Sort by deadline (urgent first)
+    all_scholarships.sort(key=lambda x: x.get('deadline', '9999-12-31'))
+    return normalize_records(all_scholarships, money_fields=('amount',))
+
+def refresh_internships():
+    """Fetch internships"""
+    print("Updating internships cache...")
+    internships_data = fetch_internships()
     
-    return scholarships_cache['data']
+    # Sort by posted date (newest first)
+    internships_data.sort(key=lambda x: x.get('posted_date', ''), reverse=True)
+    return normalize_records(internships_data, money_fields=('stipend',))
 
-def get_internships():
-    """Get internships with caching"""
-    global internships_cache
+def refresh_jobs():
+    """Fetch fresher jobs"""
+    print("Updating jobs cache...")
+    jobs_data = fetch_fresher_jobs()
     
-    if should_update_cache(internships_cache['last_updated']):
-        print("Updating internships cache...")
-        internships_data = fetch_internships()
-        
-        # Sort by posted date (newest first)
-        internships_data.sort(key=lambda x: x.get('posted_date', ''), reverse=True)
-        
-        internships_cache['data'] = internships_data
-        internships_cache['last_updated'] = datetime.now().isoformat()
+    # Sort by posted date (newest first)
+    jobs_data.sort(key=lambda x: x.get('posted_date', ''), reverse=True)
+    return normalize_records(jobs_data, money_fields=('salary',))
+
+opportunity_caches = {
+    'scholarships': (scholarships_cache, scholarships_index, refresh_scholarships),
+    'internships': (internships_cache, internships_index, refresh_internships),
+    'jobs': (jobs_cache, jobs_index, refresh_jobs)
+}
+
+def apply_cache_snapshot(name, data, last_updated):
+    """Install a new snapshot of one cache and rebuild everything derived from it"""
+    cache, index, _ = opportunity_caches[name]
+    index.build(data)
+    opportunity_facets[name].build(data)
+    if name in deadline_indexes:
+        deadline_indexes[name].build(data)
+    cache['data'] = data
+    cache['last_updated'] = last_updated
     
-    return internships_cache['data']
+    # Serialize the hot endpoint body once per refresh, not once per request
+    prepared_responses[name] = PreparedResponse(build_feed_payload(name))
 
-def get_jobs():
-    """Get jobs with caching"""
-    global jobs_cache
+def build_feed_payload(name):
+    """Body of /api/scholarships, /api/internships and /api/jobs"""
+    cache = opportunity_caches[name][0]
+    return {
+        'success': True,
+        'data': cache['data'],
+        'count': len(cache['data']),
+        'last_updated': cache['last_updated']
+    }
+
+def build_opportunities_payload():
+    """Body of /api/opportunities"""
+    scholarships = scholarships_cache['data']
+    internships = internships_cache['data']
+    jobs = jobs_cache['data']
+    return {
+        'success': True,
+        'data': {
+            'scholarships': scholarships,
+            'internships': internships,
+            'jobs': jobs
+        },
+        'counts': {
+            'scholarships': len(scholarships),
+            'internships': len(internships),
+            'jobs': len(jobs),
+            'total': len(scholarships) + len(internships) + len(jobs)
+        },
+        'last_updated': {
+            'scholarships': scholarships_cache['last_updated'],
+            'internships': internships_cache['last_updated'],
+            'jobs': jobs_cache['last_updated']
+        }
+    }
+
+opportunities_lock = threading.Lock()
+
+def prepared_opportunities():
+    """Combined /api/opportunities body, rebuilt once whenever any feed's snapshot changes.
     
-    if should_update_cache(jobs_cache['last_updated']):
-        print("Updating jobs cache...")
-        jobs_data = fetch_fresher_jobs()
-        
-        # Sort by posted date (newest first)
-        jobs_data.sort(key=lambda x: x.get('posted_date', ''), reverse=True)
-        
-        jobs_cache['data'] = jobs_data
-        jobs_cache['last_updated'] = datetime.now().isoformat()
+    Keyed on the three last_updated values, read before the data, so a body
+    built while a refresh lands is at worst rebuilt again on the next request
+    instead of being served until the next refresh.
+    """
+    key = tuple(cache['last_updated'] for cache, _, _ in opportunity_caches.values())
+    current = prepared_responses.get('opportunities')
+    if current is None or current[0] != key:
+        with opportunities_lock:
+            key = tuple(cache['last_updated'] for cache, _, _ in opportunity_caches.values())
+            current = prepared_responses.get('opportunities')
+            if current is None or current[0] != key:
+                current = (key, PreparedResponse(build_opportunities_payload()))
+                prepared_responses['opportunities'] = current
+    return current[1]
+
+def serve_prepared(name, build_payload):
+    """Serve a pre-serialized body, building it on the spot if a refresh hasn't yet"""
+    prepared = prepared_responses.get(name)
+    if prepared is None:
+        prepared = PreparedResponse(build_payload())
+    return prepared.to_response(request)
+
+def sync_cache(name):
+    """Bring this worker's copy of a cache up to date.
+    
+    Adopts a fresher snapshot another worker already published to the shared
+    backend; otherwise refreshes it, but only if this worker wins the refresh
+    lease, so the fleet fetches once per TTL.
+    """
+    cache, _, refresh = opportunity_caches[name]
+    
+    shared_updated = cache_backend.last_updated(name)
+    if shared_updated and shared_updated != cache['last_updated'] and not should_update_cache(shared_updated):
+        entry = cache_backend.load(name)
+        if entry:
+            apply_cache_snapshot(name, entry['data'], entry['last_updated'])
+            return
     
-    return jobs_cache['data']
+    if cache_backend.acquire_refresh_lease(name, CACHE_LEASE_SECONDS):
+        try:
+            data = refresh()
+            last_updated = datetime.now().isoformat()
+            cache_backend.store(name, {'data': data, 'last_updated': last_updated})
+            apply_cache_snapshot(name, data, last_updated)
+        finally:
+            cache_backend.release_refresh_lease(name)
+        return
+    
+    if cache['last_updated'] is None:
+        # Cold worker while another one refreshes: wait for its snapshot
+        deadline = time.time() + CACHE_LEASE_SECONDS
+        while time.time() < deadline:
+            time.sleep(0.1)
+            if cache_backend.last_updated(name) != shared_updated:
+                entry = cache_backend.load(name)
+                if entry:
+                    apply_cache_snapshot(name, entry['data'], entry['last_updated'])
+                    return
+        apply_cache_snapshot(name, refresh(), datetime.now().isoformat())
+
+def ensure_fresh(name):
+    """Stale-while-revalidate: serve cached data and refresh it in the background.
+    
+    Only a cold cache (never loaded) makes the request wait, and then only
+    for the single refresh already in flight.
+    """
+    cache = opportunity_caches[name][0]
+    if should_update_cache(cache['last_updated']):
+        refresh_scheduler.trigger(name, lambda: sync_cache(name), wait=cache['last_updated'] is None)
+    return cache['data']
+
+def get_scholarships():
+    """Get scholarships with caching"""
+    return ensure_fresh('scholarships')
+
+def get_internships():
+    """Get internships with caching"""
+    return ensure_fresh('internships')
+
+def get_jobs():
+    """Get jobs with caching"""
+    return ensure_fresh('jobs')
+
+def get_cache_status():
+    """Per-cache age and refresh timings"""
+    return {
+        'scholarships': refresh_scheduler.status('scholarships', scholarships_cache['last_updated']),
+        'internships': refresh_scheduler.status('internships', internships_cache['last_updated']),
+        'jobs': refresh_scheduler.status('jobs', jobs_cache['last_updated'])
+    }
 
 # Routes
 @app.route('/')
@@ -295,7 +584,7 @@ def submit_quiz():
         # Process quiz answers
         career_recommendations = predict_career(answers)
         
-        # Save to session and in-memory storage
+        # Save to session and the database
         session['quiz_results'] = {
             'answers': answers,
             'predicted_career': career_recommendations[0]['career'],
@@ -304,14 +593,9 @@ def submit_quiz():
             'timestamp': datetime.now().isoformat()
         }
         
-        # Store in memory if user is logged in
+        # Store in the database if user is logged in
         if 'user_email' in session:
-            quiz_results_storage.append({
-                'user_email': session['user_email'],
-                'answers': answers,
-                'recommendations': career_recommendations,
-                'timestamp': datetime.now().isoformat()
-            })
+            storage.add_quiz_result(session['user_email'], answers, career_recommendations)
         
         return jsonify({
             'success': True,
@@ -320,71 +604,85 @@ def submit_quiz():
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
+@app.route('/submit_quiz/batch', methods=['POST'])
+def submit_quiz_batch():
+    """Score a whole class of quiz answers (CSV or JSONL) and stream NDJSON results"""
+    try:
+        upload = request.files.get('file')
+        if upload:
+            text = upload.read().decode('utf-8-sig')
+            filename = upload.filename or ''
+        else:
+            text = request.get_data(as_text=True)
+            filename = ''
+        
+        if not text.strip():
+            return jsonify({'error': 'No answers provided'}), 400
+        
+        fmt = request.args.get('format')
+        if not fmt:
+            if filename.endswith('.csv') or request.mimetype == 'text/csv':
+                fmt = 'csv'
+            elif filename.endswith(('.jsonl', '.ndjson')) or request.mimetype in ('application/x-ndjson', 'application/jsonl'):
+                fmt = 'jsonl'
+        
+        records = parse_answers(text.splitlines(), fmt)
+        return Response(iter_batch_results(records, predict_careers), mimetype='application/x-ndjson')
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+# Career scoring model: careers plus the interest/skill -> career mappings
+CAREERS = [
+    'Software Developer',
+    'Data Scientist',
+    'UX/UI Designer',
+    'Digital Marketing',
+    'Business Analyst',
+    'Cybersecurity Expert',
+    'AI/ML Engineer',
+    'Content Writer',
+    'Product Manager',
+    'Cloud Architect'
+]
+
+INTEREST_MAPPING = {
+    'technology': ['Software Developer', 'Data Scientist', 'AI/ML Engineer', 'Cybersecurity Expert'],
+    'creative': ['UX/UI Designer', 'Content Writer', 'Digital Marketing'],
+    'business': ['Business Analyst', 'Product Manager', 'Digital Marketing'],
+    'analytics': ['Data Scientist', 'Business Analyst', 'AI/ML Engineer'],
+    'design': ['UX/UI Designer', 'Product Manager'],
+    'communication': ['Digital Marketing', 'Content Writer', 'Product Manager']
+}
+
+SKILL_MAPPING = {
+    'programming': ['Software Developer', 'AI/ML Engineer', 'Data Scientist'],
+    'design': ['UX/UI Designer'],
+    'writing': ['Content Writer', 'Digital Marketing'],
+    'mathematics': ['Data Scientist', 'AI/ML Engineer', 'Business Analyst'],
+    'problemsolving': ['Software Developer', 'Cybersecurity Expert', 'Cloud Architect']
+}
+
 def predict_career(answers):
     """Predict career based on quiz answers"""
-    # This is a simplified version. Replace with actual ML model
-    # For now, using rule-based logic
-    
-    interests = answers.get('interests', [])
-    skills = answers.get('skills', [])
-    personality = answers.get('personality', '')
-    
-    career_scores = {
-        'Software Developer': 0,
-        'Data Scientist': 0,
-        'UX/UI Designer': 0,
-        'Digital Marketing': 0,
-        'Business Analyst': 0,
-        'Cybersecurity Expert': 0,
-        'AI/ML Engineer': 0,
-        'Content Writer': 0,
-        'Product Manager': 0,
-        'Cloud Architect': 0
-    }
-    
-    # Scoring logic based on interests
-    interest_mapping = {
-        'technology': ['Software Developer', 'Data Scientist', 'AI/ML Engineer', 'Cybersecurity Expert'],
-        'creative': ['UX/UI Designer', 'Content Writer', 'Digital Marketing'],
-        'business': ['Business Analyst', 'Product Manager', 'Digital Marketing'],
-        'analytics': ['Data Scientist', 'Business Analyst', 'AI/ML Engineer'],
-        'design': ['UX/UI Designer', 'Product Manager'],
-        'communication': ['Digital Marketing', 'Content Writer', 'Product Manager']
-    }
-    
-    for interest in interests:
-        if interest.lower() in interest_mapping:
-            for career in interest_mapping[interest.lower()]:
-                career_scores[career] += 20
-    
-    # Scoring based on skills
-    skill_mapping = {
-        'programming': ['Software Developer', 'AI/ML Engineer', 'Data Scientist'],
-        'design': ['UX/UI Designer'],
-        'writing': ['Content Writer', 'Digital Marketing'],
-        'mathematics': ['Data Scientist', 'AI/ML Engineer', 'Business Analyst'],
-        'problemsolving': ['Software Developer', 'Cybersecurity Expert', 'Cloud Architect']
-    }
-    
-    for skill in skills:
-        skill_key = skill.lower().replace(' ', '').replace('-', '')
-        if skill_key in skill_mapping:
-            for career in skill_mapping[skill_key]:
-                career_scores[career] += 15
-    
-    # Sort careers by score
-    sorted_careers = sorted(career_scores.items(), key=lambda x: x[1], reverse=True)
-    
-    # Return top 3 recommendations
+    # Rule-based weights scored with one matrix-vector product (see career_scoring.py)
+    return build_recommendations(career_scorer.score(answers, k=3))
+
+def predict_careers(answers_list):
+    """Batch version of predict_career: one matrix product for every answer set"""
+    return [build_recommendations(top_careers) for top_careers in career_scorer.score_many(answers_list, k=3)]
+
+def build_recommendations(top_careers):
+    """Turn (career_index, score) pairs into the recommendation dicts"""
     recommendations = []
-    for i, (career, score) in enumerate(sorted_careers[:3]):
+    for i, (column, score) in enumerate(top_careers):
+        profile = career_profiles[column]
         recommendations.append({
             'rank': i + 1,
-            'career': career,
+            'career': profile['career'],
             'score': min(score, 100),  # Cap at 100
-            'description': get_career_description(career),
-            'skills_needed': get_career_skills(career),
-            'avg_salary': get_career_salary(career)
+            'description': profile['description'],
+            'skills_needed': list(profile['skills_needed']),
+            'avg_salary': profile['avg_salary']
         })
     
     return recommendations
@@ -434,6 +732,29 @@ def get_career_salary(career):
     }
     return salaries.get(career, '$50,000 - $100,000')
 
+# Built once at import: weight matrix and per-career static recommendation fields
+career_scorer = CareerScorer(CAREERS, INTEREST_MAPPING, SKILL_MAPPING)
+career_profiles = [
+    {
+        'career': career,
+        'description': get_career_description(career),
+        'skills_needed': get_career_skills(career),
+        'avg_salary': get_career_salary(career)
+    }
+    for career in CAREERS
+]
+
+def get_conversation_id():
+    """Stable id for this browser's conversation, kept in the session"""
+    if 'chat_id' not in session:
+        session['chat_id'] = uuid.uuid4().hex
+    return session['chat_id']
+
+def get_conversation_context():
+    """Earlier turns of this conversation as LLM messages, within the context token budget"""
+    conversation_id = get_conversation_id()
+    return chat_context.build(conversation_id, storage.recent_chat_turns(conversation_id, CHAT_HISTORY_TURNS))
+
 @app.route('/chat', methods=['POST'])
 def chat():
     """Handle chatbot conversation"""
@@ -449,27 +770,13 @@ def chat():
         
         print(f"Received message: {user_message}")
         
-        # Get chatbot response
-        bot_response = get_chatbot_response(user_message)
+        # Get chatbot response, with the earlier turns as context
+        bot_response = get_chatbot_response(user_message, get_conversation_context())
         
         print(f"Generated response: {bot_response[:100]}...")
         
-        # Save to in-memory storage
-        chat_entry = {
-            'message': user_message,
-            'response': bot_response,
-            'timestamp': datetime.now().isoformat()
-        }
-        
-        if 'user_email' in session:
-            chat_entry['user_email'] = session['user_email']
-        
-        chat_history_storage.append(chat_entry)
-        
-        # Also save to session
-        if 'chat_history' not in session:
-            session['chat_history'] = []
-        session['chat_history'].append(chat_entry)
+        # Save to the database; the session only carries the conversation id
+        storage.add_chat_turn(get_conversation_id(), user_message, bot_response, session.get('user_email'))
         
         return jsonify({
             'success': True,
@@ -485,6 +792,32 @@ def chat():
             'response': get_rule_based_response('help')
         }), 200
 
+def sse_data(text):
+    """One SSE message; embedded newlines become extra data: lines per the SSE spec"""
+    return ''.join(f"data: {line}\n" for line in text.split('\n')) + "\n"
+
+def sse_event(event, payload):
+    """Named SSE event carrying a JSON payload"""
+    return f"event: {event}\ndata: {json.dumps(payload)}\n\n"
+
+def iter_answer_chunks(answer):
+    """Split a complete answer into paragraph chunks for instant delivery"""
+    paragraphs = answer.split('\n\n')
+    for i, paragraph in enumerate(paragraphs):
+        yield paragraph + ('\n\n' if i < len(paragraphs) - 1 else '')
+
+def get_stream_providers():
+    """Token-streaming LLM providers in the same priority order as get_chat_providers"""
+    streamers = {
+        'openai': stream_openai_response,
+        'openrouter': stream_openrouter_response,
+        'gemini': stream_gemini_response
+    }
+    return [(name, streamers[name]) for name, _ in get_chat_providers()]
+
+def record_stream_ttfb(source, ttfb_ms):
+    stream_ttfb.setdefault(source, LatencyHistogram()).record(ttfb_ms)
+
 @app.route('/chat/stream', methods=['POST'])
 def chat_stream():
     """Handle streaming chatbot conversation for real-time responses"""
@@ -499,59 +832,93 @@ def chat_stream():
             return jsonify({'error': 'Message is required'}), 400
         
         print(f"Stream request for: {user_message}")
+        context = get_conversation_context()
+        
+        def deliver_complete(answer, source, started):
+            """Send an already-complete answer at once (cache hit or rule-based)"""
+            ttfb_ms = None
+            for chunk in iter_answer_chunks(answer):
+                if ttfb_ms is None:
+                    ttfb_ms = round((time.perf_counter() - started) * 1000, 1)
+                    record_stream_ttfb(source, ttfb_ms)
+                yield sse_data(chunk)
+            yield sse_event('metrics', {
+                'source': source,
+                'ttfb_ms': ttfb_ms,
+                'total_ms': round((time.perf_counter() - started) * 1000, 1)
+            })
+            yield "data: [DONE]\n\n"
         
         def generate():
+            started = time.perf_counter()
             try:
-                # Try OpenAI streaming first if API key is properly configured
-                if OPENAI_API_KEY and len(OPENAI_API_KEY) > 10 and not USE_FREE_API:
+                # Cached answers are context-free, so they only serve a conversation's first turn
+                cached = None if context else chat_response_cache.get(user_message)
+                if cached:
+                    yield from deliver_complete(cached, 'cache', started)
+                    return
+                
+                if USE_FREE_API:
+                    yield from deliver_complete(get_chatbot_response(user_message, context), 'fallback', started)
+                    return
+                
+                # Stream tokens from the first healthy provider that produces any
+                for name, stream_provider in get_stream_providers():
+                    ticket = chat_dispatcher.allow(name)
+                    if not ticket:
+                        print(f"Skipping {name} stream: circuit open")
+                        continue
+                    
+                    provider_started = time.perf_counter()
+                    parts = []
+                    completed = False
+                    ttfb_ms = None
+                    first_token_ms = None
                     try:
-                        from openai import OpenAI
-                        client = OpenAI(api_key=OPENAI_API_KEY)
-                        
-                        system_prompt = """You are a helpful career guidance counselor named SmartCareer AI Mentor. 
-                        Provide advice about careers, education, skills, colleges, scholarships, and professional development. 
-                        Keep responses concise, actionable, and engaging. Use emojis to make responses friendly. 
-                        Focus on Indian context but include global opportunities. Be encouraging and motivational."""
-                        
-                        stream = client.chat.completions.create(
-                            model="gpt-3.5-turbo",
-                            messages=[
-                                {"role": "system", "content": system_prompt},
-                                {"role": "user", "content": user_message}
-                            ],
-                            max_tokens=300,
-                            temperature=0.7,
-                            stream=True
-                        )
-                        
-                        for chunk in stream:
-                            if chunk.choices[0].delta.content:
-                                yield f"data: {chunk.choices[0].delta.content}\n\n"
-                        yield "data: [DONE]\n\n"
-                        return
-                        
+                        for text in stream_provider(user_message, context=context):
+                            if not parts:
+                                ttfb_ms = round((time.perf_counter() - started) * 1000, 1)
+                                first_token_ms = (time.perf_counter() - provider_started) * 1000
+                                record_stream_ttfb(name, ttfb_ms)
+                            parts.append(text)
+                            yield sse_data(text)
+                        completed = True
+                    except GeneratorExit:
+                        # The client went away; that says nothing against a provider that was sending
+                        chat_dispatcher.record(name, first_token_ms or (time.perf_counter() - provider_started) * 1000,
+                                               ok=bool(parts), ticket=ticket)
+                        raise
                     except Exception as e:
-                        print(f"OpenAI streaming error: {e}")
+                        print(f"{name} streaming error: {e}")
+                    
+                    # One outcome per stream, once it has finished or failed: a provider that dies
+                    # mid-stream counts as a failure; a finished one is judged on time to first token
+                    ok = completed and bool(parts)
+                    latency_ms = first_token_ms if ok else (time.perf_counter() - provider_started) * 1000
+                    chat_dispatcher.record(name, latency_ms, ok=ok, ticket=ticket)
+                    
+                    if not parts:
+                        # Nothing reached the client yet, so the next provider can take over
+                        continue
+                    
+                    if completed and not context:
+                        chat_response_cache.put(user_message, ''.join(parts).strip())
+                    yield sse_event('metrics', {
+                        'source': name,
+                        'ttfb_ms': ttfb_ms,
+                        'total_ms': round((time.perf_counter() - started) * 1000, 1)
+                    })
+                    yield "data: [DONE]\n\n"
+                    return
                 
-                # Fallback to regular response (always works)
+                # Every provider failed or is tripped: rule-based answer, delivered instantly
                 print("Using rule-based fallback for streaming")
-                response = get_chatbot_response(user_message)
-                
-                # Stream the response word by word for better UX
-                words = response.split(' ')
-                for i, word in enumerate(words):
-                    if i == len(words) - 1:
-                        yield f"data: {word}\n\n"
-                    else:
-                        yield f"data: {word} \n\n"
-                    time.sleep(0.02)  # Small delay for streaming effect
-                
-                yield "data: [DONE]\n\n"
+                yield from deliver_complete(get_rule_based_response(user_message), 'rule_based', started)
                 
             except Exception as e:
                 print(f"Streaming error: {e}")
                 error_msg = "Sorry, I encountered an error. Please try again!"
-                yield f"data: {error_msg}\n\n"
+                yield sse_data(error_msg)
                 yield "data: [DONE]\n\n"
         
         return Response(generate(), mimetype='text/event-stream', headers={
@@ -563,8 +930,31 @@ def chat_stream():
         print(f"Stream endpoint error: {e}")
         return jsonify({'error': str(e)}), 500
 
-def get_chatbot_response(message):
-    """Generate chatbot response using AI or rule-based system"""
+@app.route('/api/chat/status')
+def api_chat_status():
+    """Chatbot response cache, provider latency and circuit breaker status"""
+    return jsonify({
+        'success': True,
+        'cache': chat_response_cache.stats(),
+        'latency': chat_dispatcher.stats(),
+        'breakers': chat_dispatcher.breaker_states(),
+        'context': chat_context.stats(),
+        'stream_ttfb': {source: histogram.snapshot() for source, histogram in list(stream_ttfb.items())}
+    })
+
+def get_chat_providers():
+    """LLM providers in priority order, skipping any without a usable key"""
+    providers = []
+    if OPENAI_API_KEY and len(OPENAI_API_KEY) > 10:
+        providers.append(('openai', get_openai_response))
+    if OPENROUTER_API_KEY and len(OPENROUTER_API_KEY) > 10:
+        providers.append(('openrouter', get_openrouter_response))
+    if GEMINI_API_KEY and len(GEMINI_API_KEY) > 10:
+        providers.append(('gemini', get_gemini_response))
+    return providers
+
+def get_chatbot_response(message, context=None):
+    """Generate chatbot response using AI or rule-based system; context is earlier turns as LLM messages"""
     
     # Always ensure we have a valid message
     if not message or not message.strip():
@@ -572,83 +962,58 @@ def get_chatbot_response(message):
     
     message = message.strip()
     
-    # Try OpenRouter/OpenAI API first if configured
-    if OPENAI_API_KEY and len(OPENAI_API_KEY) > 10:
-        try:
-            response = get_openai_response(message)
-            if response:
-                return response
-        except Exception as e:
-            print(f"OpenAI API error: {e}")
-            # Fall back to rule-based
+    # Repeat questions skip the LLM round trip entirely (cached answers carry no context)
+    cached = None if context else chat_response_cache.get(message)
+    if cached:
+        return cached
     
-    # Try Gemini API as alternative
-    if GEMINI_API_KEY and len(GEMINI_API_KEY) > 10:
-        try:
-            response = get_gemini_response(message)
-            if response:
-                return response
-        except Exception as e:
-            print(f"Gemini API error: {e}")
-            # Fall back to rule-based
+    # Race the configured LLM providers (OpenAI, OpenRouter, Gemini) under a latency budget
+    # Each call is given the time left in the budget, so an abandoned call frees its thread when the budget ends
+    providers = [(name, lambda text, timeout, provider=provider: provider(text, context, timeout))
+                 for name, provider in get_chat_providers()]
+    _, response = chat_dispatcher.dispatch(providers, message)
+    if response:
+        if not context:
+            chat_response_cache.put(message, response)
+        return response
     
     # Always use rule-based as reliable fallback
     print(f"Using rule-based response for: {message}")
     return get_rule_based_response(message)
 
-def get_openai_response(message):
+def build_chat_messages(message, context=None):
+    """System prompt, earlier turns, then the new user message"""
+    return [{"role": "system", "content": SYSTEM_PROMPT}] + list(context or []) + [{"role": "user", "content": message}]
+
+def get_openai_response(message, context=None, timeout=None):
     """Get response from OpenAI API with streaming support"""
     try:
-        from openai import OpenAI
-        client = OpenAI(api_key=OPENAI_API_KEY)
-        
-        system_prompt = """You are a helpful career guidance counselor named SmartCareer AI Mentor. 
-        Provide advice about careers, education, skills, colleges, scholarships, and professional development. 
-        Keep responses concise, actionable, and engaging. Use emojis to make responses friendly. 
-        Focus on Indian context but include global opportunities. Be encouraging and motivational."""
+        client = llm_clients.get('openai')
         
         response = client.chat.completions.create(
             model="gpt-3.5-turbo",
-            messages=[
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": message}
-            ],
+            messages=build_chat_messages(message, context),
             max_tokens=300,
             temperature=0.7,
-            stream=False
+            stream=False,
+            **call_options(timeout)
         )
         
         return response.choices[0].message.content.strip()
     except Exception as e:
-        # Try OpenRouter as fallback
-        try:
-            return get_openrouter_response(message)
-        except:
-            raise Exception(f"OpenAI API error: {str(e)}")
+        raise Exception(f"OpenAI API error: {str(e)}")
 
-def get_openrouter_response(message):
+def get_openrouter_response(message, context=None, timeout=None):
     """Get response from OpenRouter API"""
     try:
-        from openai import OpenAI
-        
-        client = OpenAI(
-            base_url="https://openrouter.ai/api/v1",
-            api_key=OPENROUTER_API_KEY,
-        )
-        
-        system_prompt = """You are a helpful career guidance counselor named SmartCareer AI Mentor. 
-        Provide advice about careers, education, skills, colleges, scholarships, and professional development. 
-        Keep responses concise, actionable, and engaging. Use emojis to make responses friendly. 
-        Focus on Indian context but include global opportunities. Be encouraging and motivational."""
+        client = llm_clients.get('openrouter')
         
         response = client.chat.completions.create(
             model="openai/gpt-3.5-turbo",
-            messages=[
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": message}
-            ],
+            messages=build_chat_messages(message, context),
             max_tokens=300,
-            temperature=0.7
+            temperature=0.7,
+            **call_options(timeout)
         )
         
         return response.choices[0].message.content.strip()
@@ -656,105 +1021,124 @@ def get_openrouter_response(message):
         raise Exception(f"OpenRouter API error: {str(e)}")
 
 
-def get_gemini_response(message):
+def get_gemini_response(message, context=None, timeout=None):
     """Get response from Google Gemini API"""
     try:
-        import google.generativeai as genai
-        genai.configure(api_key=os.environ.get('GEMINI_API_KEY'))
-        
-        # Use a working model from the available list
-        model = genai.GenerativeModel('gemini-2.0-flash')
-        
-        prompt = f"""You are a helpful career guidance counselor named SmartCareer AI Mentor. 
-        Provide advice about careers, education, skills, colleges, scholarships, and professional development. 
-        Keep responses concise, actionable, and engaging. Use emojis to make responses friendly. 
-        Focus on Indian context but include global opportunities. Be encouraging and motivational.
-        
-        User: {message}
-        
-        Provide a helpful response:"""
-        
-        response = model.generate_content(prompt)
+        model = llm_clients.get('gemini')
+        response = model.generate_content(build_gemini_prompt(message, context), request_options=call_options(timeout))
         return response.text.strip()
     except Exception as e:
         raise Exception(f"Gemini API error: {str(e)}")
 
+def build_gemini_prompt(message, context=None):
+    """Gemini takes the system prompt, earlier turns and user message as one prompt"""
+    speakers = {'system': 'Context', 'user': 'User', 'assistant': 'Mentor'}
+    conversation = ''.join(f"{speakers[turn['role']]}: {turn['content']}\n        \n        " for turn in context or [])
+    return f"""{SYSTEM_PROMPT}
+        
+        {conversation}User: {message}
+        
+        Provide a helpful response:"""
+
+def stream_openai_response(message, client_name='openai', model="gpt-3.5-turbo", context=None):
+    """Yield answer tokens from an OpenAI-compatible provider as they arrive"""
+    client = llm_clients.get(client_name)
+    stream = client.chat.completions.create(
+        model=model,
+        messages=build_chat_messages(message, context),
+        max_tokens=300,
+        temperature=0.7,
+        stream=True
+    )
+    for chunk in stream:
+        if chunk.choices and chunk.choices[0].delta.content:
+            yield chunk.choices[0].delta.content
+
+def stream_openrouter_response(message, context=None):
+    """Yield answer tokens from OpenRouter"""
+    return stream_openai_response(message, 'openrouter', "openai/gpt-3.5-turbo", context)
+
+def stream_gemini_response(message, context=None):
+    """Yield answer text from Gemini as it is generated"""
+    model = llm_clients.get('gemini')
+    for chunk in model.generate_content(build_gemini_prompt(message, context), stream=True):
+        text = chunk.text
+        if text:
+            yield text
+
 def get_free_ai_response(message):
     """Get response from rule-based system"""
     return get_rule_based_response(message)
 
-def get_rule_based_response(message):
-    """Enhanced rule-based chatbot responses with comprehensive career guidance"""
-    if not message:
-        return "Hello! How can I help you with your career today? 😊"
+# Rule-based chatbot answers, matched by keyword in this order
+RULE_BASED_RESPONSES = {
+    # Greetings
+    'hello': "Hello! 👋 I'm your AI Career Mentor from SmartCareer. I'm here to guide you through your career journey!\n\nI can help with:\n✅ Career exploration & planning\n✅ College & course recommendations\n✅ Skill development roadmaps\n✅ Interview preparation\n✅ Salary insights\n\nWhat would you like to explore today?",
+    'hi': "Hi there! 😊 Welcome to SmartCareer!\n\nHow can I assist you with your career today?",
+    'hey': "Hey! 🙌 I'm here to help you succeed in your career!\n\nWhat's on your mind?",
     
-    message_lower = message.lower().strip()
+    # AI/ML related
+    'artificial intelligence': "Artificial Intelligence is revolutionizing the world! 🤖\n\n**Career Paths:**\n• AI Research Scientist (₹20-40 LPA)\n• ML Engineer (₹15-30 LPA)\n• AI Product Manager (₹25-50 LPA)\n\n**Essential Skills:**\n• Python, TensorFlow, PyTorch\n• Deep Learning & Neural Networks\n• Mathematics (Linear Algebra, Calculus)\n• NLP & Computer Vision\n\n**Top Colleges:**\n• IIT Madras, Delhi, Bombay\n• IIIT Hyderabad\n• ISI Kolkata\n\n**Learning Resources:**\n• Andrew Ng's ML Course (Coursera)\n• Fast.ai\n• DeepLearning.AI\n\nVisit our AI/ML/Data Science section for detailed roadmap!",
+    'machine learning': "Machine Learning is the future! 🧠\n\n**What You Need:**\n• Python (scikit-learn, pandas, NumPy)\n• Statistics & Probability\n• Algorithms & Data Structures\n• Math (Linear Algebra)\n\n**Career Options:**\n1. ML Engineer - ₹15-28 LPA\n2. Data Scientist - ₹12-25 LPA\n3. Research Scientist - ₹18-35 LPA\n\n**Learning Path:**\n1. Python basics (2 months)\n2. Math foundations (2 months)\n3. ML algorithms (3 months)\n4. Projects & Kaggle (ongoing)\n\n**Top Companies Hiring:**\nGoogle, Microsoft, Amazon, Netflix, Uber\n\nWant a detailed roadmap?",
+    'data science': "Data Science is booming! 📊\n\n**Core Skills:**\n• Python (pandas, NumPy, matplotlib)\n• Statistics & Hypothesis Testing\n• SQL & Database Management\n• Machine Learning\n• Data Visualization (Tableau, Power BI)\n\n**Career Path:**\n• Junior Data Analyst: ₹4-8 LPA\n• Data Scientist: ₹12-20 LPA\n• Senior DS: ₹25-40 LPA\n• Lead/Principal: ₹50+ LPA\n\n**Best Colleges:**\n• IIT Madras, Bombay, Delhi\n• IIIT Hyderabad (₹32 LPA avg!)\n• ISI Kolkata\n\n**Free Resources:**\n• Google Data Analytics (Coursera)\n• Python for Data Science (edX)\n• Kaggle Learn\n\nCheck our Career Insights for latest trends!",
     
-    # Expanded responses database
-    responses = {
-        # Greetings
-        'hello': "Hello! 👋 I'm your AI Career Mentor from SmartCareer. I'm here to guide you through your career journey!\n\nI can help with:\n✅ Career exploration & planning\n✅ College & course recommendations\n✅ Skill development roadmaps\n✅ Interview preparation\n✅ Salary insights\n\nWhat would you like to explore today?",
-        'hi': "Hi there! 😊 Welcome to SmartCareer!\n\nHow can I assist you with your career today?",
-        'hey': "Hey! 🙌 I'm here to help you succeed in your career!\n\nWhat's on your mind?",
-        
-        # AI/ML related
-        'artificial intelligence': "Artificial Intelligence is revolutionizing the world! 🤖\n\n**Career Paths:**\n• AI Research Scientist (₹20-40 LPA)\n• ML Engineer (₹15-30 LPA)\n• AI Product Manager (₹25-50 LPA)\n\n**Essential Skills:**\n• Python, TensorFlow, PyTorch\n• Deep Learning & Neural Networks\n• Mathematics (Linear Algebra, Calculus)\n• NLP & Computer Vision\n\n**Top Colleges:**\n• IIT Madras, Delhi, Bombay\n• IIIT Hyderabad\n• ISI Kolkata\n\n**Learning Resources:**\n• Andrew Ng's ML Course (Coursera)\n• Fast.ai\n• DeepLearning.AI\n\nVisit our AI/ML/Data Science section for detailed roadmap!",
-        'machine learning': "Machine Learning is the future! 🧠\n\n**What You Need:**\n• Python (scikit-learn, pandas, NumPy)\n• Statistics & Probability\n• Algorithms & Data Structures\n• Math (Linear Algebra)\n\n**Career Options:**\n1. ML Engineer - ₹15-28 LPA\n2. Data Scientist - ₹12-25 LPA\n3. Research Scientist - ₹18-35 LPA\n\n**Learning Path:**\n1. Python basics (2 months)\n2. Math foundations (2 months)\n3. ML algorithms (3 months)\n4. Projects & Kaggle (ongoing)\n\n**Top Companies Hiring:**\nGoogle, Microsoft, Amazon, Netflix, Uber\n\nWant a detailed roadmap?",
-        'data science': "Data Science is booming! 📊\n\n**Core Skills:**\n• Python (pandas, NumPy, matplotlib)\n• Statistics & Hypothesis Testing\n• SQL & Database Management\n• Machine Learning\n• Data Visualization (Tableau, Power BI)\n\n**Career Path:**\n• Junior Data Analyst: ₹4-8 LPA\n• Data Scientist: ₹12-20 LPA\n• Senior DS: ₹25-40 LPA\n• Lead/Principal: ₹50+ LPA\n\n**Best Colleges:**\n• IIT Madras, Bombay, Delhi\n• IIIT Hyderabad (₹32 LPA avg!)\n• ISI Kolkata\n\n**Free Resources:**\n• Google Data Analytics (Coursera)\n• Python for Data Science (edX)\n• Kaggle Learn\n\nCheck our Career Insights for latest trends!",
-        
-        # Engineering & Computer Science
-        'software': "Software Development - Great choice! 💻\n\n**Career Options:**\n• Full Stack Developer (₹6-15 LPA)\n• Backend Engineer (₹8-20 LPA)\n• Frontend Developer (₹5-12 LPA)\n• DevOps Engineer (₹10-22 LPA)\n\n**Tech Stacks to Learn:**\n**Frontend:** HTML, CSS, JavaScript, React/Angular/Vue\n**Backend:** Node.js, Python (Django/Flask), Java (Spring)\n**Database:** SQL, MongoDB, PostgreSQL\n**Tools:** Git, Docker, AWS/Azure\n\n**Learning Path:**\n1. Choose a language (Python/JavaScript)\n2. Learn basics (3 months)\n3. Build projects (Portfolio)\n4. Learn frameworks (2 months)\n5. Deploy projects (Git, Cloud)\n\n**Top Colleges:**\n• IITs, NITs, IIIT Hyderabad\n• BITS Pilani, DTU, VIT\n\nStart with freeCodeCamp or The Odin Project!",
-        'web development': "Web Development - Build the internet! 🌐\n\n**Path 1: Frontend Developer**\n• HTML, CSS, JavaScript\n• React.js or Vue.js\n• Tailwind CSS, Bootstrap\n• Responsive Design\nSalary: ₹5-12 LPA\n\n**Path 2: Backend Developer**\n• Node.js or Python (Django)\n• REST APIs, GraphQL\n• Databases (SQL, MongoDB)\n• Authentication & Security\nSalary: ₹8-18 LPA\n\n**Path 3: Full Stack**\n• All of the above!\n• MERN/MEAN Stack\nSalary: ₹10-25 LPA\n\n**Free Resources:**\n• freeCodeCamp (Best for beginners)\n• The Odin Project\n• MDN Web Docs\n• JavaScript30 Challenge\n\nBuild 5-10 projects for your portfolio!",
-        'computer science': "Computer Science - The foundation! 🖥️\n\n**Core Subjects:**\n• Data Structures & Algorithms\n• Operating Systems\n• Database Management\n• Computer Networks\n• Software Engineering\n• Object-Oriented Programming\n\n**Top Colleges in India:**\n1. IIT Madras (NIRF #1)\n2. IIT Delhi (NIRF #2)\n3. IIT Bombay (NIRF #3)\n4. IIIT Hyderabad (₹32 LPA avg)\n5. BITS Pilani\n6. NIT Trichy, NITK\n\n**Entrance Exams:**\n• JEE Advanced (IITs)\n• JEE Main (NITs, IIITs)\n• BITSAT (BITS)\n• VITEEE (VIT)\n\n**Career Options:**\n• Software Engineer: ₹8-25 LPA\n• Data Scientist: ₹12-30 LPA\n• ML Engineer: ₹15-35 LPA\n• Product Manager: ₹20-50 LPA\n\nCheck our College Finder for detailed info!",
-        
-        # Career guidance
-        'career': "Let me help you find the right career! 🎯\n\n**Top Fields in 2025:**\n\n🔵 **Technology** (High Growth)\n• Software Development\n• AI/ML Engineering\n• Data Science\n• Cloud Architecture\n• Cybersecurity\n\n🟢 **Healthcare** (Stable)\n• Doctor (MBBS/MD)\n• Nursing\n• Pharmacy\n• Medical Research\n\n🟣 **Business** (Versatile)\n• Management (MBA)\n• Marketing\n• Finance & Consulting\n• Entrepreneurship\n\n🔴 **Creative** (Growing)\n• UI/UX Design\n• Content Creation\n• Digital Marketing\n• Video Production\n\n💡 **Take our Career Quiz** for personalized recommendations!\n\nWhich field interests you most?",
-        'best career': "Best careers in 2025! 🚀\n\n**Highest Growth:**\n1. AI/ML Engineer (+45% growth, ₹18-35 LPA)\n2. Cloud Architect (+38% growth, ₹15-30 LPA)\n3. Data Scientist (+35% growth, ₹12-25 LPA)\n4. Cybersecurity Expert (+40% growth, ₹16-32 LPA)\n5. Blockchain Developer (+55% growth, ₹20-40 LPA)\n\n**Most In-Demand:**\n• Full Stack Developer (120K+ jobs)\n• Data Analyst (95K+ jobs)\n• DevOps Engineer (85K+ jobs)\n\n**Best for Freshers:**\n• Software Development\n• Data Analytics\n• Digital Marketing\n• UI/UX Design\n\n**Factors to Consider:**\n✅ Your interests & strengths\n✅ Job market demand\n✅ Salary expectations\n✅ Work-life balance\n✅ Growth opportunities\n\nTake our quiz to find YOUR best fit!",
-        
-        # College related
-        'college': "College selection guide! 🎓\n\n**Top Engineering Colleges:**\n• IIT Madras (NIRF #1, ₹21.48 LPA)\n• IIT Bombay (NIRF #3, ₹19.27 LPA)\n• IIIT Hyderabad (₹32 LPA avg!)\n• BITS Pilani (₹18 LPA)\n\n**Top Medical Colleges:**\n• AIIMS Delhi (NIRF #1)\n• CMC Vellore (NIRF #3)\n• JIPMER (Free education!)\n\n**Top Management:**\n• IIM Ahmedabad (₹32.79 LPA)\n• IIM Bangalore (₹28.98 LPA)\n• ISB Hyderabad\n\n**Top Law:**\n• NLSIU Bangalore (NIRF #1)\n• NLU Delhi (NIRF #2)\n\n**Selection Factors:**\n1. NIRF Ranking\n2. Placement Record\n3. Fee Structure\n4. Location\n5. Infrastructure\n\n👉 Use our College Finder to explore 100+ colleges!\n\nWhich field are you interested in?",
-        'iit': "IIT - India's Premier Engineering Institutes! 🏆\n\n**Top 5 IITs:**\n1. **IIT Madras** (NIRF #1)\n   • Avg: ₹21.48 LPA\n   • Highest: ₹1.3 Cr\n   • Best for: CS, AI/ML, EE\n\n2. **IIT Delhi** (NIRF #2)\n   • Avg: ₹18.22 LPA\n   • QS Rank: 197\n   • Best for: CS, Civil, EE\n\n3. **IIT Bombay** (NIRF #3)\n   • Avg: ₹19.27 LPA\n   • Highest: ₹1.68 Cr\n   • Best for: CS, Aerospace\n\n4. **IIT Kanpur** (NIRF #4)\n5. **IIT Kharagpur** (NIRF #5)\n\n**Entrance:** JEE Advanced\n**Eligibility:** Top 2.5 lakh in JEE Main\n**Seats per IIT:** 800-1600\n**Fees:** ₹2-2.5 Lakh/year\n\n**All 23 IITs:**\nMadras, Delhi, Bombay, Kanpur, Kharagpur, Roorkee, Guwahati, Hyderabad, Indore, BHU, Ropar, + 12 newer IITs\n\nCheck College Finder for complete details!",
-        'aiims': "AIIMS - Premier Medical Institutes! 🏥\n\n**AIIMS Delhi** (NIRF #1)\n• Est. 1956\n• MBBS Seats: 125\n• Fees: ₹1,400/year (Almost FREE!)\n• Acceptance: 0.01% (Hardest to get!)\n• Best medical education in India\n\n**Other Top AIIMS:**\n• AIIMS Jodhpur (NIRF #8)\n• AIIMS Bhopal (NIRF #9)\n• AIIMS Bhubaneswar\n• AIIMS Rishikesh\n• AIIMS Patna\n\n**Total AIIMS:** 22 across India\n\n**Entrance:** NEET UG\n**What You Need:**\n• NEET Score: 680+ (General)\n• Physics, Chemistry, Biology\n• Strong determination!\n\n**Career After AIIMS:**\n• Doctor (Govt/Private)\n• Medical Research\n• Teaching\n• Super-specialization\n\n**Alternatives:**\n• CMC Vellore (NIRF #3)\n• JIPMER (Free education)\n• Top State Medical Colleges\n\nVisit our College Finder for all medical colleges!",
-        'scholarship': "Scholarship Guide! 💰\n\n**For Indian Students:**\n\n📚 **Merit-Based:**\n• PM Scholarship Scheme (₹3,000/month)\n• INSPIRE Scholarship (₹80,000/year)\n• KVPY Fellowship (₹7,000/month)\n• JN Tata Scholarship (Abroad)\n\n💼 **For Engineering:**\n• Google India Scholarship\n• Microsoft Scholarship\n• Adobe Women in Tech\n• Oracle Academy\n\n🏥 **For Medical:**\n• AIIMS Free Education\n• JIPMER Free Education\n• State Govt Scholarships\n\n📖 **For MBA:**\n• Aditya Birla Scholarship\n• IIM Need-based Aid\n• Bank Education Loans\n\n🌍 **Study Abroad:**\n• Fulbright Scholarship (USA)\n• Chevening (UK)\n• DAAD (Germany)\n• Commonwealth Scholarship\n\n**How to Apply:**\n1. Check eligibility\n2. Prepare documents\n3. Write strong essays\n4. Apply before deadline\n5. Follow up\n\nVisit our Scholarships page for complete list!",
-        
-        # Skills & Learning
-        'python': "Python - Most Versatile Language! 🐍\n\n**Why Learn Python?**\n• Easiest to learn\n• High demand (50K+ jobs)\n• Versatile (Web, AI, Data Science)\n• Great salary (₹8-20 LPA)\n\n**Learning Path:**\n1. **Basics** (1 month)\n   • Variables, Data Types\n   • Loops, Conditions\n   • Functions\n\n2. **Intermediate** (2 months)\n   • OOP concepts\n   • File handling\n   • Libraries (NumPy, Pandas)\n\n3. **Advanced** (3 months)\n   • Web Dev (Django/Flask)\n   • Data Science\n   • Machine Learning\n\n**Free Resources:**\n• Python.org Tutorial\n• Automate the Boring Stuff\n• CS50's Python\n• freeCodeCamp Python\n\n**Projects to Build:**\n• Calculator\n• To-Do App\n• Web Scraper\n• Data Analysis Dashboard\n• ML Model\n\n**Career Options:**\n• Python Developer: ₹8-15 LPA\n• Data Scientist: ₹12-25 LPA\n• ML Engineer: ₹15-30 LPA\n\nStart today!",
-        
-        # Interview & Job Prep
-        'interview': "Interview Preparation Guide! 💼\n\n**Technical Interview:**\n1. **Data Structures & Algorithms**\n   • Arrays, Linked Lists, Trees\n   • Sorting & Searching\n   • Dynamic Programming\n   • Practice: LeetCode, HackerRank\n\n2. **System Design** (for experienced)\n   • Scalability\n   • Database design\n   • API design\n\n3. **Coding Round**\n   • 2-3 coding problems\n   • Time: 60-90 minutes\n   • Focus: Logic + Clean code\n\n**HR Interview:**\n• Tell me about yourself\n• Why this company?\n• Strengths & weaknesses\n• Career goals\n• Salary expectations\n\n**Behavioral Questions:**\n• STAR method (Situation, Task, Action, Result)\n• Past experiences\n• Team conflicts\n• Leadership examples\n\n**Preparation Timeline:**\n• 3 months: Intensive prep\n• Daily: 2-3 hours practice\n• Week before: Mock interviews\n\n**Resources:**\n• Cracking the Coding Interview (book)\n• InterviewBit\n• Pramp (mock interviews)\n\n**Pro Tips:**\n✅ Research company\n✅ Prepare questions to ask\n✅ Dress professionally\n✅ Arrive 10 minutes early\n✅ Follow up with thank you email\n\nGood luck! 🍀",
-        'resume': "Resume Building Guide! 📄\n\n**Perfect Resume Structure:**\n\n1. **Header**\n   • Name (Large, Bold)\n   • Phone, Email, LinkedIn, GitHub\n   • Location (City, State)\n\n2. **Professional Summary** (3-4 lines)\n   • Your expertise\n   • Years of experience\n   • Key achievements\n\n3. **Skills**\n   • Technical: Python, Java, React, SQL\n   • Tools: Git, Docker, AWS\n   • Soft: Leadership, Communication\n\n4. **Experience** (Reverse chronological)\n   • Job Title | Company | Duration\n   • 3-5 bullet points\n   • Start with action verbs\n   • Quantify achievements\n\n5. **Projects** (3-5 best)\n   • Project name + Tech stack\n   • Brief description\n   • Impact/Results\n   • GitHub link\n\n6. **Education**\n   • Degree | College | Year | GPA\n   • Relevant coursework\n   • Certifications\n\n7. **Additional** (Optional)\n   • Achievements\n   • Publications\n   • Volunteer work\n\n**Pro Tips:**\n✅ Keep it 1-2 pages\n✅ Use ATS-friendly format\n✅ Quantify everything (increased by 30%)\n✅ Use action verbs (Developed, Implemented)\n✅ Tailor for each job\n✅ No typos or grammar errors!\n✅ Include keywords from job description\n\n**Action Verbs:**\nDeveloped, Implemented, Designed, Led, Optimized, Achieved, Increased, Created\n\n**Use our Resume Builder** for professional templates!\n\nWant me to review your resume?",
-        
-        # Salary related
-        'salary': "Salary Insights 2025! 💵\n\n**Tech Salaries (India):**\n\n**Freshers (0-2 years):**\n• Software Developer: ₹4-8 LPA\n• Data Analyst: ₹3-6 LPA\n• Web Developer: ₹3-7 LPA\n\n**Mid-Level (3-5 years):**\n• Software Engineer: ₹12-20 LPA\n• Data Scientist: ₹15-25 LPA\n• ML Engineer: ₹18-30 LPA\n• DevOps Engineer: ₹12-22 LPA\n\n**Senior (5-10 years):**\n• Senior Engineer: ₹25-40 LPA\n• Tech Lead: ₹30-50 LPA\n• Architect: ₹35-60 LPA\n\n**Expert (10+ years):**\n• Principal Engineer: ₹50-80 LPA\n• Director: ₹80 LPA - 1 Cr+\n\n**Highest Paying Companies:**\n🏆 Google: ₹30-80 LPA\n🏆 Microsoft: ₹25-70 LPA\n🏆 Amazon: ₹20-60 LPA\n🏆 Netflix: ₹50-1 Cr\n🏆 Uber: ₹25-55 LPA\n\n**Salary Factors:**\n• Location (Bangalore > Tier 2)\n• Company (Product > Service)\n• Skills (AI/ML premium)\n• Negotiation\n• Education (IIT premium)\n\n**Top Paying Skills:**\n1. AI/ML: +40% premium\n2. Cloud (AWS/Azure): +30%\n3. Blockchain: +50%\n4. DevOps: +25%\n5. Cybersecurity: +35%\n\nCheck Career Insights for detailed data!",
-        
-        # General help
-        'help': "I'm here to help! 🌟\n\n**What I Can Do:**\n\n🎯 **Career Guidance**\n• Explore career options\n• Career path recommendations\n• Industry trends & insights\n\n🎓 **Education**\n• Top colleges (100+ listed!)\n• Course recommendations\n• Entrance exam tips\n\n💡 **Skill Development**\n• Learning roadmaps\n• Free resources\n• Skill requirements by role\n\n💼 **Job Preparation**\n• Interview tips\n• Resume building\n• Salary negotiation\n\n💰 **Financial**\n• Scholarship opportunities\n• Education loans\n• ROI analysis\n\n**Popular Questions:**\n• \"Tell me about AI careers\"\n• \"Best colleges for computer science\"\n• \"How to prepare for interviews?\"\n• \"What skills for data science?\"\n• \"IIT vs NIT comparison\"\n\n**Try Our Tools:**\n• Career Quiz (personalized recommendations)\n• College Finder (100+ colleges)\n• Skills Section (trending skills)\n• Resume Builder\n\nWhat would you like to explore?",
-        'thank': "You're welcome! 😊\n\nFeel free to ask me anything else about your career!\n\nHere to help you succeed! 🚀",
-    }
+    # Engineering & Computer Science
+    'software': "Software Development - Great choice! 💻\n\n**Career Options:**\n• Full Stack Developer (₹6-15 LPA)\n• Backend Engineer (₹8-20 LPA)\n• Frontend Developer (₹5-12 LPA)\n• DevOps Engineer (₹10-22 LPA)\n\n**Tech Stacks to Learn:**\n**Frontend:** HTML, CSS, JavaScript, React/Angular/Vue\n**Backend:** Node.js, Python (Django/Flask), Java (Spring)\n**Database:** SQL, MongoDB, PostgreSQL\n**Tools:** Git, Docker, AWS/Azure\n\n**Learning Path:**\n1. Choose a language (Python/JavaScript)\n2. Learn basics (3 months)\n3. Build projects (Portfolio)\n4. Learn frameworks (2 months)\n5. Deploy projects (Git, Cloud)\n\n**Top Colleges:**\n• IITs, NITs, IIIT Hyderabad\n• BITS Pilani, DTU, VIT\n\nStart with freeCodeCamp or The Odin Project!",
+    'web development': "Web Development - Build the internet! 🌐\n\n**Path 1: Frontend Developer**\n• HTML, CSS, JavaScript\n• React.js or Vue.js\n• Tailwind CSS, Bootstrap\n• Responsive Design\nSalary: ₹5-12 LPA\n\n**Path 2: Backend Developer**\n• Node.js or Python (Django)\n• REST APIs, GraphQL\n• Databases (SQL, MongoDB)\n• Authentication & Security\nSalary: ₹8-18 LPA\n\n**Path 3: Full Stack**\n• All of the above!\n• MERN/MEAN Stack\nSalary: ₹10-25 LPA\n\n**Free Resources:**\n• freeCodeCamp (Best for beginners)\n• The Odin Project\n• MDN Web Docs\n• JavaScript30 Challenge\n\nBuild 5-10 projects for your portfolio!",
+    'computer science': "Computer Science - The foundation! 🖥️\n\n**Core Subjects:**\n• Data Structures & Algorithms\n• Operating Systems\n• Database Management\n• Computer Networks\n• Software Engineering\n• Object-Oriented Programming\n\n**Top Colleges in India:**\n1. IIT Madras (NIRF #1)\n2. IIT Delhi (NIRF #2)\n3. IIT Bombay (NIRF #3)\n4. IIIT Hyderabad (₹32 LPA avg)\n5. BITS Pilani\n6. NIT Trichy, NITK\n\n**Entrance Exams:**\n• JEE Advanced (IITs)\n• JEE Main (NITs, IIITs)\n• BITSAT (BITS)\n• VITEEE (VIT)\n\n**Career Options:**\n• Software Engineer: ₹8-25 LPA\n• Data Scientist: ₹12-30 LPA\n• ML Engineer: ₹15-35 LPA\n• Product Manager: ₹20-50 LPA\n\nCheck our College Finder for detailed info!",
+    
+    # Career guidance
+    'career': "Let me help you find the right career! 🎯\n\n**Top Fields in 2025:**\n\n🔵 **Technology** (High Growth)\n• Software Development\n• AI/ML Engineering\n• Data Science\n• Cloud Architecture\n• Cybersecurity\n\n🟢 **Healthcare** (Stable)\n• Doctor (MBBS/MD)\n• Nursing\n• Pharmacy\n• Medical Research\n\n🟣 **Business** (Versatile)\n• Management (MBA)\n• Marketing\n• Finance & Consulting\n• Entrepreneurship\n\n🔴 **Creative** (Growing)\n• UI/UX Design\n• Content Creation\n• Digital Marketing\n• Video Production\n\n💡 **Take our Career Quiz** for personalized recommendations!\n\nWhich field interests you most?",
+    'best career': "Best careers in 2025! 🚀\n\n**Highest Growth:**\n1. AI/ML Engineer (+45% growth, ₹18-35 LPA)\n2. Cloud Architect (+38% growth, ₹15-30 LPA)\n3. Data Scientist (+35% growth, ₹12-25 LPA)\n4. Cybersecurity Expert (+40% growth, ₹16-32 LPA)\n5. Blockchain Developer (+55% growth, ₹20-40 LPA)\n\n**Most In-Demand:**\n• Full Stack Developer (120K+ jobs)\n• Data Analyst (95K+ jobs)\n• DevOps Engineer (85K+ jobs)\n\n**Best for Freshers:**\n• Software Development\n• Data Analytics\n• Digital Marketing\n• UI/UX Design\n\n**Factors to Consider:**\n✅ Your interests & strengths\n✅ Job market demand\n✅ Salary expectations\n✅ Work-life balance\n✅ Growth opportunities\n\nTake our quiz to find YOUR best fit!",
     
-    # Enhanced keyword matching with multiple checks
-    for keyword, response in responses.items():
-        if keyword in message_lower:
-            return response
+    # College related
+    'college': "College selection guide! 🎓\n\n**Top Engineering Colleges:**\n• IIT Madras (NIRF #1, ₹21.48 LPA)\n• IIT Bombay (NIRF #3, ₹19.27 LPA)\n• IIIT Hyderabad (₹32 LPA avg!)\n• BITS Pilani (₹18 LPA)\n\n**Top Medical Colleges:**\n• AIIMS Delhi (NIRF #1)\n• CMC Vellore (NIRF #3)\n• JIPMER (Free education!)\n\n**Top Management:**\n• IIM Ahmedabad (₹32.79 LPA)\n• IIM Bangalore (₹28.98 LPA)\n• ISB Hyderabad\n\n**Top Law:**\n• NLSIU Bangalore (NIRF #1)\n• NLU Delhi (NIRF #2)\n\n**Selection Factors:**\n1. NIRF Ranking\n2. Placement Record\n3. Fee Structure\n4. Location\n5. Infrastructure\n\n👉 Use our College Finder to explore 100+ colleges!\n\nWhich field are you interested in?",
+    'iit': "IIT - India's Premier Engineering Institutes! 🏆\n\n**Top 5 IITs:**\n1. **IIT Madras** (NIRF #1)\n   • Avg: ₹21.48 LPA\n   • Highest: ₹1.3 Cr\n   • Best for: CS, AI/ML, EE\n\n2. **IIT Delhi** (NIRF #2)\n   • Avg: ₹18.22 LPA\n   • QS Rank: 197\n   • Best for: CS, Civil, EE\n\n3. **IIT Bombay** (NIRF #3)\n   • Avg: ₹19.27 LPA\n   • Highest: ₹1.68 Cr\n   • Best for: CS, Aerospace\n\n4. **IIT Kanpur** (NIRF #4)\n5. **IIT Kharagpur** (NIRF #5)\n\n**Entrance:** JEE Advanced\n**Eligibility:** Top 2.5 lakh in JEE Main\n**Seats per IIT:** 800-1600\n**Fees:** ₹2-2.5 Lakh/year\n\n**All 23 IITs:**\nMadras, Delhi, Bombay, Kanpur, Kharagpur, Roorkee, Guwahati, Hyderabad, Indore, BHU, Ropar, + 12 newer IITs\n\nCheck College Finder for complete details!",
+    'aiims': "AIIMS - Premier Medical Institutes! 🏥\n\n**AIIMS Delhi** (NIRF #1)\n• Est. 1956\n• MBBS Seats: 125\n• Fees: ₹1,400/year (Almost FREE!)\n• Acceptance: 0.01% (Hardest to get!)\n• Best medical education in India\n\n**Other Top AIIMS:**\n• AIIMS Jodhpur (NIRF #8)\n• AIIMS Bhopal (NIRF #9)\n• AIIMS Bhubaneswar\n• AIIMS Rishikesh\n• AIIMS Patna\n\n**Total AIIMS:** 22 across India\n\n**Entrance:** NEET UG\n**What You Need:**\n• NEET Score: 680+ (General)\n• Physics, Chemistry, Biology\n• Strong determination!\n\n**Career After AIIMS:**\n• Doctor (Govt/Private)\n• Medical Research\n• Teaching\n• Super-specialization\n\n**Alternatives:**\n• CMC Vellore (NIRF #3)\n• JIPMER (Free education)\n• Top State Medical Colleges\n\nVisit our College Finder for all medical colleges!",
+    'scholarship': "Scholarship Guide! 💰\n\n**For Indian Students:**\n\n📚 **Merit-Based:**\n• PM Scholarship Scheme (₹3,000/month)\n• INSPIRE Scholarship (₹80,000/year)\n• KVPY Fellowship (₹7,000/month)\n• JN Tata Scholarship (Abroad)\n\n💼 **For Engineering:**\n• Google India Scholarship\n• Microsoft Scholarship\n• Adobe Women in Tech\n• Oracle Academy\n\n🏥 **For Medical:**\n• AIIMS Free Education\n• JIPMER Free Education\n• State Govt Scholarships\n\n📖 **For MBA:**\n• Aditya Birla Scholarship\n• IIM Need-based Aid\n• Bank Education Loans\n\n🌍 **Study Abroad:**\n• Fulbright Scholarship (USA)\n• Chevening (UK)\n• DAAD (Germany)\n• Commonwealth Scholarship\n\n**How to Apply:**\n1. Check eligibility\n2. Prepare documents\n3. Write strong essays\n4. Apply before deadline\n5. Follow up\n\nVisit our Scholarships page for complete list!",
     
-    # Check for common question patterns
-    if any(word in message_lower for word in ['iit', 'engineering college', 'best college for engineering']):
-        return responses['iit']
+    # Skills & Learning
+    'python': "Python - Most Versatile Language! 🐍\n\n**Why Learn Python?**\n• Easiest to learn\n• High demand (50K+ jobs)\n• Versatile (Web, AI, Data Science)\n• Great salary (₹8-20 LPA)\n\n**Learning Path:**\n1. **Basics** (1 month)\n   • Variables, Data Types\n   • Loops, Conditions\n   • Functions\n\n2. **Intermediate** (2 months)\n   • OOP concepts\n   • File handling\n   • Libraries (NumPy, Pandas)\n\n3. **Advanced** (3 months)\n   • Web Dev (Django/Flask)\n   • Data Science\n   • Machine Learning\n\n**Free Resources:**\n• Python.org Tutorial\n• Automate the Boring Stuff\n• CS50's Python\n• freeCodeCamp Python\n\n**Projects to Build:**\n• Calculator\n• To-Do App\n• Web Scraper\n• Data Analysis Dashboard\n• ML Model\n\n**Career Options:**\n• Python Developer: ₹8-15 LPA\n• Data Scientist: ₹12-25 LPA\n• ML Engineer: ₹15-30 LPA\n\nStart today!",
     
-    if any(word in message_lower for word in ['medical college', 'mbbs', 'doctor', 'aiims']):
-        return responses['aiims']
+    # Interview & Job Prep
+    'interview': "Interview Preparation Guide! 💼\n\n**Technical Interview:**\n1. **Data Structures & Algorithms**\n   • Arrays, Linked Lists, Trees\n   • Sorting & Searching\n   • Dynamic Programming\n   • Practice: LeetCode, HackerRank\n\n2. **System Design** (for experienced)\n   • Scalability\n   • Database design\n   • API design\n\n3. **Coding Round**\n   • 2-3 coding problems\n   • Time: 60-90 minutes\n   • Focus: Logic + Clean code\n\n**HR Interview:**\n• Tell me about yourself\n• Why this company?\n• Strengths & weaknesses\n• Career goals\n• Salary expectations\n\n**Behavioral Questions:**\n• STAR method (Situation, Task, Action, Result)\n• Past experiences\n• Team conflicts\n• Leadership examples\n\n**Preparation Timeline:**\n• 3 months: Intensive prep\n• Daily: 2-3 hours practice\n• Week before: Mock interviews\n\n**Resources:**\n• Cracking the Coding Interview (book)\n• InterviewBit\n• Pramp (mock interviews)\n\n**Pro Tips:**\n✅ Research company\n✅ Prepare questions to ask\n✅ Dress professionally\n✅ Arrive 10 minutes early\n✅ Follow up with thank you email\n\nGood luck! 🍀",
+    'resume': "Resume Building Guide! 📄\n\n**Perfect Resume Structure:**\n\n1. **Header**\n   • Name (Large, Bold)\n   • Phone, Email, LinkedIn, GitHub\n   • Location (City, State)\n\n2. **Professional Summary** (3-4 lines)\n   • Your expertise\n   • Years of experience\n   • Key achievements\n\n3. **Skills**\n   • Technical: Python, Java, React, SQL\n   • Tools: Git, Docker, AWS\n   • Soft: Leadership, Communication\n\n4. **Experience** (Reverse chronological)\n   • Job Title | Company | Duration\n   • 3-5 bullet points\n   • Start with action verbs\n   • Quantify achievements\n\n5. **Projects** (3-5 best)\n   • Project name + Tech stack\n   • Brief description\n   • Impact/Results\n   • GitHub link\n\n6. **Education**\n   • Degree | College | Year | GPA\n   • Relevant coursework\n   • Certifications\n\n7. **Additional** (Optional)\n   • Achievements\n   • Publications\n   • Volunteer work\n\n**Pro Tips:**\n✅ Keep it 1-2 pages\n✅ Use ATS-friendly format\n✅ Quantify everything (increased by 30%)\n✅ Use action verbs (Developed, Implemented)\n✅ Tailor for each job\n✅ No typos or grammar errors!\n✅ Include keywords from job description\n\n**Action Verbs:**\nDeveloped, Implemented, Designed, Led, Optimized, Achieved, Increased, Created\n\n**Use our Resume Builder** for professional templates!\n\nWant me to review your resume?",
     
-    if any(word in message_lower for word in ['ml', 'machine learning', 'ai']):
-        return responses['machine learning']
+    # Salary related
+    'salary': "Salary Insights 2025! 💵\n\n**Tech Salaries (India):**\n\n**Freshers (0-2 years):**\n• Software Developer: ₹4-8 LPA\n• Data Analyst: ₹3-6 LPA\n• Web Developer: ₹3-7 LPA\n\n**Mid-Level (3-5 years):**\n• Software Engineer: ₹12-20 LPA\n• Data Scientist: ₹15-25 LPA\n• ML Engineer: ₹18-30 LPA\n• DevOps Engineer: ₹12-22 LPA\n\n**Senior (5-10 years):**\n• Senior Engineer: ₹25-40 LPA\n• Tech Lead: ₹30-50 LPA\n• Architect: ₹35-60 LPA\n\n**Expert (10+ years):**\n• Principal Engineer: ₹50-80 LPA\n• Director: ₹80 LPA - 1 Cr+\n\n**Highest Paying Companies:**\n🏆 Google: ₹30-80 LPA\n🏆 Microsoft: ₹25-70 LPA\n🏆 Amazon: ₹20-60 LPA\n🏆 Netflix: ₹50-1 Cr\n🏆 Uber: ₹25-55 LPA\n\n**Salary Factors:**\n• Location (Bangalore > Tier 2)\n• Company (Product > Service)\n• Skills (AI/ML premium)\n• Negotiation\n• Education (IIT premium)\n\n**Top Paying Skills:**\n1. AI/ML: +40% premium\n2. Cloud (AWS/Azure): +30%\n3. Blockchain: +50%\n4. DevOps: +25%\n5. Cybersecurity: +35%\n\nCheck Career Insights for detailed data!",
     
-    if any(word in message_lower for word in ['web dev', 'website', 'frontend', 'backend']):
-        return responses['web development']
+    # General help
+    'help': "I'm here to help! 🌟\n\n**What I Can Do:**\n\n🎯 **Career Guidance**\n• Explore career options\n• Career path recommendations\n• Industry trends & insights\n\n🎓 **Education**\n• Top colleges (100+ listed!)\n• Course recommendations\n• Entrance exam tips\n\n💡 **Skill Development**\n• Learning roadmaps\n• Free resources\n• Skill requirements by role\n\n💼 **Job Preparation**\n• Interview tips\n• Resume building\n• Salary negotiation\n\n💰 **Financial**\n• Scholarship opportunities\n• Education loans\n• ROI analysis\n\n**Popular Questions:**\n• \"Tell me about AI careers\"\n• \"Best colleges for computer science\"\n• \"How to prepare for interviews?\"\n• \"What skills for data science?\"\n• \"IIT vs NIT comparison\"\n\n**Try Our Tools:**\n• Career Quiz (personalized recommendations)\n• College Finder (100+ colleges)\n• Skills Section (trending skills)\n• Resume Builder\n\nWhat would you like to explore?",
+    'thank': "You're welcome! 😊\n\nFeel free to ask me anything else about your career!\n\nHere to help you succeed! 🚀",
+}
+
+# Keyword groups tried after the keywords above, in order, with the answer each maps to
+RULE_BASED_KEYWORD_GROUPS = [
+    (['iit', 'engineering college', 'best college for engineering'], 'iit'),
+    (['medical college', 'mbbs', 'doctor', 'aiims'], 'aiims'),
+    (['ml', 'machine learning', 'ai'], 'machine learning'),
+    (['web dev', 'website', 'frontend', 'backend'], 'web development'),
+    (['job', 'placement', 'interview'], 'interview'),
+    (['money', 'pay', 'package', 'ctc'], 'salary')
+]
+
+# One automaton over every keyword, built once; the earliest keyword in the lists above wins
+rule_based_matcher = KeywordMatcher(
+    list(RULE_BASED_RESPONSES.items()) +
+    [(word, RULE_BASED_RESPONSES[key]) for words, key in RULE_BASED_KEYWORD_GROUPS for word in words]
+)
+
+def get_rule_based_response(message):
+    """Enhanced rule-based chatbot responses with comprehensive career guidance"""
+    if not message:
+        return "Hello! How can I help you with your career today? 😊"
     
-    if any(word in message_lower for word in ['job', 'placement', 'interview']):
-        return responses['interview']
+    message_lower = message.lower().strip()
     
-    if any(word in message_lower for word in ['money', 'pay', 'package', 'ctc']):
-        return responses['salary']
+    # Single pass over the message finds every keyword hit at once
+    response = rule_based_matcher.first(message_lower)
+    if response:
+        return response
     
     # Intelligent default response with suggestions
     if '?' in message:
@@ -780,11 +1164,11 @@ def dashboard():
         'email': session.get('user_email', '')
     }
     
-    # Get quiz result from session
-    quiz_result = session.get('quiz_results', None)
+    # Get quiz result from session, else the user's latest saved one
+    quiz_result = session.get('quiz_results') or storage.latest_quiz_result(session['user_email'])
     
     # Get progress for this user
-    user_progress = [p for p in progress_storage if p.get('user_email') == session['user_email']]
+    user_progress = storage.progress_for(session['user_email'])
     
     return render_template('dashboard.html', user=user, quiz_result=quiz_result, progress=user_progress)
 
@@ -828,20 +1212,12 @@ def register():
             flash('All fields are required', 'error')
             return redirect(url_for('register'))
         
-        # Check if email already exists
-        if email in users_storage:
+        # Store user; the insert fails if the email already exists
+        hashed_password = generate_password_hash(password)
+        if not storage.create_user(name, email, hashed_password):
             flash('Email already exists', 'error')
             return redirect(url_for('register'))
         
-        # Store user in memory
-        hashed_password = generate_password_hash(password)
-        users_storage[email] = {
-            'name': name,
-            'email': email,
-            'password': hashed_password,
-            'created_at': datetime.now().isoformat()
-        }
-        
         flash('Registration successful! Please login.', 'success')
         return redirect(url_for('login'))
     
@@ -855,9 +1231,13 @@ def login():
         password = request.form.get('password')
         
         # Check if user exists
-        user = users_storage.get(email)
+        user = storage.get_user(email)
         
         if user and check_password_hash(user['password'], password):
+            # New session id on login, so an id planted before login is useless
+            rotate = getattr(session, 'rotate', None)
+            if rotate:
+                rotate()
             session['user_email'] = user['email']
             session['user_name'] = user['name']
             flash('Login successful!', 'success')
@@ -908,8 +1288,7 @@ def scholarships():
 @app.route('/career-insights')
 def career_insights():
     """Career insights and trends"""
-    insights = get_career_insights()
-    return render_template('career_insights.html', insights=insights)
+    return render_template('career_insights.html', insights=career_insights_data)
 
 @app.route('/ai_ml_datascience')
 @app.route('/ai-ml-datascience')
@@ -918,16 +1297,61 @@ def ai_ml_datascience():
     return render_template('ai_ml_datascience.html')
 
 # API Routes for Real-Time Data
-@app.route('/api/scholarships')
-def api_scholarships():
-    """API endpoint for scholarships"""
+PAGE_PARAMS = ('limit', 'cursor', 'fields', 'format')
+
+def wants_paged_response():
+    """True when the client asked for pagination, projection or streaming"""
+    return any(param in request.args for param in PAGE_PARAMS)
+
+def paged_response(groups, payload):
+    """Apply limit/cursor/fields to groups and return a JSON page or an NDJSON stream"""
     try:
-        scholarships = get_scholarships()
+        limit = parse_limit(request.args.get('limit'))
+        offsets = decode_cursor(request.args.get('cursor', ''))
+    except ValueError as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 400
+    fields = parse_fields(request.args.get('fields'))
+    
+    if request.args.get('format') == 'ndjson':
+        _, next_cursor = page_bounds(groups, limit, offsets)
+        headers = {'X-Next-Cursor': next_cursor} if next_cursor else {}
+        return Response(iter_ndjson(groups, limit, offsets, fields),
+                        mimetype='application/x-ndjson', headers=headers)
+    
+    payload['data'], payload['next_cursor'] = paginate(groups, limit, offsets, fields)
+    return jsonify(payload)
+
+QUIZ_HISTORY_PAGE_SIZE = 20
+
+@app.route('/api/quiz/history')
+def api_quiz_history():
+    """The logged-in user's quiz results, newest first, one page at a time"""
+    if 'user_email' not in session:
+        return jsonify({
+            'success': False,
+            'error': 'Login required'
+        }), 401
+    try:
+        limit = parse_limit(request.args.get('limit')) or QUIZ_HISTORY_PAGE_SIZE
+        before_id = decode_cursor(request.args.get('cursor', '')).get('before')
+    except ValueError as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 400
+    fields = parse_fields(request.args.get('fields'))
+    
+    try:
+        email = session['user_email']
+        results, next_before = storage.quiz_history(email, limit, before_id)
         return jsonify({
             'success': True,
-            'data': scholarships,
-            'count': len(scholarships),
-            'last_updated': scholarships_cache['last_updated']
+            'data': [project(result, fields) for result in results],
+            'total': storage.count_quiz_results(email),
+            'next_cursor': encode_cursor({'before': next_before}) if next_before else None
         })
     except Exception as e:
         return jsonify({
@@ -935,17 +1359,24 @@ def api_scholarships():
             'error': str(e)
         }), 500
 
+@app.route('/api/scholarships')
+def api_scholarships():
+    """API endpoint for scholarships"""
+    try:
+        get_scholarships()
+        return serve_prepared('scholarships', lambda: build_feed_payload('scholarships'))
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
 @app.route('/api/internships')
 def api_internships():
     """API endpoint for internships"""
     try:
-        internships = get_internships()
-        return jsonify({
-            'success': True,
-            'data': internships,
-            'count': len(internships),
-            'last_updated': internships_cache['last_updated']
-        })
+        get_internships()
+        return serve_prepared('internships', lambda: build_feed_payload('internships'))
     except Exception as e:
         return jsonify({
             'success': False,
@@ -956,13 +1387,8 @@ def api_internships():
 def api_jobs():
     """API endpoint for fresher jobs"""
     try:
-        jobs = get_jobs()
-        return jsonify({
-            'success': True,
-            'data': jobs,
-            'count': len(jobs),
-            'last_updated': jobs_cache['last_updated']
-        })
+        get_jobs()
+        return serve_prepared('jobs', lambda: build_feed_payload('jobs'))
     except Exception as e:
         return jsonify({
             'success': False,
@@ -973,35 +1399,30 @@ def api_jobs():
 def api_opportunities():
     """Combined API endpoint for all opportunities"""
     try:
-        scholarships = get_scholarships()
-        internships = get_internships()
-        jobs = get_jobs()
-        
-        return jsonify({
-            'success': True,
-            'data': {
-                'scholarships': scholarships,
-                'internships': internships,
-                'jobs': jobs
-            },
-            'counts': {
-                'scholarships': len(scholarships),
-                'internships': len(internships),
-                'jobs': len(jobs),
-                'total': len(scholarships) + len(internships) + len(jobs)
-            },
-            'last_updated': {
-                'scholarships': scholarships_cache['last_updated'],
-                'internships': internships_cache['last_updated'],
-                'jobs': jobs_cache['last_updated']
-            }
+        # Load all three caches concurrently; a cache that misses the deadline serves what it has
+        cache_fanout.run({
+            'scholarships': get_scholarships,
+            'internships': get_internships,
+            'jobs': get_jobs
         })
+        if wants_paged_response():
+            payload = build_opportunities_payload()
+            return paged_response(dict(payload['data']), payload)
+        return prepared_opportunities().to_response(request)
     except Exception as e:
         return jsonify({
             'success': False,
             'error': str(e)
         }), 500
 
+@app.route('/api/opportunities/status')
+def api_opportunities_status():
+    """Per-cache age and refresh timings (kept out of the cacheable bodies)"""
+    return jsonify({
+        'success': True,
+        'cache': get_cache_status()
+    })
+
 @app.route('/api/search')
 def api_search():
     """Search API for scholarships, internships, and jobs"""
@@ -1010,49 +1431,33 @@ def api_search():
         category = request.args.get('category', 'all')
         location = request.args.get('location', '').lower()
         
-        scholarships = get_scholarships()
-        internships = get_internships()
-        jobs = get_jobs()
+        # Make sure caches (and their indexes) are fresh
+        get_scholarships()
+        get_internships()
+        get_jobs()
         
-        # Filter based on search criteria
+        # Answer from posting-list intersections instead of scanning every item
         filtered_scholarships = []
         filtered_internships = []
         filtered_jobs = []
         
-        # Search scholarships
         if category in ['all', 'scholarships']:
-            for item in scholarships:
-                if (query in item.get('title', '').lower() or 
-                    query in item.get('provider', '').lower() or
-                    query in item.get('eligibility', '').lower()):
-                    if not location or location in item.get('state', '').lower():
-                        filtered_scholarships.append(item)
+            filtered_scholarships = scholarships_index.search(query, location)
         
-        # Search internships
         if category in ['all', 'internships']:
-            for item in internships:
-                if (query in item.get('title', '').lower() or 
-                    query in item.get('company', '').lower() or
-                    query in item.get('category', '').lower()):
-                    if not location or location in item.get('location', '').lower():
-                        filtered_internships.append(item)
+            filtered_internships = internships_index.search(query, location)
         
-        # Search jobs
         if category in ['all', 'jobs']:
-            for item in jobs:
-                if (query in item.get('title', '').lower() or 
-                    query in item.get('company', '').lower() or
-                    query in item.get('category', '').lower()):
-                    if not location or location in item.get('location', '').lower():
-                        filtered_jobs.append(item)
+            filtered_jobs = jobs_index.search(query, location)
         
-        return jsonify({
+        results = {
+            'scholarships': filtered_scholarships,
+            'internships': filtered_internships,
+            'jobs': filtered_jobs
+        }
+        payload = {
             'success': True,
-            'data': {
-                'scholarships': filtered_scholarships,
-                'internships': filtered_internships,
-                'jobs': filtered_jobs
-            },
+            'data': results,
             'counts': {
                 'scholarships': len(filtered_scholarships),
                 'internships': len(filtered_internships),
@@ -1064,7 +1469,168 @@ def api_search():
                 'category': category,
                 'location': location
             }
-        })
+        }
+        
+        if wants_paged_response():
+            return paged_response(results, payload)
+        return jsonify(payload)
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
+@app.route('/api/<name>/facets')
+def api_facets(name):
+    """Scholarships, internships or jobs filtered by facets, with live counts per facet value"""
+    if name not in opportunity_facets:
+        return jsonify({
+            'success': False,
+            'error': f"Unknown feed: {name}"
+        }), 404
+    try:
+        ensure_fresh(name)
+        facets = opportunity_facets[name]
+        selected = {
+            facet: [value for value in request.args.get(facet).split(',') if value.strip()]
+            for facet in facets.names if request.args.get(facet)
+        }
+        
+        # Text search narrows the candidates; facets are counted within them
+        query = request.args.get('q', '')
+        location = request.args.get('location', '') if 'location' not in facets.names else ''
+        within = opportunity_caches[name][1].search(query, location) if query or location else None
+        
+        items, counts = facets.query(selected, within)
+        payload = {
+            'success': True,
+            'count': len(items),
+            'facets': counts,
+            'selected': selected
+        }
+        if wants_paged_response():
+            return paged_response({name: items}, payload)
+        payload['data'] = {name: items}
+        return jsonify(payload)
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
+DEADLINE_DEFAULT_DAYS = 7
+DEADLINE_MAX_DAYS = 365
+
+def parse_deadline_request():
+    """(within days, feed names) from ?within= and ?type="""
+    try:
+        within = int(request.args.get('within', DEADLINE_DEFAULT_DAYS))
+    except ValueError:
+        raise ValueError('within must be a whole number of days')
+    if not 0 <= within <= DEADLINE_MAX_DAYS:
+        raise ValueError(f'within must be between 0 and {DEADLINE_MAX_DAYS}')
+    names = [name for name in request.args.get('type', ','.join(deadline_indexes)).split(',') if name]
+    unknown = [name for name in names if name not in deadline_indexes]
+    if unknown:
+        raise ValueError(f"Unknown type: {', '.join(unknown)}")
+    return within, names
+
+@app.route('/api/deadlines')
+def api_deadlines():
+    """Scholarships and internships closing within the next `within` days, soonest first"""
+    try:
+        within, names = parse_deadline_request()
+    except ValueError as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 400
+    
+    try:
+        for name in names:
+            ensure_fresh(name)
+        results = {name: deadline_indexes[name].due_within(within) for name in names}
+        payload = {
+            'success': True,
+            'within': within,
+            'counts': {name: len(items) for name, items in results.items()}
+        }
+        if wants_paged_response():
+            return paged_response(results, payload)
+        payload['data'] = results
+        return jsonify(payload)
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
+@app.route('/api/deadlines/reminders')
+def api_deadline_reminders():
+    """NDJSON stream of reminders for everything closing within `within` days, soonest first"""
+    try:
+        within, names = parse_deadline_request()
+    except ValueError as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 400
+    
+    for name in names:
+        ensure_fresh(name)
+    reminders = iter_reminders({name: deadline_indexes[name] for name in names}, within)
+    return Response((json.dumps(reminder, separators=(',', ':')) + '\n' for reminder in reminders),
+                    mimetype='application/x-ndjson')
+
+def parse_number(name):
+    """Optional float query parameter"""
+    value = request.args.get(name)
+    if value is None or value == '':
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        raise ValueError(f"{name} must be a number")
+
+@app.route('/api/colleges')
+def api_colleges():
+    """Query colleges by type, location, program, entrance exam and numeric ranges, sorted, optionally top-k"""
+    try:
+        filters = {
+            field: [value for value in request.args.get(field).split(',') if value.strip()]
+            for field in KEYWORD_FIELDS if request.args.get(field)
+        }
+        ranges = {}
+        for name in NUMERIC_FIELDS:
+            low, high = parse_number(f'min_{name}'), parse_number(f'max_{name}')
+            if low is not None or high is not None:
+                ranges[name] = (low, high)
+        sort = request.args.get('sort', 'nirf_rank')
+        descending = sort.startswith('-')
+        if sort.lstrip('-') not in NUMERIC_FIELDS:
+            raise ValueError(f"sort must be one of: {', '.join(NUMERIC_FIELDS)}")
+        top = parse_limit(request.args.get('top'))
+    except ValueError as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 400
+    
+    try:
+        colleges, total = college_index.query(filters, ranges, sort.lstrip('-'), descending, top)
+        payload = {
+            'success': True,
+            'total': total,
+            'query': {
+                'filters': filters,
+                'ranges': ranges,
+                'sort': sort
+            }
+        }
+        if wants_paged_response():
+            return paged_response({'colleges': colleges}, payload)
+        payload['data'] = {'colleges': colleges}
+        return jsonify(payload)
     except Exception as e:
         return jsonify({
             'success': False,
@@ -1370,6 +1936,12 @@ def get_colleges_data():
         }
     ]
 
+# Built once: money/percent strings are parsed, numeric columns presorted, categorical fields inverted
+colleges_data = normalize_records(get_colleges_data(),
+                                  money_fields=('fees', 'avg_package', 'highest_package'),
+                                  percent_fields=('acceptance',))
+college_index = CollegeIndex(colleges_data)
+
 def get_scholarships_data():
     """Get scholarship information"""
     return [
@@ -1633,11 +2205,21 @@ def get_career_insights():
         ]
     }
 
+def load_career_insights():
+    """Career insights with salary and growth columns parsed once"""
+    insights = get_career_insights()
+    normalize_records(insights['trending_careers'], money_fields=('salary',), percent_fields=('growth',))
+    normalize_records(insights['top_skills'], money_fields=('avg_salary',), percent_fields=('growth',))
+    normalize_records(insights['industries'], percent_fields=('growth',))
+    return insights
+
+career_insights_data = load_career_insights()
+
 if __name__ == '__main__':
     # Run the app
     print("🚀 SmartCareer Platform Starting...")
     print("📍 Access the application at: http://localhost:5000")
-    print("💡 No database required - using in-memory storage")
+    print(f"💾 Users, quiz results, chat history and sessions stored in SQLite: {STORAGE_DB_PATH}")
     
     # Production vs Development mode
     is_production = os.environ.get('FLASK_ENV') == 'production'
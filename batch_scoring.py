@@ -0,0 +1,125 @@
+#!/usr/bin/env python
+"""
+Batch quiz scoring for institutional bulk uploads
+Reads quiz answers as CSV or JSONL and streams NDJSON results
+
+Usage: python batch_scoring.py answers.csv > results.ndjson
+"""
+
+import csv
+import json
+import sys
+
+BATCH_CHUNK_SIZE = 1000
+LIST_SEPARATORS = (';', '|')
+
+
+def split_list(value):
+    """'technology; analytics' -> ['technology', 'analytics']"""
+    value = value or ''
+    for separator in LIST_SEPARATORS:
+        if separator in value:
+            return [part.strip() for part in value.split(separator) if part.strip()]
+    return [value.strip()] if value.strip() else []
+
+
+def check_answers(answers):
+    """Error message for answers the scorer cannot handle, else None"""
+    if not isinstance(answers, dict):
+        return 'answers must be a JSON object'
+    for key in ('interests', 'skills'):
+        values = answers.get(key, [])
+        if not isinstance(values, (list, str)) or not all(isinstance(value, str) for value in values):
+            return f"{key} must be a list of strings"
+    return None
+
+
+def parse_jsonl(lines):
+    """Each line is {"id": ..., "answers": {...}} or a bare answers dict"""
+    for number, line in enumerate(lines, start=1):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            record = json.loads(line)
+            if not isinstance(record, dict):
+                raise ValueError('Each line must be a JSON object')
+        except ValueError as e:
+            yield number, None, str(e)
+            continue
+        answers = record.get('answers', record)
+        yield record.get('id', number), answers, check_answers(answers)
+
+
+def parse_csv(lines):
+    """Columns: id, interests, skills, personality (lists split on ';' or '|')"""
+    reader = csv.DictReader(lines)
+    for number, row in enumerate(reader, start=1):
+        answers = {
+            'interests': split_list(row.get('interests')),
+            'skills': split_list(row.get('skills')),
+            'personality': (row.get('personality') or '').strip()
+        }
+        yield row.get('id') or number, answers, None
+
+
+def parse_answers(lines, fmt=None):
+    """Pick a parser by format name, or sniff it from the first line"""
+    lines = iter(lines)
+    first = next(lines, '')
+    if fmt is None:
+        fmt = 'jsonl' if first.lstrip().startswith('{') else 'csv'
+
+    def all_lines():
+        yield first
+        yield from lines
+
+    if fmt in ('jsonl', 'ndjson', 'json'):
+        return parse_jsonl(all_lines())
+    return parse_csv(all_lines())
+
+
+def iter_batch_results(records, predict_many, chunk_size=BATCH_CHUNK_SIZE):
+    """Score parsed records chunk by chunk and yield one NDJSON line each.
+
+    predict_many takes a list of answer dicts and returns the matching
+    list of recommendation lists (one vectorized pass per chunk).
+    """
+    chunk = []
+
+    def flush():
+        valid = [(record_id, answers) for record_id, answers, error in chunk if error is None]
+        scored = iter(predict_many([answers for _, answers in valid])) if valid else iter(())
+        for record_id, answers, error in chunk:
+            if error is None:
+                result = {'id': record_id, 'success': True, 'recommendations': next(scored)}
+            else:
+                result = {'id': record_id, 'success': False, 'error': error}
+            yield json.dumps(result, ensure_ascii=False) + '\n'
+
+    for record in records:
+        chunk.append(record)
+        if len(chunk) >= chunk_size:
+            yield from flush()
+            chunk = []
+    if chunk:
+        yield from flush()
+
+
+def main(argv):
+    if len(argv) < 2:
+        print(__doc__.strip().splitlines()[-1], file=sys.stderr)
+        return 1
+
+    from app import predict_careers
+
+    path = argv[1]
+    fmt = 'csv' if path.endswith('.csv') else 'jsonl' if path.endswith(('.jsonl', '.ndjson')) else None
+    with open(path, newline='', encoding='utf-8') as f:
+        for line in iter_batch_results(parse_answers(f, fmt), predict_careers):
+            sys.stdout.write(line)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv))
@@ -0,0 +1,228 @@
+#!/usr/bin/env python
+"""
+Load benchmark for /chat/stream: sync vs gevent gunicorn workers
+Runs the app against a slow local fake LLM under each worker class and opens many SSE streams at once
+
+Usage: python benchmark_streams.py [--streams 200] [--workers 2] [--tokens 20] [--token-delay 0.1]
+"""
+
+import argparse
+import json
+import os
+import socket
+import subprocess
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import requests
+
+
+def free_port():
+    with socket.socket() as s:
+        s.bind(('127.0.0.1', 0))
+        return s.getsockname()[1]
+
+
+def start_slow_llm(tokens, token_delay):
+    """OpenAI-compatible streaming server that emits one token every token_delay seconds.
+
+    Returns (server, base_url, counters); counters['peak'] is the most
+    generations that were in flight at the same time.
+    """
+    counters = {'active': 0, 'peak': 0, 'total': 0}
+    lock = threading.Lock()
+
+    class SlowLLMHandler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+
+        def do_POST(self):
+            length = int(self.headers.get('Content-Length', 0))
+            self.rfile.read(length)
+            with lock:
+                counters['active'] += 1
+                counters['total'] += 1
+                counters['peak'] = max(counters['peak'], counters['active'])
+            try:
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/event-stream')
+                self.send_header('Transfer-Encoding', 'chunked')
+                self.end_headers()
+                for i in range(tokens):
+                    time.sleep(token_delay)
+                    chunk = {'id': 'bench', 'object': 'chat.completion.chunk', 'created': 0, 'model': 'bench',
+                             'choices': [{'index': 0, 'delta': {'content': f"token{i} "}, 'finish_reason': None}]}
+                    data = f"data: {json.dumps(chunk)}\n\n".encode('utf-8')
+                    self.wfile.write(f"{len(data):x}\r\n".encode('ascii') + data + b"\r\n")
+                    self.wfile.flush()
+                done = b"data: [DONE]\n\n"
+                self.wfile.write(f"{len(done):x}\r\n".encode('ascii') + done + b"\r\n0\r\n\r\n")
+            except OSError:
+                pass
+            finally:
+                with lock:
+                    counters['active'] -= 1
+
+        def log_message(self, format, *args):
+            pass
+
+    class SlowLLMServer(ThreadingHTTPServer):
+        request_queue_size = 4096
+        daemon_threads = True
+
+    server = SlowLLMServer(('127.0.0.1', 0), SlowLLMHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}/v1", counters
+
+
+def start_app(worker_class, workers, llm_base_url, port):
+    """Run `gunicorn app:app` with the given worker class against the fake LLM"""
+    env = dict(os.environ)
+    env.update({
+        'GUNICORN_WORKER_CLASS': worker_class,
+        'WEB_CONCURRENCY': str(workers),
+        'GUNICORN_TIMEOUT': '120',
+        'OPENAI_API_KEY': 'sk-benchmark-not-a-real-key',
+        'OPENAI_BASE_URL': llm_base_url,
+        'GEMINI_API_KEY': '',
+        'USE_FREE_API': 'false',
+        'CHAT_CACHE_FILE': '',
+        'LLM_MAX_CONNECTIONS': env.get('LLM_MAX_CONNECTIONS', '1000')
+    })
+    return subprocess.Popen(
+        [sys.executable, '-m', 'gunicorn', '--bind', f"127.0.0.1:{port}", '--backlog', '4096', 'app:app'],
+        cwd=os.path.dirname(os.path.abspath(__file__)),
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL
+    )
+
+
+def wait_until_ready(base_url, timeout=60):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        try:
+            if requests.get(f"{base_url}/api/chat/status", timeout=2).status_code == 200:
+                return True
+        except requests.RequestException:
+            pass
+        time.sleep(0.3)
+    return False
+
+
+def open_stream(base_url, index, deadline_seconds):
+    """POST one /chat/stream request and read it to [DONE]"""
+    result = {'ok': False, 'ttfb': None, 'total': None, 'source': None}
+    started = time.perf_counter()
+    try:
+        with requests.post(f"{base_url}/chat/stream", json={'message': f"benchmark question {index}"},
+                           stream=True, timeout=(10, deadline_seconds)) as response:
+            event = None
+            for line in response.iter_lines(decode_unicode=True):
+                if time.perf_counter() - started > deadline_seconds:
+                    break
+                if line.startswith('event: '):
+                    event = line[len('event: '):]
+                elif line.startswith('data: '):
+                    data = line[len('data: '):]
+                    if event == 'metrics':
+                        result['source'] = json.loads(data).get('source')
+                    elif data == '[DONE]':
+                        result['total'] = time.perf_counter() - started
+                        result['ok'] = result['source'] == 'openai'
+                        break
+                    elif result['ttfb'] is None:
+                        result['ttfb'] = time.perf_counter() - started
+                    event = None
+    except requests.RequestException:
+        pass
+    return result
+
+
+def percentile(values, fraction):
+    if not values:
+        return None
+    values = sorted(values)
+    return values[min(int(len(values) * fraction), len(values) - 1)]
+
+
+def run_benchmark(worker_class, args, llm_base_url, counters):
+    port = free_port()
+    base_url = f"http://127.0.0.1:{port}"
+    server = start_app(worker_class, args.workers, llm_base_url, port)
+    try:
+        if not wait_until_ready(base_url):
+            print(f"{worker_class}: server did not start (is gunicorn{' + gevent' if worker_class == 'gevent' else ''} installed?)")
+            return None
+
+        counters['peak'] = 0
+        results = [None] * args.streams
+        start_gate = threading.Event()
+
+        def client(i):
+            start_gate.wait()
+            results[i] = open_stream(base_url, i, args.deadline)
+
+        threads = [threading.Thread(target=client, args=(i,), daemon=True) for i in range(args.streams)]
+        for thread in threads:
+            thread.start()
+        started = time.perf_counter()
+        start_gate.set()
+        for thread in threads:
+            thread.join(args.deadline + 15)
+        elapsed = time.perf_counter() - started
+
+        done = [r for r in results if r and r['ok']]
+        ttfbs = [r['ttfb'] for r in done if r['ttfb'] is not None]
+        return {
+            'worker_class': worker_class,
+            'completed': len(done),
+            'peak_concurrent': counters['peak'],
+            'ttfb_p50': percentile(ttfbs, 0.5),
+            'ttfb_p95': percentile(ttfbs, 0.95),
+            'elapsed': elapsed
+        }
+    finally:
+        server.terminate()
+        try:
+            server.wait(10)
+        except subprocess.TimeoutExpired:
+            server.kill()
+
+
+def format_seconds(value):
+    return '-' if value is None else f"{value:.2f}s"
+
+
+def main(argv):
+    parser = argparse.ArgumentParser(description='Compare concurrent /chat/stream capacity of sync and gevent workers')
+    parser.add_argument('--streams', type=int, default=200, help='simultaneous SSE clients')
+    parser.add_argument('--workers', type=int, default=2, help='gunicorn worker processes')
+    parser.add_argument('--tokens', type=int, default=20, help='tokens per fake LLM answer')
+    parser.add_argument('--token-delay', type=float, default=0.1, help='seconds between fake LLM tokens')
+    parser.add_argument('--deadline', type=float, default=30, help='seconds a client waits for its stream')
+    parser.add_argument('--modes', default='sync,gevent', help='comma-separated worker classes')
+    args = parser.parse_args(argv[1:])
+
+    llm, llm_base_url, counters = start_slow_llm(args.tokens, args.token_delay)
+    generation = args.tokens * args.token_delay
+    print(f"{args.streams} streams, {args.workers} workers, ~{generation:.1f}s per answer, {args.deadline:.0f}s deadline")
+
+    rows = []
+    for worker_class in args.modes.split(','):
+        print(f"Running {worker_class}...")
+        row = run_benchmark(worker_class.strip(), args, llm_base_url, counters)
+        if row:
+            rows.append(row)
+    llm.shutdown()
+
+    print(f"\n{'workers':<10}{'completed':>12}{'peak open':>12}{'ttfb p50':>11}{'ttfb p95':>11}{'wall':>9}")
+    for row in rows:
+        print(f"{row['worker_class']:<10}{row['completed']:>8}/{args.streams:<3}{row['peak_concurrent']:>12}"
+              f"{format_seconds(row['ttfb_p50']):>11}{format_seconds(row['ttfb_p95']):>11}{format_seconds(row['elapsed']):>9}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv))
@@ -0,0 +1,187 @@
+"""
+Pluggable storage for the opportunity caches
+Lets every gunicorn worker share one copy of each {'data', 'last_updated'} entry
+"""
+
+import json
+import os
+import threading
+import time
+import uuid
+
+from storage import ThreadConnections
+
+
+class MemoryCacheBackend:
+    """Per-process storage; the default and the old behaviour"""
+
+    def __init__(self):
+        self._entries = {}
+        self._leases = {}
+        self._lock = threading.Lock()
+
+    def last_updated(self, name):
+        entry = self._entries.get(name)
+        return entry['last_updated'] if entry else None
+
+    def load(self, name):
+        return self._entries.get(name)
+
+    def store(self, name, entry):
+        self._entries[name] = {'data': entry['data'], 'last_updated': entry['last_updated']}
+
+    def acquire_refresh_lease(self, name, lease_seconds):
+        with self._lock:
+            if self._leases.get(name, 0) > time.time():
+                return False
+            self._leases[name] = time.time() + lease_seconds
+            return True
+
+    def release_refresh_lease(self, name):
+        with self._lock:
+            self._leases.pop(name, None)
+
+
+class SQLiteCacheBackend:
+    """Cache entries and refresh leases in a SQLite file shared by all workers"""
+
+    def __init__(self, path):
+        self.path = path
+        self.holder = f"{os.getpid()}-{uuid.uuid4().hex[:8]}"
+        self._connections = ThreadConnections(path)
+        conn = self._connection()
+        conn.execute("""CREATE TABLE IF NOT EXISTS cache_entries (
+            name TEXT PRIMARY KEY, payload TEXT NOT NULL, last_updated TEXT NOT NULL)""")
+        conn.execute("""CREATE TABLE IF NOT EXISTS cache_leases (
+            name TEXT PRIMARY KEY, holder TEXT NOT NULL, expires REAL NOT NULL)""")
+
+    def _connection(self):
+        return self._connections.get()
+
+    def last_updated(self, name):
+        row = self._connection().execute(
+            "SELECT last_updated FROM cache_entries WHERE name = ?", (name,)).fetchone()
+        return row[0] if row else None
+
+    def load(self, name):
+        row = self._connection().execute(
+            "SELECT payload, last_updated FROM cache_entries WHERE name = ?", (name,)).fetchone()
+        if not row:
+            return None
+        return {'data': json.loads(row[0]), 'last_updated': row[1]}
+
+    def store(self, name, entry):
+        self._connection().execute(
+            "INSERT OR REPLACE INTO cache_entries (name, payload, last_updated) VALUES (?, ?, ?)",
+            (name, json.dumps(entry['data'], ensure_ascii=False), entry['last_updated']))
+
+    def acquire_refresh_lease(self, name, lease_seconds):
+        conn = self._connection()
+        now = time.time()
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            row = conn.execute("SELECT holder, expires FROM cache_leases WHERE name = ?", (name,)).fetchone()
+            if row and row[1] > now and row[0] != self.holder:
+                conn.execute('COMMIT')
+                return False
+            conn.execute("INSERT OR REPLACE INTO cache_leases (name, holder, expires) VALUES (?, ?, ?)",
+                         (name, self.holder, now + lease_seconds))
+            conn.execute('COMMIT')
+            return True
+        except Exception:
+            conn.execute('ROLLBACK')
+            raise
+
+    def release_refresh_lease(self, name):
+        self._connection().execute(
+            "DELETE FROM cache_leases WHERE name = ? AND holder = ?", (name, self.holder))
+
+
+class RedisCacheBackend:
+    """Cache entries in Redis (or anything speaking the same get/set/delete API)"""
+
+    def __init__(self, client, prefix='smartcareer:cache:'):
+        self.client = client
+        self.prefix = prefix
+        self.holder = f"{os.getpid()}-{uuid.uuid4().hex[:8]}"
+
+    def _decode(self, value):
+        return value.decode('utf-8') if isinstance(value, bytes) else value
+
+    def last_updated(self, name):
+        return self._decode(self.client.get(f"{self.prefix}{name}:updated"))
+
+    def load(self, name):
+        payload = self.client.get(f"{self.prefix}{name}")
+        if payload is None:
+            return None
+        entry = json.loads(self._decode(payload))
+        return {'data': entry['data'], 'last_updated': entry['last_updated']}
+
+    def store(self, name, entry):
+        self.client.set(f"{self.prefix}{name}", json.dumps(entry, ensure_ascii=False))
+        self.client.set(f"{self.prefix}{name}:updated", entry['last_updated'])
+
+    def acquire_refresh_lease(self, name, lease_seconds):
+        return bool(self.client.set(f"{self.prefix}{name}:lease", self.holder,
+                                    nx=True, ex=max(int(lease_seconds), 1)))
+
+    def release_refresh_lease(self, name):
+        key = f"{self.prefix}{name}:lease"
+        if self._decode(self.client.get(key)) == self.holder:
+            self.client.delete(key)
+
+
+class LocalRedis:
+    """Tiny in-process stand-in for a Redis client (get/set/delete with NX/EX).
+
+    Useful for development and tests; it is not shared between processes.
+    """
+
+    def __init__(self):
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def _live(self, key):
+        item = self._values.get(key)
+        if item and item[1] is not None and item[1] <= time.time():
+            del self._values[key]
+            return None
+        return item
+
+    def get(self, key):
+        with self._lock:
+            item = self._live(key)
+            return item[0] if item else None
+
+    def set(self, key, value, nx=False, ex=None):
+        with self._lock:
+            if nx and self._live(key):
+                return None
+            self._values[key] = (value, time.time() + ex if ex else None)
+            return True
+
+    def delete(self, *keys):
+        with self._lock:
+            return sum(1 for key in keys if self._values.pop(key, None) is not None)
+
+
+def make_redis_client(redis_url=''):
+    """Redis client for REDIS_URL; local:// gives the in-process LocalRedis"""
+    if redis_url.startswith('local://'):
+        return LocalRedis()
+    try:
+        import redis
+    except ImportError:
+        raise RuntimeError("CACHE_BACKEND/SESSION_BACKEND=redis needs the redis package: pip install redis")
+    return redis.Redis.from_url(redis_url or 'redis://localhost:6379/0')
+
+
+def make_cache_backend(kind='memory', path='smartcareer_cache.db', redis_url=''):
+    """Build the backend selected by CACHE_BACKEND"""
+    kind = (kind or 'memory').lower()
+    if kind == 'sqlite':
+        return SQLiteCacheBackend(path)
+    if kind == 'redis':
+        return RedisCacheBackend(make_redis_client(redis_url))
+    return MemoryCacheBackend()
@@ -0,0 +1,85 @@
+"""
+Vectorized career scoring for quiz answers
+The interest/skill -> career weight matrix is built once; each answer set is one matrix-vector product
+"""
+
+import numpy as np
+
+
+def normalize_interest(interest):
+    return interest.lower()
+
+
+def normalize_skill(skill):
+    return skill.lower().replace(' ', '').replace('-', '')
+
+
+class CareerScorer:
+    """Scores quiz answers against every career at once.
+
+    Rows of the weight matrix are answer dimensions (one per interest and
+    one per skill), columns are careers. Repeated answers count repeatedly,
+    exactly like the original per-answer loop.
+    """
+
+    def __init__(self, careers, interest_mapping, skill_mapping, interest_weight=20, skill_weight=15):
+        self.careers = list(careers)
+        career_columns = {career: column for column, career in enumerate(self.careers)}
+
+        self.interest_rows = {interest: row for row, interest in enumerate(interest_mapping)}
+        self.skill_rows = {skill: len(self.interest_rows) + row for row, skill in enumerate(skill_mapping)}
+
+        self.weights = np.zeros((len(self.interest_rows) + len(self.skill_rows), len(self.careers)), dtype=np.int64)
+        for interest, mapped in interest_mapping.items():
+            for career in mapped:
+                self.weights[self.interest_rows[interest], career_columns[career]] += interest_weight
+        for skill, mapped in skill_mapping.items():
+            for career in mapped:
+                self.weights[self.skill_rows[skill], career_columns[career]] += skill_weight
+
+        # Tie-break so equal scores keep career declaration order, like a stable sort
+        self._tie_break = np.arange(len(self.careers) - 1, -1, -1, dtype=np.int64)
+
+    def vectorize(self, answers, out=None):
+        """Count how often each interest/skill dimension was picked"""
+        vector = np.zeros(self.weights.shape[0], dtype=np.int64) if out is None else out
+        for interest in answers.get('interests', []):
+            row = self.interest_rows.get(normalize_interest(interest))
+            if row is not None:
+                vector[row] += 1
+        for skill in answers.get('skills', []):
+            row = self.skill_rows.get(normalize_skill(skill))
+            if row is not None:
+                vector[row] += 1
+        return vector
+
+    def vectorize_many(self, answers_list):
+        """Answer matrix with one row per answer set"""
+        matrix = np.zeros((len(answers_list), self.weights.shape[0]), dtype=np.int64)
+        for position, answers in enumerate(answers_list):
+            self.vectorize(answers, out=matrix[position])
+        return matrix
+
+    def top_k(self, scores, k=3):
+        """Indices and scores of the k best careers, best first.
+
+        Uses argpartition over scores scaled with a tie-break term, so only
+        the k winners get sorted.
+        """
+        k = min(k, len(self.careers))
+        keys = scores * len(self.careers) + self._tie_break
+        if k < len(self.careers):
+            candidates = np.argpartition(-keys, k - 1)[:k]
+        else:
+            candidates = np.arange(len(self.careers))
+        ranked = candidates[np.argsort(-keys[candidates])]
+        return [(int(column), int(scores[column])) for column in ranked]
+
+    def score(self, answers, k=3):
+        """Top-k (career_index, score) pairs for one answer set"""
+        return self.top_k(self.vectorize(answers) @ self.weights, k)
+
+    def score_many(self, answers_list, k=3):
+        """Top-k pairs for many answer sets in a single matrix product"""
+        scores = self.vectorize_many(answers_list) @ self.weights
+        return [self.top_k(row, k) for row in scores]
@@ -0,0 +1,124 @@
+"""
+Conversation context for multi-turn chat under a token budget
+Recent turns go to the LLM verbatim; older turns are folded into a running summary cached per conversation
+"""
+
+import threading
+from collections import OrderedDict
+
+CHARS_PER_TOKEN = 4
+TURN_OVERHEAD_TOKENS = 8  # role markers and separators for one user/assistant pair
+SUMMARY_SNIPPET_CHARS = 100
+
+
+def estimate_tokens(text):
+    """Rough token count (~4 characters per token for English text)"""
+    return (len(text or '') + CHARS_PER_TOKEN - 1) // CHARS_PER_TOKEN
+
+
+def turn_tokens(turn):
+    return estimate_tokens(turn.get('message')) + estimate_tokens(turn.get('response')) + TURN_OVERHEAD_TOKENS
+
+
+def turn_key(turn):
+    return turn.get('timestamp'), turn.get('message')
+
+
+def first_line(text, limit=SUMMARY_SNIPPET_CHARS):
+    line = next((line.strip() for line in (text or '').splitlines() if line.strip()), '')
+    return line if len(line) <= limit else line[:limit - 1].rstrip() + '…'
+
+
+def summarize_turns(previous, turns, max_tokens):
+    """Extractive summary: one line per turn appended to the previous summary, oldest lines dropped past max_tokens"""
+    lines = previous.splitlines() if previous else []
+    for turn in turns:
+        lines.append(f"- User asked: {first_line(turn.get('message'))} | Mentor: {first_line(turn.get('response'))}")
+    while len(lines) > 1 and estimate_tokens('\n'.join(lines)) > max_tokens:
+        lines.pop(0)
+    return '\n'.join(lines)
+
+
+class ConversationContext:
+    """Assembles prior turns for an LLM call within token_budget.
+
+    Turns are walked newest first and kept verbatim while they fit. Everything
+    older is covered by a summary that is extended incrementally: only turns
+    that newly fell out of the window are summarized, and the result is cached
+    per conversation (LRU, max_conversations entries).
+    """
+
+    def __init__(self, token_budget=1200, summary_tokens=250, max_conversations=10000, summarize=None):
+        self.token_budget = token_budget
+        self.summary_tokens = summary_tokens
+        self.max_conversations = max_conversations
+        self.summarize = summarize or summarize_turns
+        self.summaries_built = 0
+        self.summaries_reused = 0
+        self._summaries = OrderedDict()  # conversation_id -> (key of last summarized turn, summary)
+        self._lock = threading.Lock()
+
+    def build(self, conversation_id, turns):
+        """Chat messages (role/content dicts) carrying the context of `turns`, oldest first"""
+        if not turns:
+            return []
+
+        # Newest turns first, verbatim, leaving room for a summary if anything is left over
+        used = 0
+        keep_from = len(turns)
+        for i in range(len(turns) - 1, -1, -1):
+            cost = turn_tokens(turns[i])
+            reserve = self.summary_tokens if i > 0 else 0
+            if used + cost + reserve > self.token_budget:
+                break
+            used += cost
+            keep_from = i
+
+        summary, keep_from = self._summary_for(conversation_id, turns, keep_from)
+
+        messages = []
+        if summary:
+            messages.append({'role': 'system', 'content': f"Summary of the earlier conversation:\n{summary}"})
+        for turn in turns[keep_from:]:
+            messages.append({'role': 'user', 'content': turn.get('message', '')})
+            messages.append({'role': 'assistant', 'content': turn.get('response', '')})
+        return messages
+
+    def _summary_for(self, conversation_id, turns, keep_from):
+        """(summary of turns[:keep_from], keep_from), reusing and extending the cached summary"""
+        with self._lock:
+            cached = self._summaries.get(conversation_id)
+            if cached is not None:
+                self._summaries.move_to_end(conversation_id)
+        last_key, summary = cached if cached is not None else (None, '')
+
+        # Turns up to the last summarized one are already covered; none are if it was trimmed away
+        covered = 0
+        if last_key is not None:
+            for i in range(len(turns) - 1, -1, -1):
+                if turn_key(turns[i]) == last_key:
+                    covered = i + 1
+                    break
+        keep_from = max(keep_from, covered)
+
+        if covered == keep_from:
+            with self._lock:
+                self.summaries_reused += bool(summary)
+            return summary, keep_from
+
+        summary = self.summarize(summary, turns[covered:keep_from], self.summary_tokens)
+        with self._lock:
+            self.summaries_built += 1
+            self._summaries[conversation_id] = (turn_key(turns[keep_from - 1]), summary)
+            self._summaries.move_to_end(conversation_id)
+            while len(self._summaries) > self.max_conversations:
+                self._summaries.popitem(last=False)
+        return summary, keep_from
+
+    def stats(self):
+        with self._lock:
+            return {
+                'conversations': len(self._summaries),
+                'summaries_built': self.summaries_built,
+                'summaries_reused': self.summaries_reused
+            }
@@ -0,0 +1,110 @@
+"""
+Per-provider circuit breakers for the chat providers
+Closed -> open on a high error or slow-call rate; half-open lets one probe through after a cool-down
+"""
+
+import threading
+import time
+from collections import deque
+
+CLOSED = 'closed'
+OPEN = 'open'
+HALF_OPEN = 'half_open'
+
+
+class CircuitBreaker:
+    """Tracks the last `window` calls of one provider and trips when they look unhealthy"""
+
+    def __init__(self, name, window=20, min_calls=5, error_rate=0.5,
+                 slow_call_ms=8000, slow_rate=0.5, open_seconds=30):
+        self.name = name
+        self.window = window
+        self.min_calls = min_calls
+        self.error_rate = error_rate
+        self.slow_call_ms = slow_call_ms
+        self.slow_rate = slow_rate
+        self.open_seconds = open_seconds
+
+        self.state = CLOSED
+        # Bumped on every state change; a call's result only counts for the generation that admitted it
+        self.generation = 1
+        self.opened_at = None
+        self.trips = 0
+        self._calls = deque(maxlen=window)
+        self._probe_in_flight = False
+        self._lock = threading.Lock()
+
+    def allow(self):
+        """A ticket to pass back to record() if a request may use this provider now, else None"""
+        with self._lock:
+            if self.state == CLOSED:
+                return self.generation
+            if self.state == OPEN:
+                if time.monotonic() - self.opened_at < self.open_seconds:
+                    return None
+                self._enter(HALF_OPEN)
+                self._probe_in_flight = False
+            if self._probe_in_flight:
+                return None
+            self._probe_in_flight = True
+            return self.generation
+
+    def record(self, latency_ms, ok, ticket):
+        """Feed the outcome of a call that allow() let through with this ticket.
+
+        Results from calls admitted before the last state change (e.g. a slow
+        call that finishes while the breaker is half-open) are ignored.
+        """
+        slow = latency_ms >= self.slow_call_ms
+        with self._lock:
+            if ticket != self.generation:
+                return
+            if self.state == HALF_OPEN:
+                self._probe_in_flight = False
+                if ok and not slow:
+                    self._enter(CLOSED)
+                    self._calls.clear()
+                else:
+                    self._trip()
+                return
+
+            self._calls.append((ok, slow))
+            if self.state == CLOSED and len(self._calls) >= self.min_calls:
+                failures = sum(1 for call_ok, _ in self._calls if not call_ok)
+                slow_calls = sum(1 for _, call_slow in self._calls if call_slow)
+                if (failures / len(self._calls) >= self.error_rate or
+                        slow_calls / len(self._calls) >= self.slow_rate):
+                    self._trip()
+
+    def release(self, ticket):
+        """Hand back a ticket whose call never ran, so a half-open breaker can probe again"""
+        with self._lock:
+            if ticket == self.generation and self.state == HALF_OPEN:
+                self._probe_in_flight = False
+
+    def _enter(self, state):
+        self.state = state
+        self.generation += 1
+
+    def _trip(self):
+        self._enter(OPEN)
+        self.opened_at = time.monotonic()
+        self.trips += 1
+        self._calls.clear()
+
+    def snapshot(self):
+        with self._lock:
+            calls = len(self._calls)
+            failures = sum(1 for ok, _ in self._calls if not ok)
+            slow_calls = sum(1 for _, slow in self._calls if slow)
+            retry_in = None
+            if self.state == OPEN:
+                retry_in = round(max(self.open_seconds - (time.monotonic() - self.opened_at), 0), 1)
+            return {
+                'state': self.state,
+                'recent_calls': calls,
+                'error_rate': round(failures / calls, 3) if calls else 0.0,
+                'slow_rate': round(slow_calls / calls, 3) if calls else 0.0,
+                'trips': self.trips,
+                'retry_in_seconds': retry_in
+            }
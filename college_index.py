@@ -0,0 +1,111 @@
+"""
+Query index over the college list, built once at startup
+Numeric fields become columnar arrays with presorted orders; categorical fields become inverted maps of row ids
+"""
+
+import numpy as np
+
+# Numeric column -> the record key holding it; money and percent columns are the ones
+# money.normalize_records added next to the display strings
+NUMERIC_FIELDS = {
+    'nirf_rank': 'nirf_rank',
+    'rating': 'rating',
+    'total_seats': 'total_seats',
+    'established': 'established',
+    'fees': 'fees_min_inr',
+    'avg_package': 'avg_package_min_inr',
+    'highest_package': 'highest_package_max_inr',
+    'acceptance': 'acceptance_pct'
+}
+
+
+def split_keys(value, separator):
+    """'Chennai, Tamil Nadu' -> ['Chennai, Tamil Nadu', 'Chennai', 'Tamil Nadu']"""
+    parts = [part.strip() for part in (value or '').split(separator) if part.strip()]
+    return [value] + parts if len(parts) > 1 else parts
+
+
+# Categorical filter -> the keys a college is listed under
+KEYWORD_FIELDS = {
+    'type': lambda college: [college.get('type', '')],
+    'location': lambda college: split_keys(college.get('location'), ','),
+    'program': lambda college: college.get('programs', []),
+    'entrance_exam': lambda college: split_keys(college.get('entrance_exam'), '+')
+}
+
+
+def normalize_key(value):
+    return (value or '').casefold().strip()
+
+
+class CollegeIndex:
+    """Answers filter / range / sort / top-k queries without re-reading the records.
+
+    Expects colleges already passed through money.normalize_records.
+    """
+
+    def __init__(self, colleges):
+        self.colleges = list(colleges)
+        size = len(self.colleges)
+
+        self.columns = {}
+        self.ascending = {}
+        self.descending = {}
+        self.sorted_values = {}
+        for name, key in NUMERIC_FIELDS.items():
+            values = [college.get(key) for college in self.colleges]
+            column = np.array([np.nan if value is None else float(value) for value in values], dtype=float)
+            self.columns[name] = column
+            # Stable sorts keep list order for ties; missing values (NaN) sort last both ways
+            self.ascending[name] = np.argsort(column, kind='stable')
+            self.descending[name] = np.argsort(-column, kind='stable')
+            self.sorted_values[name] = column[self.ascending[name]]
+
+        self.postings = {}
+        for field, keys_of in KEYWORD_FIELDS.items():
+            postings = {}
+            for row, college in enumerate(self.colleges):
+                for key in {normalize_key(key) for key in keys_of(college)}:
+                    if key:
+                        postings.setdefault(key, []).append(row)
+            self.postings[field] = {key: np.array(rows, dtype=np.intp) for key, rows in postings.items()}
+        self._empty = np.zeros(0, dtype=np.intp)
+        self._size = size
+
+    def matching_rows(self, field, values):
+        """Rows listed under any of the values (OR within one field)"""
+        postings = self.postings[field]
+        rows = [postings.get(normalize_key(value), self._empty) for value in values]
+        return np.unique(np.concatenate(rows)) if rows else self._empty
+
+    def range_rows(self, name, low=None, high=None):
+        """Rows with low <= value <= high, found by binary search over the presorted column"""
+        sorted_values = self.sorted_values[name]
+        start = 0 if low is None else np.searchsorted(sorted_values, low, side='left')
+        end = np.count_nonzero(~np.isnan(sorted_values)) if high is None else \
+            np.searchsorted(sorted_values, high, side='right')
+        return self.ascending[name][start:end]
+
+    def query(self, filters=None, ranges=None, sort='nirf_rank', descending=False, limit=None):
+        """(matching colleges in sort order, total matches).
+
+        filters: {field: [values]} from KEYWORD_FIELDS (AND across fields)
+        ranges: {numeric field: (low, high)}, either bound may be None
+        """
+        mask = None
+        for field, values in (filters or {}).items():
+            mask = self._restrict(mask, self.matching_rows(field, values))
+        for name, (low, high) in (ranges or {}).items():
+            mask = self._restrict(mask, self.range_rows(name, low, high))
+
+        order = (self.descending if descending else self.ascending)[sort]
+        rows = order if mask is None else order[mask[order]]
+        total = len(rows)
+        if limit is not None:
+            rows = rows[:limit]
+        return [self.colleges[row] for row in rows], total
+
+    def _restrict(self, mask, rows):
+        selected = np.zeros(self._size, dtype=bool)
+        selected[rows] = True
+        return selected if mask is None else mask & selected
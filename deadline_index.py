@@ -0,0 +1,96 @@
+"""
+Deadline-ordered view of the opportunity feeds
+Items are kept sorted by parsed deadline, so "closing within N days" is two bisects plus the k matches
+"""
+
+import heapq
+import threading
+from bisect import bisect_left, bisect_right
+from datetime import date
+
+
+def parse_deadline(value):
+    """ISO date (time part ignored), or None"""
+    try:
+        return date.fromisoformat(str(value)[:10])
+    except (TypeError, ValueError):
+        return None
+
+
+class DeadlineIndex:
+    """Items sorted by deadline; deadlines that have passed fall off the front"""
+
+    def __init__(self, field='deadline'):
+        self.field = field
+        # (deadline ordinals ascending, items in the same order)
+        self._snapshot = ([], [])
+        self._lock = threading.Lock()
+
+    def build(self, items):
+        """Rebuild from a fresh cache snapshot; items without a parseable deadline are left out"""
+        dated = []
+        for position, item in enumerate(items):
+            deadline = parse_deadline(item.get(self.field))
+            if deadline:
+                dated.append((deadline.toordinal(), position, item))
+        # Feeds usually arrive deadline-sorted already, which makes this sort linear
+        dated.sort(key=lambda entry: entry[:2])
+        snapshot = ([ordinal for ordinal, _, _ in dated], [item for _, _, item in dated])
+        with self._lock:
+            self._snapshot = snapshot
+
+    def __len__(self):
+        return len(self._snapshot[0])
+
+    def _expire(self, today):
+        """Drop deadlines before today; each item is trimmed once per build, not on every query"""
+        snapshot = self._snapshot
+        ordinals, items = snapshot
+        start = bisect_left(ordinals, today.toordinal())
+        if not start:
+            return snapshot
+        trimmed = (ordinals[start:], items[start:])
+        with self._lock:
+            # Only replace the snapshot that was trimmed; a build() that landed meanwhile wins
+            if self._snapshot is snapshot:
+                self._snapshot = trimmed
+        return trimmed
+
+    def due_within(self, days, today=None):
+        """Items with today <= deadline <= today + days, soonest first"""
+        today = today or date.today()
+        ordinals, items = self._expire(today)
+        return items[:bisect_right(ordinals, today.toordinal() + days)]
+
+
+def describe_days(days_left):
+    if days_left == 0:
+        return 'today'
+    if days_left == 1:
+        return 'tomorrow'
+    return f'in {days_left} days'
+
+
+def iter_reminders(indexes, days, today=None):
+    """Yield one reminder per item due within `days`, soonest first across every feed.
+
+    indexes: {feed name: DeadlineIndex}. Only the items already due soon are
+    visited, so the cost follows the number of reminders, not the feed sizes.
+    """
+    today = today or date.today()
+
+    def feed_reminders(name, index):
+        for item in index.due_within(days, today):
+            days_left = (parse_deadline(item.get(index.field)) - today).days
+            yield {
+                'type': name,
+                'id': item.get('id'),
+                'title': item.get('title'),
+                'deadline': item.get(index.field),
+                'days_left': days_left,
+                'link': item.get('link'),
+                'message': f"{item.get('title')} closes {describe_days(days_left)}"
+            }
+
+    streams = [feed_reminders(name, index) for name, index in indexes.items()]
+    yield from heapq.merge(*streams, key=lambda reminder: reminder['days_left'])
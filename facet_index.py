@@ -0,0 +1,131 @@
+"""
+Facet filtering and counts for the opportunity feeds
+Every facet value owns a bitmap (a Python int, bit i = item i), so multi-facet filters are ANDs and ORs and counts are popcounts
+"""
+
+from datetime import date
+
+
+def normalize_value(value):
+    return str(value).casefold().strip()
+
+
+def to_bitmap(doc_ids, size):
+    """Bitmap with the given bits set, built in one pass"""
+    buffer = bytearray((size + 7) // 8)
+    for doc_id in doc_ids:
+        buffer[doc_id >> 3] |= 1 << (doc_id & 7)
+    return int.from_bytes(buffer, 'little')
+
+
+def iter_bits(bitmap):
+    """Set bit positions, lowest first"""
+    while bitmap:
+        lowest = bitmap & -bitmap
+        yield lowest.bit_length() - 1
+        bitmap ^= lowest
+
+
+def days_until(value, today=None):
+    """Days from today to an ISO date (negative once it has passed), or None"""
+    try:
+        return (date.fromisoformat(str(value)[:10]) - (today or date.today())).days
+    except ValueError:
+        return None
+
+
+def bucket_for(value, buckets):
+    """Name of the (name, low, high) bucket holding value; low is inclusive, high exclusive, None is open"""
+    if value is None:
+        return None
+    for name, low, high in buckets:
+        if (low is None or value >= low) and (high is None or value < high):
+            return name
+    return None
+
+
+class FacetIndex:
+    """Bitmap facet index over a list of dicts, rebuilt whenever the cache refreshes.
+
+    value_facets map a facet to an item field (list fields such as skills give
+    one value per element); range_facets map a facet to (read, buckets), where
+    read(item) returns a number that is dropped into one of the buckets.
+    Relative buckets such as deadline windows are computed at build time.
+    """
+
+    def __init__(self, value_facets=None, range_facets=None):
+        self.value_facets = value_facets or {}
+        self.range_facets = range_facets or {}
+        # (items, positions by object id, {facet: {key: bitmap}}, {facet: {key: label}}, bitmap of all items)
+        self._snapshot = ([], {}, {}, {}, 0)
+
+    @property
+    def names(self):
+        return list(self.value_facets) + list(self.range_facets)
+
+    def build(self, items):
+        """Rebuild every facet bitmap from scratch for a fresh cache snapshot"""
+        items = list(items)
+        doc_ids = {facet: {} for facet in self.names}
+        labels = {facet: {} for facet in self.names}
+        for facet, (_, buckets) in self.range_facets.items():
+            for name, _, _ in buckets:
+                doc_ids[facet][name] = []
+                labels[facet][name] = name
+
+        for doc_id, item in enumerate(items):
+            for facet, field in self.value_facets.items():
+                values = item.get(field)
+                if values is None:
+                    continue
+                for value in values if isinstance(values, (list, tuple)) else [values]:
+                    key = normalize_value(value)
+                    if key:
+                        doc_ids[facet].setdefault(key, []).append(doc_id)
+                        labels[facet].setdefault(key, str(value).strip())
+            for facet, (read, buckets) in self.range_facets.items():
+                name = bucket_for(read(item), buckets)
+                if name:
+                    doc_ids[facet][name].append(doc_id)
+
+        size = len(items)
+        bitmaps = {facet: {key: to_bitmap(ids, size) for key, ids in keys.items()}
+                   for facet, keys in doc_ids.items()}
+        positions = {id(item): doc_id for doc_id, item in enumerate(items)}
+        # query() unpacks one tuple, so items, positions and bitmaps always come from the same build
+        self._snapshot = (items, positions, bitmaps, labels, (1 << size) - 1)
+
+    def query(self, selected=None, within=None):
+        """(matching items, {facet: {label: count}}).
+
+        selected: {facet: [values]}; values of one facet are ORed, facets are ANDed.
+        within: optional list of items (e.g. text search results) to restrict to.
+        Each facet's counts apply every other facet's selection but not its own,
+        so the client can show what switching or adding a value would give.
+        """
+        items, positions, bitmaps, labels, everything = self._snapshot
+        base = everything
+        if within is not None:
+            base = to_bitmap((positions[id(item)] for item in within if id(item) in positions), len(items))
+
+        selections = {}
+        for facet, values in (selected or {}).items():
+            if facet in bitmaps and values:
+                bitmap = 0
+                for value in values:
+                    bitmap |= bitmaps[facet].get(normalize_value(value), 0)
+                selections[facet] = bitmap
+
+        matches = base
+        for bitmap in selections.values():
+            matches &= bitmap
+
+        counts = {}
+        for facet, values in bitmaps.items():
+            others = base
+            for other, bitmap in selections.items():
+                if other != facet:
+                    others &= bitmap
+            counts[facet] = {labels[facet][key]: (others & bitmap).bit_count() for key, bitmap in values.items()}
+
+        return [items[doc_id] for doc_id in iter_bits(matches)], counts
@@ -0,0 +1,55 @@
+"""
+Concurrent fan-out for upstream opportunity providers
+Runs sources in a shared thread pool with per-source timeouts
+"""
+
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+
+
+class FanOut:
+    """Run several provider calls at once and merge whatever finishes in time.
+
+    A source that raises or misses its timeout is left out of the results
+    and reported in the failures dict, so one slow provider cannot hold up
+    the others. Timed-out calls keep running in the pool and are discarded.
+    """
+
+    def __init__(self, max_workers=8, name='fanout', default_timeout=5.0):
+        self.default_timeout = default_timeout
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=name)
+
+    def run(self, sources, timeouts=None):
+        """Call every source concurrently.
+
+        sources maps a name to a zero-argument callable; timeouts optionally
+        maps a name to its own timeout in seconds. Returns (results, failures)
+        where both dicts are keyed by source name.
+        """
+        timeouts = timeouts or {}
+        started = time.monotonic()
+        futures = {name: self.executor.submit(source) for name, source in sources.items()}
+
+        results = {}
+        failures = {}
+        for name, future in futures.items():
+            deadline = started + timeouts.get(name, self.default_timeout)
+            try:
+                results[name] = future.result(timeout=max(deadline - time.monotonic(), 0))
+            except FutureTimeoutError:
+                future.cancel()
+                failures[name] = 'timeout'
+                print(f"Provider {name} timed out")
+            except Exception as e:
+                failures[name] = str(e)
+                print(f"Provider {name} failed: {e}")
+
+        return results, failures
+
+    def merge(self, sources, timeouts=None):
+        """Run sources and concatenate their list results in source order"""
+        results, failures = self.run(sources, timeouts)
+        merged = []
+        for name in sources:
+            merged.extend(results.get(name) or [])
+        return merged, failures
@@ -0,0 +1,24 @@
+"""
+Gunicorn settings for SmartCareer (picked up automatically by `gunicorn app:app`)
+
+GUNICORN_WORKER_CLASS=sync    one request per worker process (default)
+GUNICORN_WORKER_CLASS=gevent  streaming mode: each request is a greenlet, so open
+                              /chat/stream connections wait on LLM tokens without
+                              pinning a worker; up to GUNICORN_WORKER_CONNECTIONS each
+"""
+
+import os
+
+worker_class = os.environ.get('GUNICORN_WORKER_CLASS', 'sync')
+workers = int(os.environ.get('WEB_CONCURRENCY', '1'))
+worker_connections = int(os.environ.get('GUNICORN_WORKER_CONNECTIONS', '1000'))
+timeout = int(os.environ.get('GUNICORN_TIMEOUT', '30'))
+
+if worker_class == 'gevent':
+    # httpcore (under the openai client) imports trio when it is installed, and trio
+    # needs select.epoll, which gevent's monkey-patching removes. Importing it here,
+    # in the master before workers patch the stdlib, keeps both usable.
+    try:
+        import trio  # noqa: F401
+    except ImportError:
+        pass
@@ -0,0 +1,74 @@
+"""
+Aho–Corasick multi-keyword matcher for the rule-based chatbot
+All keywords are found in one pass over the message; the highest-priority hit wins
+"""
+
+from collections import deque
+
+NO_MATCH = float('inf')
+
+
+class KeywordMatcher:
+    """Automaton built once from (keyword, value) pairs listed in priority order.
+
+    Matching uses plain substring semantics, exactly like `keyword in text`,
+    so 'hi' also matches inside 'this'. Failure links are folded into the
+    transition tables at build time, so a scan is one dict lookup per character.
+    """
+
+    def __init__(self, patterns):
+        self.values = []
+        goto = [{}]
+        best = [NO_MATCH]  # lowest rank of any keyword ending at this state
+
+        for rank, (keyword, value) in enumerate(patterns):
+            self.values.append(value)
+            state = 0
+            for char in keyword:
+                next_state = goto[state].get(char)
+                if next_state is None:
+                    next_state = len(goto)
+                    goto[state][char] = next_state
+                    goto.append({})
+                    best.append(NO_MATCH)
+                state = next_state
+            if keyword:
+                best[state] = min(best[state], rank)
+
+        # Breadth-first: a state's failure target is always finished before the state itself,
+        # so it can copy the target's transitions and inherit the best rank of its suffixes
+        fail = [0] * len(goto)
+        transitions = [dict(goto[0])] + [None] * (len(goto) - 1)
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            transitions[state] = {**transitions[fail[state]], **goto[state]}
+            for char, next_state in goto[state].items():
+                fail[next_state] = transitions[fail[state]].get(char, 0) if state else 0
+                best[next_state] = min(best[next_state], best[fail[next_state]])
+                queue.append(next_state)
+
+        # Dropping transitions back to the root keeps the tables small; a miss means state 0
+        self._transitions = [{char: target for char, target in table.items() if target}
+                             for table in transitions]
+        self._accepting = {state: rank for state, rank in enumerate(best) if rank != NO_MATCH}
+
+    def best_rank(self, text):
+        """Rank of the highest-priority keyword occurring in text, or NO_MATCH"""
+        transitions, accepting = self._transitions, self._accepting
+        state = 0
+        found = NO_MATCH
+        for char in text:
+            state = transitions[state].get(char, 0)
+            if state in accepting:
+                rank = accepting[state]
+                if rank < found:
+                    found = rank
+                    if not rank:
+                        break
+        return found
+
+    def first(self, text, default=None):
+        """Value of the highest-priority keyword occurring in text"""
+        rank = self.best_rank(text)
+        return default if rank == NO_MATCH else self.values[rank]
@@ -0,0 +1,78 @@
+"""
+Process-wide registry of LLM provider clients
+Each client is built once and reused, so its HTTP connection pool stays warm
+"""
+
+import threading
+
+
+class LLMClientRegistry:
+    """Lazily builds one client per provider name, safely across threads"""
+
+    def __init__(self):
+        self._factories = {}
+        self._clients = {}
+        self._lock = threading.Lock()
+
+    def register(self, name, factory):
+        """factory is a zero-argument callable returning the client"""
+        with self._lock:
+            self._factories[name] = factory
+            self._clients.pop(name, None)
+
+    def get(self, name):
+        client = self._clients.get(name)
+        if client is not None:
+            return client
+        with self._lock:
+            client = self._clients.get(name)
+            if client is None:
+                client = self._factories[name]()
+                self._clients[name] = client
+            return client
+
+    def reset(self, name=None):
+        """Drop cached clients so the next get() rebuilds them"""
+        with self._lock:
+            if name is None:
+                self._clients.clear()
+            else:
+                self._clients.pop(name, None)
+
+
+def make_openai_client(api_key, base_url=None, timeout=30.0, max_connections=50):
+    """OpenAI-compatible client (OpenAI, OpenRouter or a local fake) with a pooled httpx transport"""
+    import httpx
+    from openai import OpenAI
+
+    http_client = httpx.Client(
+        timeout=timeout,
+        limits=httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections)
+    )
+    # No SDK retries: the dispatcher already falls back across providers, and a retry would outlive the budget
+    return OpenAI(api_key=api_key, base_url=base_url or None, timeout=timeout, max_retries=0,
+                  http_client=http_client)
+
+
+def call_options(timeout=None):
+    """Per-call options for a deadline in seconds: keyword args for OpenAI's create(), request_options for Gemini"""
+    return {'timeout': timeout} if timeout is not None else {}
+
+
+def sockets_are_cooperative():
+    """True inside a gevent worker, where the socket module is monkey-patched"""
+    try:
+        from gevent import monkey
+    except ImportError:
+        return False
+    return monkey.is_module_patched('socket')
+
+
+def make_gemini_model(api_key, model_name):
+    """Configure the Gemini SDK once and return a reusable GenerativeModel"""
+    import google.generativeai as genai
+
+    # gRPC blocks the whole gevent hub; the REST transport goes through patched sockets
+    transport = 'rest' if sockets_are_cooperative() else None
+    genai.configure(api_key=api_key, transport=transport)
+    return genai.GenerativeModel(model_name)
@@ -0,0 +1,179 @@
+"""
+Hedged dispatch across chat providers under a latency budget
+The next provider starts after a hedge delay (or as soon as one fails); the first good answer wins
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+LATENCY_BUCKETS_MS = (100, 250, 500, 1000, 2500, 5000, 10000)
+
+
+class LatencyHistogram:
+    """Fixed-bucket latency histogram with success/error counts"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.buckets = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+        self.count = 0
+        self.errors = 0
+        self.total_ms = 0.0
+
+    def record(self, latency_ms, ok=True):
+        position = len(LATENCY_BUCKETS_MS)
+        for i, bound in enumerate(LATENCY_BUCKETS_MS):
+            if latency_ms <= bound:
+                position = i
+                break
+        with self._lock:
+            self.buckets[position] += 1
+            self.count += 1
+            self.total_ms += latency_ms
+            if not ok:
+                self.errors += 1
+
+    def snapshot(self):
+        with self._lock:
+            labels = [f"<={bound}ms" for bound in LATENCY_BUCKETS_MS] + [f">{LATENCY_BUCKETS_MS[-1]}ms"]
+            return {
+                'count': self.count,
+                'errors': self.errors,
+                'avg_ms': round(self.total_ms / self.count, 1) if self.count else None,
+                'buckets': dict(zip(labels, self.buckets))
+            }
+
+
+class HedgedDispatcher:
+    """Race chat providers in priority order.
+
+    Provider i+1 is started when provider i has not answered within the
+    hedge delay, or immediately when it fails. The first non-empty answer
+    is returned; anything still running is abandoned (its result is
+    ignored). If nothing answers within the budget, (None, None) is
+    returned so the caller can fall back to the rule-based engine.
+
+    Providers are called as provider(message, timeout) with the time left
+    in the budget, and must pass it on to their client, so an abandoned
+    call gives its pool thread back when the budget runs out.
+
+    With a breaker_factory, every provider gets a circuit breaker and a
+    provider whose breaker is open is skipped without being called.
+    """
+
+    def __init__(self, hedge_delay=2.0, budget=10.0, max_workers=16, breaker_factory=None):
+        self.hedge_delay = hedge_delay
+        self.budget = budget
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='llm')
+        self.breaker_factory = breaker_factory
+        self.histograms = {}
+        self.breakers = {}
+        self._lock = threading.Lock()
+
+    def histogram(self, name):
+        with self._lock:
+            if name not in self.histograms:
+                self.histograms[name] = LatencyHistogram()
+            return self.histograms[name]
+
+    def breaker(self, name):
+        if self.breaker_factory is None:
+            return None
+        with self._lock:
+            if name not in self.breakers:
+                self.breakers[name] = self.breaker_factory(name)
+            return self.breakers[name]
+
+    def allow(self, name):
+        """A ticket for record() when the provider may be called, None when its breaker is open"""
+        breaker = self.breaker(name)
+        return True if breaker is None else breaker.allow()
+
+    def record(self, name, latency_ms, ok, ticket=True):
+        """Feed one call outcome to the provider's histogram and, under its ticket, its breaker"""
+        self.histogram(name).record(latency_ms, ok=ok)
+        breaker = self.breaker(name)
+        if breaker is not None:
+            breaker.record(latency_ms, ok, ticket)
+
+    def release(self, name, ticket):
+        """Return the ticket of a call that was cancelled before it started"""
+        breaker = self.breaker(name)
+        if breaker is not None:
+            breaker.release(ticket)
+
+    def _abandon(self, running):
+        """Cancel calls still queued for a pool thread; ones already running finish under their timeout"""
+        for future, (name, ticket) in running.items():
+            if future.cancel():
+                self.release(name, ticket)
+
+    def _call(self, name, provider, message, timeout, ticket):
+        started = time.perf_counter()
+        try:
+            response = provider(message, timeout)
+        except Exception as e:
+            self.record(name, (time.perf_counter() - started) * 1000, ok=False, ticket=ticket)
+            print(f"{name} provider error: {e}")
+            raise
+        self.record(name, (time.perf_counter() - started) * 1000, ok=bool(response), ticket=ticket)
+        return response
+
+    def dispatch(self, providers, message, budget=None):
+        """providers is an ordered list of (name, callable(message, timeout)) pairs"""
+        deadline = time.monotonic() + (self.budget if budget is None else budget)
+        queue = list(providers)
+        running = {}
+
+        def launch():
+            # Breakers are consulted only at launch; a launch cancelled before it runs hands its ticket back
+            while queue:
+                name, provider = queue.pop(0)
+                ticket = self.allow(name)
+                if ticket:
+                    timeout = max(deadline - time.monotonic(), 0.001)
+                    future = self.executor.submit(self._call, name, provider, message, timeout, ticket)
+                    running[future] = (name, ticket)
+                    return
+                print(f"Skipping {name}: circuit open")
+
+        launch()
+        next_hedge = time.monotonic() + self.hedge_delay
+
+        while running:
+            now = time.monotonic()
+            if now >= deadline:
+                break
+            timeout = deadline - now
+            if queue:
+                timeout = min(timeout, max(next_hedge - now, 0))
+
+            done, _ = wait(list(running), timeout=timeout, return_when=FIRST_COMPLETED)
+
+            for future in done:
+                name, _ = running.pop(future)
+                try:
+                    response = future.result()
+                except Exception:
+                    response = None
+                if response:
+                    self._abandon(running)
+                    return name, response
+
+            # Hedge: start the next provider on a failure or once the delay has passed
+            if queue and (done or time.monotonic() >= next_hedge):
+                launch()
+                next_hedge = time.monotonic() + self.hedge_delay
+
+        self._abandon(running)
+        return None, None
+
+    def stats(self):
+        with self._lock:
+            names = list(self.histograms)
+        return {name: self.histogram(name).snapshot() for name in names}
+
+    def breaker_states(self):
+        with self._lock:
+            breakers = dict(self.breakers)
+        return {name: breaker.snapshot() for name, breaker in breakers.items()}
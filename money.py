@@ -0,0 +1,95 @@
+"""
+Parsing of the free-text money and percentage strings used across SmartCareer
+'₹10,000 - ₹15,000 per month' -> (120000, 180000) INR per year, '+35%' -> 35.0
+Parsed once when data is loaded and stored next to the display string, so sorts and range filters compare numbers
+"""
+
+import re
+
+LAKH = 100000
+CRORE = 10000000
+
+UNIT_MULTIPLIERS = {
+    'cr': CRORE, 'crore': CRORE, 'crores': CRORE,
+    'lpa': LAKH, 'lakh': LAKH, 'lakhs': LAKH, 'lac': LAKH, 'lacs': LAKH, 'l': LAKH,
+    'k': 1000
+}
+AMOUNT = re.compile(r'(\d[\d,]*(?:\.\d+)?)\s*(crores?|cr|lpa|lakhs?|lacs?|l|k)?\b', re.IGNORECASE)
+PERCENT = re.compile(r'([+-]?\d+(?:\.\d+)?)\s*%')
+
+# '(2-year MBA)' is a total over several years; it is removed before amounts are read
+MULTI_YEAR = re.compile(r'\(?\b(\d+)[- ]years?\b[^)+]*\)?', re.IGNORECASE)
+PER_PERIOD = [
+    (re.compile(r'/\s*month|\bper\s+month|\bmonthly\b|\bp\.?m\.?\b|/\s*mo\b', re.IGNORECASE), 12),
+    (re.compile(r'/\s*week|\bper\s+week|\bweekly\b', re.IGNORECASE), 52),
+    (re.compile(r'/\s*day|\bper\s+day|\bdaily\b', re.IGNORECASE), 365)
+]
+UP_TO = re.compile(r'\bup\s*to\b|\bupto\b|\bmax(?:imum)?\b', re.IGNORECASE)
+FOREIGN_CURRENCY = re.compile(r'[$€£]|\b(?:usd|eur|gbp)\b', re.IGNORECASE)
+
+
+def _part_range(text):
+    """(min, max) INR per year for one '+'-free piece of text, or None"""
+    per_year = 1
+    multi_year = MULTI_YEAR.search(text)
+    if multi_year:
+        per_year = 1 / max(int(multi_year.group(1)), 1)
+        text = MULTI_YEAR.sub(' ', text)
+    else:
+        for pattern, periods in PER_PERIOD:
+            if pattern.search(text):
+                per_year = periods
+                break
+
+    amounts = AMOUNT.findall(text)[:2]
+    if not amounts:
+        return None
+    # '₹4-8 LPA': the unit written after the upper bound applies to both
+    units = [unit.lower() for _, unit in amounts]
+    shared_unit = units[-1]
+    values = [float(number.replace(',', '')) * UNIT_MULTIPLIERS.get(unit or shared_unit, 1)
+              for (number, _), unit in zip(amounts, units)]
+
+    low, high = min(values) * per_year, max(values) * per_year
+    if UP_TO.search(text):
+        low = 0
+    return low, high
+
+
+def parse_inr_range(value):
+    """(min, max) rupees per year from a display string, or (None, None).
+
+    Handles units (LPA, Lakh, Cr, K), ranges ('₹4-8 LPA'), periods (per month,
+    /year, per annum, '(2-year MBA)'), 'Up to' and '+'-joined components.
+    Amounts in other currencies are not converted and give (None, None).
+    """
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return value, value
+    if not isinstance(value, str) or FOREIGN_CURRENCY.search(value):
+        return None, None
+
+    parts = [_part_range(part) for part in value.split('+')]
+    parts = [part for part in parts if part]
+    if not parts:
+        return None, None
+    return round(sum(low for low, _ in parts)), round(sum(high for _, high in parts))
+
+
+def parse_percent(value):
+    """'2.5%' -> 2.5, '+35%' -> 35.0, or None"""
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return float(value)
+    match = PERCENT.search(value) if isinstance(value, str) else None
+    return float(match.group(1)) if match else None
+
+
+def normalize_records(records, money_fields=(), percent_fields=()):
+    """Add <field>_min_inr / <field>_max_inr and <field>_pct next to each display field, in place"""
+    for record in records:
+        for field in money_fields:
+            if field in record:
+                record[f'{field}_min_inr'], record[f'{field}_max_inr'] = parse_inr_range(record[field])
+        for field in percent_fields:
+            if field in record:
+                record[f'{field}_pct'] = parse_percent(record[field])
+    return records
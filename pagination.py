@@ -0,0 +1,90 @@
+"""
+Pagination, field projection and NDJSON streaming for list endpoints
+Works on groups of cached lists, e.g. {'scholarships': [...], 'jobs': [...]}
+"""
+
+import base64
+import json
+
+MAX_PAGE_SIZE = 500
+
+
+def parse_fields(value):
+    """'id,title' -> ['id', 'title']; empty means every field"""
+    fields = [field.strip() for field in (value or '').split(',') if field.strip()]
+    return fields or None
+
+
+def parse_limit(value):
+    """Per-group page size, capped at MAX_PAGE_SIZE; None means no limit"""
+    if value in (None, ''):
+        return None
+    try:
+        limit = int(value)
+    except (TypeError, ValueError):
+        raise ValueError('Invalid limit')
+    if limit < 1:
+        raise ValueError('Invalid limit')
+    return min(limit, MAX_PAGE_SIZE)
+
+
+def project(item, fields):
+    """Keep only the requested fields of a record"""
+    if not fields:
+        return item
+    return {field: item[field] for field in fields if field in item}
+
+
+def encode_cursor(offsets):
+    """Opaque cursor holding the next offset of every group"""
+    raw = json.dumps(offsets, separators=(',', ':')).encode('utf-8')
+    return base64.urlsafe_b64encode(raw).decode('ascii').rstrip('=')
+
+
+def decode_cursor(cursor):
+    """Inverse of encode_cursor; raises ValueError on anything malformed"""
+    if not cursor:
+        return {}
+    try:
+        raw = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4))
+        offsets = json.loads(raw)
+    except Exception:
+        raise ValueError('Invalid cursor')
+    if not isinstance(offsets, dict) or not all(
+            isinstance(offset, int) and offset >= 0 for offset in offsets.values()):
+        raise ValueError('Invalid cursor')
+    return offsets
+
+
+def page_bounds(groups, limit, offsets):
+    """Slice bounds per group plus the cursor for the following page"""
+    bounds = {}
+    next_offsets = {}
+    for name, items in groups.items():
+        start = min(offsets.get(name, 0), len(items))
+        end = len(items) if limit is None else min(start + limit, len(items))
+        bounds[name] = (start, end)
+        next_offsets[name] = end
+
+    has_more = any(end < len(groups[name]) for name, (_, end) in bounds.items())
+    return bounds, encode_cursor(next_offsets) if has_more else None
+
+
+def paginate(groups, limit=None, offsets=None, fields=None):
+    """One page of every group as lists, plus the next cursor"""
+    bounds, next_cursor = page_bounds(groups, limit, offsets or {})
+    pages = {
+        name: [project(item, fields) for item in groups[name][start:end]]
+        for name, (start, end) in bounds.items()
+    }
+    return pages, next_cursor
+
+
+def iter_ndjson(groups, limit=None, offsets=None, fields=None):
+    """Yield one JSON line per record without building the whole document"""
+    bounds, _ = page_bounds(groups, limit, offsets or {})
+    for name, (start, end) in bounds.items():
+        items = groups[name]
+        for position in range(start, end):
+            record = {'type': name, 'data': project(items[position], fields)}
+            yield json.dumps(record, separators=(',', ':')) + '\n'
@@ -0,0 +1,63 @@
+"""
+Pre-serialized JSON responses for the hot opportunity endpoints
+Body bytes, compressed variants and a strong ETag per variant are built once per cache refresh
+"""
+
+import gzip
+import hashlib
+import json
+
+from flask import Response
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+
+class PreparedResponse:
+    """A JSON payload serialized once and served many times"""
+
+    def __init__(self, payload):
+        # Same output as jsonify in production mode (sorted keys, compact)
+        self.body = json.dumps(payload, sort_keys=True, separators=(',', ':')).encode('utf-8')
+        self.etag = hashlib.sha256(self.body).hexdigest()[:32]
+
+        # Keep only the encodings that actually save bytes
+        self.encoded = {}
+        gzip_body = gzip.compress(self.body, compresslevel=6, mtime=0)
+        if len(gzip_body) < len(self.body):
+            self.encoded['gzip'] = gzip_body
+        if brotli is not None:
+            br_body = brotli.compress(self.body)
+            if len(br_body) < len(self.body):
+                self.encoded['br'] = br_body
+
+        # Strong validators must differ whenever the bytes do, so each encoding gets its own
+        self.etags = {None: self.etag}
+        self.etags.update({encoding: f"{self.etag}-{encoding}" for encoding in self.encoded})
+
+    def to_response(self, request):
+        """Serve the stored bytes, or 304 when the client already has them in any encoding"""
+        headers = {
+            'Cache-Control': 'no-cache',
+            'Vary': 'Accept-Encoding'
+        }
+
+        encoding = None
+        for candidate in ('br', 'gzip'):
+            if candidate in self.encoded and request.accept_encodings[candidate]:
+                encoding = candidate
+                break
+        etag = self.etags[encoding]
+
+        if any(request.if_none_match.contains(known) for known in self.etags.values()):
+            response = Response(status=304, headers=headers)
+            response.set_etag(etag)
+            return response
+
+        if encoding:
+            headers['Content-Encoding'] = encoding
+        response = Response(self.encoded.get(encoding, self.body), mimetype='application/json', headers=headers)
+        response.set_etag(etag)
+        return response
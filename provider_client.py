@@ -0,0 +1,132 @@
+"""
+Shared HTTP transport for the scholarship/internship/job provider APIs
+Keep-alive pooling, bounded jittered retries and conditional GETs
+"""
+
+import random
+import threading
+import time
+
+import requests
+from requests.adapters import HTTPAdapter
+
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+
+class ProviderClient:
+    """One pooled requests.Session shared by every fetch_* function.
+
+    Responses carrying an ETag or Last-Modified header are remembered per
+    URL, so the next refresh sends If-None-Match / If-Modified-Since and a
+    304 reuses the cached body instead of downloading it again.
+    """
+
+    def __init__(self, pool_size=10, max_retries=3, backoff=0.5, max_backoff=8.0, timeout=5.0, budget=None):
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.timeout = timeout
+        # Seconds one get_json may take across all attempts and backoff; None leaves it unbounded
+        self.budget = budget
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=0)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        self.session.headers.update({
+            'Accept': 'application/json',
+            'Accept-Encoding': 'gzip, deflate',
+            'User-Agent': 'SmartCareer/1.0'
+        })
+
+        self._validators = {}
+        self._lock = threading.Lock()
+
+    def _sleep_before_retry(self, attempt, response=None, deadline=None):
+        """Full-jitter exponential backoff, honouring Retry-After when given; False if it would pass the deadline"""
+        delay = random.uniform(0, min(self.max_backoff, self.backoff * (2 ** attempt)))
+        if response is not None:
+            retry_after = response.headers.get('Retry-After', '')
+            if retry_after.isdigit():
+                delay = min(float(retry_after), self.max_backoff)
+        if deadline is not None and time.monotonic() + delay >= deadline:
+            return False
+        time.sleep(delay)
+        return True
+
+    def get_json(self, url, api_key='', params=None, timeout=None, budget=None):
+        """GET a JSON document with retries and conditional revalidation.
+
+        timeout bounds each attempt, budget (default self.budget) all of them
+        together, so no retry runs on after the caller has stopped waiting.
+        """
+        headers = {}
+        if api_key:
+            headers['Authorization'] = f"Bearer {api_key}"
+
+        # Validators are only ever sent alongside a cached payload for this exact request
+        key = (url, tuple(sorted((params or {}).items())))
+        with self._lock:
+            cached = self._validators.get(key)
+        if cached:
+            if cached.get('etag'):
+                headers['If-None-Match'] = cached['etag']
+            if cached.get('last_modified'):
+                headers['If-Modified-Since'] = cached['last_modified']
+
+        budget = budget or self.budget
+        deadline = time.monotonic() + budget if budget else None
+        last_error = None
+        for attempt in range(self.max_retries + 1):
+            attempt_timeout = timeout or self.timeout
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                attempt_timeout = min(attempt_timeout, remaining)
+            response = None
+            try:
+                response = self.session.get(url, headers=headers, params=params, timeout=attempt_timeout)
+                if response.status_code == 304:
+                    if cached:
+                        return cached['payload']
+                    # Nothing to revalidate against (e.g. a caching proxy answered): fetch the body
+                    headers['Cache-Control'] = 'no-cache'
+                    last_error = requests.HTTPError(f"304 without a cached copy from {url}", response=response)
+                    continue
+                if response.status_code not in RETRY_STATUSES:
+                    response.raise_for_status()
+                    payload = response.json()
+                    self._remember(key, response, payload)
+                    return payload
+                last_error = requests.HTTPError(f"{response.status_code} from {url}", response=response)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                last_error = e
+
+            if attempt < self.max_retries and not self._sleep_before_retry(attempt, response, deadline):
+                break
+
+        raise last_error or requests.Timeout(f"No time left to fetch {url}")
+
+    def _remember(self, key, response, payload):
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+        if not etag and not last_modified:
+            return
+        with self._lock:
+            self._validators[key] = {
+                'etag': etag,
+                'last_modified': last_modified,
+                'payload': payload
+            }
+
+
+def extract_items(payload):
+    """Provider responses are either a bare list or wrap it in data/results"""
+    if isinstance(payload, list):
+        return payload
+    if isinstance(payload, dict):
+        for key in ('data', 'results', 'items'):
+            if isinstance(payload.get(key), list):
+                return payload[key]
+    return []
@@ -0,0 +1,87 @@
+"""
+Stale-while-revalidate refresh scheduler for the opportunity caches
+Runs at most one refresh per cache at a time (single-flight)
+"""
+
+import threading
+import time
+from datetime import datetime
+
+
+class RefreshScheduler:
+    """Coordinates cache refreshes so only one runs per cache name.
+
+    Callers that trip an expired TTL kick off a background refresh and
+    keep serving the stale data; callers with a cold (empty) cache wait
+    for whichever refresh is already in flight instead of starting another.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._inflight = {}
+        self.stats = {}
+
+    def trigger(self, name, refresh, wait=False):
+        """Start a refresh unless one is already running.
+
+        Returns True if this call started the refresh. With wait=True the
+        call blocks until the (new or in-flight) refresh has finished.
+        """
+        with self._lock:
+            done = self._inflight.get(name)
+            leader = done is None
+            if leader:
+                done = threading.Event()
+                self._inflight[name] = done
+
+        if leader:
+            if wait:
+                self._run(name, refresh, done)
+            else:
+                threading.Thread(
+                    target=self._run,
+                    args=(name, refresh, done),
+                    name=f"refresh-{name}",
+                    daemon=True
+                ).start()
+        elif wait:
+            done.wait()
+
+        return leader
+
+    def _run(self, name, refresh, done):
+        started = time.perf_counter()
+        error = None
+        try:
+            refresh()
+        except Exception as e:
+            print(f"Error refreshing {name} cache: {e}")
+            error = str(e)
+        finally:
+            duration_ms = round((time.perf_counter() - started) * 1000, 2)
+            with self._lock:
+                self.stats[name] = {
+                    'last_refresh_duration_ms': duration_ms,
+                    'last_refresh_finished': datetime.now().isoformat(),
+                    'last_error': error
+                }
+                del self._inflight[name]
+            done.set()
+
+    def status(self, name, last_updated):
+        """Age and refresh timings for one cache"""
+        age_seconds = None
+        if last_updated:
+            age_seconds = round((datetime.now() - datetime.fromisoformat(last_updated)).total_seconds(), 1)
+
+        with self._lock:
+            stats = dict(self.stats.get(name, {}))
+            refreshing = name in self._inflight
+
+        return {
+            'age_seconds': age_seconds,
+            'refreshing': refreshing,
+            'last_refresh_duration_ms': stats.get('last_refresh_duration_ms'),
+            'last_refresh_finished': stats.get('last_refresh_finished'),
+            'last_error': stats.get('last_error')
+        }
@@ -0,0 +1,142 @@
+"""
+LRU/TTL cache for chatbot answers
+Keys are normalized messages so trivially different phrasings share an entry
+"""
+
+import atexit
+import json
+import os
+import re
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+
+PUNCTUATION = re.compile(r'[^\w\s]')
+# Symbols that name different things ('c++', 'c#', '.net') become words before punctuation goes
+SYMBOL_WORDS = [
+    (re.compile(r'(?<=\w)\+\+'), 'pp'),
+    (re.compile(r'(?<=\w)#'), 'sharp'),
+    (re.compile(r'(?<!\w)\.(?=net\b)'), 'dot')
+]
+WHITESPACE = re.compile(r'\s+')
+
+
+def stem(word):
+    """Very small suffix stripper: 'careers' -> 'career', 'studies' -> 'study'"""
+    if len(word) <= 4:
+        return word
+    if word.endswith('ies'):
+        return word[:-3] + 'y'
+    if word.endswith('ing') and len(word) > 5:
+        return word[:-3]
+    if word.endswith('ed') and len(word) > 4:
+        return word[:-2]
+    if word.endswith(('ches', 'shes', 'sses', 'xes')):
+        return word[:-2]
+    if word.endswith('s') and not word.endswith('ss'):
+        return word[:-1]
+    return word
+
+
+def normalize_message(message):
+    """Case-fold, spell out c++/c#/.net, drop other punctuation, collapse whitespace and stem each word"""
+    text = (message or '').casefold()
+    for pattern, word in SYMBOL_WORDS:
+        text = pattern.sub(word, text)
+    text = PUNCTUATION.sub(' ', text)
+    return ' '.join(stem(word) for word in WHITESPACE.split(text.strip()) if word)
+
+
+class ResponseCache:
+    """Thread-safe LRU cache with per-entry expiry and optional JSON persistence"""
+
+    def __init__(self, max_entries=1000, ttl_seconds=86400, persist_path='', save_every=50):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.persist_path = persist_path
+        self.save_every = save_every
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._unsaved = 0
+
+        if persist_path:
+            self._load()
+            atexit.register(self.save)
+
+    def get(self, message):
+        key = normalize_message(message)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[1] <= time.time():
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, message, response):
+        key = normalize_message(message)
+        if not key:
+            return
+        with self._lock:
+            self._entries[key] = (response, time.time() + self.ttl_seconds)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+            self._unsaved += 1
+            should_save = self.persist_path and self._unsaved >= self.save_every
+        if should_save:
+            self.save()
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'entries': len(self._entries),
+                'max_entries': self.max_entries,
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': round(self.hits / lookups, 3) if lookups else 0.0
+            }
+
+    def save(self):
+        """Write live entries to persist_path atomically"""
+        if not self.persist_path:
+            return
+        with self._lock:
+            now = time.time()
+            entries = [[key, response, expires] for key, (response, expires) in self._entries.items()
+                       if expires > now]
+            self._unsaved = 0
+        # A temp file per writer, so concurrent threads and workers never rename each other's half-written file
+        directory, name = os.path.split(os.path.abspath(self.persist_path))
+        tmp_path = None
+        try:
+            with tempfile.NamedTemporaryFile('w', encoding='utf-8', dir=directory, prefix=f"{name}.",
+                                             suffix='.tmp', delete=False) as f:
+                tmp_path = f.name
+                json.dump(entries, f, ensure_ascii=False)
+            os.replace(tmp_path, self.persist_path)
+        except OSError as e:
+            print(f"Could not save chat cache: {e}")
+            if tmp_path and os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    def _load(self):
+        try:
+            with open(self.persist_path, encoding='utf-8') as f:
+                entries = json.load(f)
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            print(f"Could not load chat cache: {e}")
+            return
+        now = time.time()
+        for key, response, expires in entries[-self.max_entries:]:
+            if expires > now:
+                self._entries[key] = (response, expires)
@@ -0,0 +1,91 @@
+"""
+In-process inverted index for opportunity search
+Tokenized, case-folded posting lists with prefix matching
+"""
+
+import re
+from bisect import bisect_left
+
+TOKEN_PATTERN = re.compile(r'\w+')
+
+
+def tokenize(text):
+    """Split text into case-folded word tokens"""
+    if not text:
+        return []
+    if isinstance(text, (list, tuple)):
+        text = ' '.join(str(part) for part in text)
+    return TOKEN_PATTERN.findall(str(text).casefold())
+
+
+class InvertedIndex:
+    """Inverted index over a list of dicts.
+
+    Documents are identified by their position in the indexed list, so
+    posting lists are sorted and search results keep the list order.
+    """
+
+    def __init__(self, text_fields, location_field):
+        self.text_fields = text_fields
+        self.location_field = location_field
+        # (items, vocabulary, postings, location_vocabulary, location_postings)
+        self._snapshot = ([], [], {}, [], {})
+
+    def build(self, items):
+        """Rebuild the index from scratch for a fresh cache snapshot"""
+        postings = {}
+        location_postings = {}
+
+        for doc_id, item in enumerate(items):
+            for field in self.text_fields:
+                for token in tokenize(item.get(field, '')):
+                    postings.setdefault(token, set()).add(doc_id)
+            for token in tokenize(item.get(self.location_field, '')):
+                location_postings.setdefault(token, set()).add(doc_id)
+
+        postings = {token: sorted(ids) for token, ids in postings.items()}
+        location_postings = {token: sorted(ids) for token, ids in location_postings.items()}
+
+        # Swap in a single snapshot so concurrent readers never see a half-built index
+        self._snapshot = (list(items), sorted(postings), postings,
+                          sorted(location_postings), location_postings)
+
+    @property
+    def items(self):
+        return self._snapshot[0]
+
+    def _prefix_matches(self, prefix, vocabulary, postings):
+        """Union of posting lists for every token starting with prefix"""
+        matches = set()
+        position = bisect_left(vocabulary, prefix)
+        while position < len(vocabulary) and vocabulary[position].startswith(prefix):
+            matches.update(postings[vocabulary[position]])
+            position += 1
+        return matches
+
+    def _intersect(self, terms, vocabulary, postings, candidates):
+        """Intersect prefix posting lists, longest (most selective) terms first"""
+        for term in sorted(set(terms), key=len, reverse=True):
+            matches = self._prefix_matches(term, vocabulary, postings)
+            candidates = matches if candidates is None else candidates & matches
+            if not candidates:
+                return set()
+        return candidates
+
+    def search(self, query='', location=''):
+        """Return items matching every query and location term (by prefix)"""
+        items, vocabulary, postings, location_vocabulary, location_postings = self._snapshot
+        candidates = None
+
+        query_terms = tokenize(query)
+        if query_terms:
+            candidates = self._intersect(query_terms, vocabulary, postings, candidates)
+
+        location_terms = tokenize(location)
+        if location_terms:
+            candidates = self._intersect(location_terms, location_vocabulary,
+                                         location_postings, candidates)
+
+        if candidates is None:
+            return list(items)
+        return [items[doc_id] for doc_id in sorted(candidates)]
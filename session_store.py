@@ -0,0 +1,178 @@
+"""
+Server-side Flask sessions
+The cookie carries only an opaque session id; the data lives in SQLite or Redis and is loaded on first use
+"""
+
+import itertools
+import re
+import secrets
+import time
+
+from flask.json.tag import TaggedJSONSerializer
+from flask.sessions import SessionInterface, SessionMixin
+
+from storage import ThreadConnections, migrate
+
+SESSION_ID = re.compile(r'^[A-Za-z0-9_-]{43}$')  # secrets.token_urlsafe(32)
+PURGE_EVERY = 500
+
+
+class SQLiteSessionStore:
+    """Session payloads in the sessions table of the storage database, shared by all workers"""
+
+    def __init__(self, path):
+        self.path = path
+        self._connections = ThreadConnections(path)
+        self._saves = itertools.count(1)
+        migrate(self._connection())
+
+    def _connection(self):
+        return self._connections.get()
+
+    def load(self, sid):
+        row = self._connection().execute(
+            "SELECT data FROM sessions WHERE id = ? AND expires > ?", (sid, time.time())).fetchone()
+        return row[0] if row else None
+
+    def save(self, sid, data, ttl_seconds):
+        conn = self._connection()
+        now = time.time()
+        conn.execute("INSERT OR REPLACE INTO sessions (id, data, expires) VALUES (?, ?, ?)",
+                     (sid, data, now + ttl_seconds))
+        if next(self._saves) % PURGE_EVERY == 0:
+            conn.execute("DELETE FROM sessions WHERE expires <= ?", (now,))
+
+    def delete(self, sid):
+        self._connection().execute("DELETE FROM sessions WHERE id = ?", (sid,))
+
+
+class RedisSessionStore:
+    """Session payloads as expiring Redis keys (works with cache_backend.LocalRedis too)"""
+
+    def __init__(self, client, prefix='smartcareer:session:'):
+        self.client = client
+        self.prefix = prefix
+
+    def load(self, sid):
+        value = self.client.get(f"{self.prefix}{sid}")
+        return value.decode('utf-8') if isinstance(value, bytes) else value
+
+    def save(self, sid, data, ttl_seconds):
+        self.client.set(f"{self.prefix}{sid}", data, ex=max(int(ttl_seconds), 1))
+
+    def delete(self, sid):
+        self.client.delete(f"{self.prefix}{sid}")
+
+
+class ServerSideSession(SessionMixin):
+    """Session whose data is fetched from the store the first time it is read or written"""
+
+    def __init__(self, store, serializer, sid, new=False):
+        self.store = store
+        self.serializer = serializer
+        self.sid = sid
+        self.new = new
+        self.modified = False
+        self.accessed = False
+        self.replaced_sid = None
+        self._data = {} if new else None
+
+    @property
+    def loaded(self):
+        return self._data is not None
+
+    def _load(self):
+        self.accessed = True
+        if self._data is None:
+            payload = self.store.load(self.sid)
+            if payload is None:
+                # Never adopt an id the store did not issue (or has expired): data saved now gets a fresh one
+                self.sid = secrets.token_urlsafe(32)
+                self.new = True
+            try:
+                self._data = self.serializer.loads(payload) if payload else {}
+            except ValueError:
+                self._data = {}
+        return self._data
+
+    def __getitem__(self, key):
+        return self._load()[key]
+
+    def __setitem__(self, key, value):
+        self._load()[key] = value
+        self.modified = True
+
+    def __delitem__(self, key):
+        del self._load()[key]
+        self.modified = True
+
+    def __iter__(self):
+        return iter(self._load())
+
+    def __len__(self):
+        return len(self._load())
+
+    def rotate(self):
+        """Move the data to a fresh id (call on login so a planted id cannot be reused)"""
+        self._load()
+        if not self.new:
+            self.replaced_sid = self.sid
+        self.sid = secrets.token_urlsafe(32)
+        self.modified = True
+
+
+class ServerSideSessionInterface(SessionInterface):
+    """Flask session interface backed by a SQLiteSessionStore or RedisSessionStore"""
+
+    serializer = TaggedJSONSerializer()
+
+    def __init__(self, store):
+        self.store = store
+
+    def open_session(self, app, request):
+        sid = request.cookies.get(self.get_cookie_name(app), '')
+        if SESSION_ID.match(sid):
+            return ServerSideSession(self.store, self.serializer, sid)
+        return ServerSideSession(self.store, self.serializer, secrets.token_urlsafe(32), new=True)
+
+    def save_session(self, app, session, response):
+        if session.accessed:
+            response.vary.add('Cookie')
+        if not session.loaded:
+            return
+
+        name = self.get_cookie_name(app)
+        domain = self.get_cookie_domain(app)
+        path = self.get_cookie_path(app)
+        secure = self.get_cookie_secure(app)
+        samesite = self.get_cookie_samesite(app)
+        httponly = self.get_cookie_httponly(app)
+
+        if session.replaced_sid:
+            self.store.delete(session.replaced_sid)
+
+        if not session:
+            if session.modified and not session.new:
+                self.store.delete(session.sid)
+                response.delete_cookie(name, domain=domain, path=path, secure=secure,
+                                       samesite=samesite, httponly=httponly)
+            return
+
+        if not session.modified:
+            return
+
+        ttl_seconds = app.permanent_session_lifetime.total_seconds()
+        self.store.save(session.sid, self.serializer.dumps(dict(session)), ttl_seconds)
+        response.set_cookie(name, session.sid, expires=self.get_expiration_time(app, session),
+                            domain=domain, path=path, secure=secure, samesite=samesite, httponly=httponly)
+
+
+def make_session_interface(kind, path, redis_url=''):
+    """Session interface selected by SESSION_BACKEND; None keeps Flask's signed-cookie sessions"""
+    kind = (kind or 'sqlite').lower()
+    if kind == 'cookie':
+        return None
+    if kind == 'redis':
+        from cache_backend import make_redis_client
+        return ServerSideSessionInterface(RedisSessionStore(make_redis_client(redis_url)))
+    return ServerSideSessionInterface(SQLiteSessionStore(path))
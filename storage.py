@@ -0,0 +1,234 @@
+"""
+Persistent storage for users, quiz results, chat history and progress
+One SQLite file in WAL mode, shared by every gunicorn worker, with numbered schema migrations
+"""
+
+import itertools
+import json
+import sqlite3
+import threading
+import time
+from datetime import datetime
+
+# Each migration is a list of statements; PRAGMA user_version records how many have run
+MIGRATIONS = [
+    [
+        """CREATE TABLE users (
+            email TEXT PRIMARY KEY,
+            name TEXT NOT NULL,
+            password_hash TEXT NOT NULL,
+            created_at TEXT NOT NULL)""",
+        """CREATE TABLE quiz_results (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            user_email TEXT NOT NULL,
+            answers TEXT NOT NULL,
+            recommendations TEXT NOT NULL,
+            created_at TEXT NOT NULL)""",
+        "CREATE INDEX idx_quiz_results_user ON quiz_results (user_email, id)",
+        """CREATE TABLE chat_history (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            chat_id TEXT NOT NULL,
+            user_email TEXT,
+            message TEXT NOT NULL,
+            response TEXT NOT NULL,
+            created REAL NOT NULL,
+            created_at TEXT NOT NULL)""",
+        "CREATE INDEX idx_chat_history_chat ON chat_history (chat_id, id)",
+        "CREATE INDEX idx_chat_history_user ON chat_history (user_email)",
+        "CREATE INDEX idx_chat_history_created ON chat_history (created)",
+        """CREATE TABLE progress (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            user_email TEXT NOT NULL,
+            data TEXT NOT NULL,
+            created_at TEXT NOT NULL)""",
+        "CREATE INDEX idx_progress_user ON progress (user_email, id)"
+    ],
+    [
+        # Server-side sessions (session_store.SQLiteSessionStore); older files may already have the table
+        """CREATE TABLE IF NOT EXISTS sessions (
+            id TEXT PRIMARY KEY,
+            data TEXT NOT NULL,
+            expires REAL NOT NULL)""",
+        "CREATE INDEX idx_sessions_expires ON sessions (expires)"
+    ]
+]
+
+NO_CURSOR = 2 ** 63 - 1  # larger than any rowid
+
+# Statements are fixed strings with placeholders, so each connection's statement cache reuses the compiled query
+INSERT_USER = "INSERT INTO users (email, name, password_hash, created_at) VALUES (?, ?, ?, ?)"
+SELECT_USER = "SELECT email, name, password_hash, created_at FROM users WHERE email = ?"
+INSERT_QUIZ_RESULT = ("INSERT INTO quiz_results (user_email, answers, recommendations, created_at) "
+                      "VALUES (?, ?, ?, ?)")
+SELECT_QUIZ_HISTORY = ("SELECT id, answers, recommendations, created_at FROM quiz_results "
+                       "WHERE user_email = ? AND id < ? ORDER BY id DESC LIMIT ?")
+COUNT_QUIZ_RESULTS = "SELECT COUNT(*) FROM quiz_results WHERE user_email = ?"
+INSERT_CHAT_TURN = ("INSERT INTO chat_history (chat_id, user_email, message, response, created, created_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?)")
+SELECT_RECENT_CHAT = ("SELECT message, response, created_at, user_email FROM chat_history "
+                      "WHERE chat_id = ? AND created >= ? ORDER BY id DESC LIMIT ?")
+DELETE_OLD_CHAT = "DELETE FROM chat_history WHERE created < ?"
+# Keep the newest N turns of one conversation / of all conversations; both walk an index from the newest row
+TRIM_CHAT = ("DELETE FROM chat_history WHERE chat_id = ? AND id <= "
+             "(SELECT id FROM chat_history WHERE chat_id = ? ORDER BY id DESC LIMIT 1 OFFSET ?)")
+TRIM_ALL_CHAT = ("DELETE FROM chat_history WHERE id <= "
+                 "(SELECT id FROM chat_history ORDER BY id DESC LIMIT 1 OFFSET ?)")
+INSERT_PROGRESS = "INSERT INTO progress (user_email, data, created_at) VALUES (?, ?, ?)"
+SELECT_PROGRESS = "SELECT data, created_at FROM progress WHERE user_email = ? ORDER BY id"
+
+CHAT_PURGE_EVERY = 500
+
+
+class ThreadConnections:
+    """One autocommit WAL connection to a SQLite file per thread, opened on first use"""
+
+    def __init__(self, path, cached_statements=128):
+        self.path = path
+        self.cached_statements = cached_statements
+        self._local = threading.local()
+
+    def get(self):
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=10, isolation_level=None,
+                                   cached_statements=self.cached_statements)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            self._local.conn = conn
+        return conn
+
+
+def migrate(conn):
+    """Apply pending migrations; the write lock keeps concurrent workers from racing"""
+    conn.execute('BEGIN IMMEDIATE')
+    try:
+        version = conn.execute('PRAGMA user_version').fetchone()[0]
+        for number, statements in enumerate(MIGRATIONS[version:], start=version + 1):
+            for statement in statements:
+                conn.execute(statement)
+            conn.execute(f'PRAGMA user_version = {number}')
+        conn.execute('COMMIT')
+    except Exception:
+        conn.execute('ROLLBACK')
+        raise
+
+
+class Storage:
+    """Connection-per-thread access to the application database"""
+
+    def __init__(self, path, chat_max_age_seconds=None, chat_turns_per_conversation=None, chat_max_turns=None):
+        self.path = path
+        self.chat_max_age_seconds = chat_max_age_seconds
+        self.chat_turns_per_conversation = chat_turns_per_conversation
+        self.chat_max_turns = chat_max_turns
+        self._connections = ThreadConnections(path, cached_statements=64)
+        self._chat_inserts = itertools.count(1)
+        self.migrate()
+
+    def _connection(self):
+        return self._connections.get()
+
+    def migrate(self):
+        migrate(self._connection())
+
+    def schema_version(self):
+        return self._connection().execute('PRAGMA user_version').fetchone()[0]
+
+    # Users
+
+    def create_user(self, name, email, password_hash):
+        """False when the email is already registered"""
+        try:
+            self._connection().execute(INSERT_USER, (email, name, password_hash, datetime.now().isoformat()))
+            return True
+        except sqlite3.IntegrityError:
+            return False
+
+    def get_user(self, email):
+        row = self._connection().execute(SELECT_USER, (email,)).fetchone()
+        if not row:
+            return None
+        return {'email': row[0], 'name': row[1], 'password': row[2], 'created_at': row[3]}
+
+    # Quiz results
+
+    def add_quiz_result(self, email, answers, recommendations):
+        self._connection().execute(INSERT_QUIZ_RESULT, (
+            email,
+            json.dumps(answers, ensure_ascii=False),
+            json.dumps(recommendations, ensure_ascii=False),
+            datetime.now().isoformat()
+        ))
+
+    def quiz_history(self, email, limit, before_id=None):
+        """One page of a user's quiz results, newest first, plus the id to continue before (or None).
+
+        Keyset pagination over the (user_email, id) index: the cost depends on
+        the page size, not on how many results exist in total.
+        """
+        rows = self._connection().execute(
+            SELECT_QUIZ_HISTORY, (email, before_id or NO_CURSOR, limit + 1)).fetchall()
+        results = []
+        for result_id, answers, recommendations, created_at in rows[:limit]:
+            recommendations = json.loads(recommendations)
+            results.append({
+                'id': result_id,
+                'answers': json.loads(answers),
+                'predicted_career': recommendations[0]['career'] if recommendations else None,
+                'score': recommendations[0]['score'] if recommendations else None,
+                'recommendations': recommendations,
+                'timestamp': created_at
+            })
+        next_before = results[-1]['id'] if len(rows) > limit else None
+        return results, next_before
+
+    def latest_quiz_result(self, email):
+        results, _ = self.quiz_history(email, 1)
+        return results[0] if results else None
+
+    def count_quiz_results(self, email):
+        return self._connection().execute(COUNT_QUIZ_RESULTS, (email,)).fetchone()[0]
+
+    # Chat history
+
+    def add_chat_turn(self, chat_id, message, response, user_email=None):
+        """Append a turn, keeping only the conversation's newest chat_turns_per_conversation.
+
+        Every CHAT_PURGE_EVERY inserts this process also drops turns past
+        the age limit and, beyond chat_max_turns in total, the oldest turns,
+        so the table overshoots the global cap by at most that many rows per worker.
+        """
+        now = time.time()
+        conn = self._connection()
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            conn.execute(INSERT_CHAT_TURN, (chat_id, user_email, message, response, now,
+                                            datetime.fromtimestamp(now).isoformat()))
+            if self.chat_turns_per_conversation:
+                conn.execute(TRIM_CHAT, (chat_id, chat_id, self.chat_turns_per_conversation))
+            if next(self._chat_inserts) % CHAT_PURGE_EVERY == 0:
+                if self.chat_max_age_seconds:
+                    conn.execute(DELETE_OLD_CHAT, (now - self.chat_max_age_seconds,))
+                if self.chat_max_turns:
+                    conn.execute(TRIM_ALL_CHAT, (self.chat_max_turns,))
+            conn.execute('COMMIT')
+        except Exception:
+            conn.execute('ROLLBACK')
+            raise
+
+    def recent_chat_turns(self, chat_id, limit):
+        """Last `limit` turns of a conversation, oldest first"""
+        cutoff = time.time() - self.chat_max_age_seconds if self.chat_max_age_seconds else 0
+        rows = self._connection().execute(SELECT_RECENT_CHAT, (chat_id, cutoff, limit)).fetchall()
+        return [{'message': message, 'response': response, 'timestamp': created_at, 'user_email': user_email}
+                for message, response, created_at, user_email in reversed(rows)]
+
+    # Progress
+
+    def add_progress(self, email, entry):
+        self._connection().execute(INSERT_PROGRESS, (
+            email, json.dumps(entry, ensure_ascii=False), datetime.now().isoformat()))
+
+    def progress_for(self, email):
+        rows = self._connection().execute(SELECT_PROGRESS, (email,)).fetchall()
+        return [dict(json.loads(data), user_email=email, timestamp=created_at) for data, created_at in rows]
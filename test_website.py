@@ -6,7 +6,10 @@ Tests all major routes and functionality
 
 import requests
 import json
+import threading
+import time
 from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 
 BASE_URL = "http://127.0.0.1:5000"
 
@@ -61,6 +64,7 @@ def test_api_endpoints():
         ('/api/internships', 'Internships API'),
         ('/api/jobs', 'Jobs API'),
         ('/api/opportunities', 'Opportunities API'),
+        ('/api/search?q=data', 'Search API'),
     ]
     
     results = []
@@ -204,6 +208,396 @@ def test_quiz_submission():
     
     return results
 
+def start_stub_provider(payload, delay=0):
+    """Start a local HTTP server that answers every GET with payload after delay"""
+    class StubHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            time.sleep(delay)
+            body = json.dumps(payload).encode('utf-8')
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), StubHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}/"
+
+def test_concurrent_fetch():
+    """Test provider fan-out against local stub servers"""
+    from fanout import FanOut
+
+    print("\n" + "="*60)
+    print("TESTING CONCURRENT PROVIDER FETCH")
+    print("="*60)
+    
+    servers = []
+    try:
+        fast_a, url_a = start_stub_provider([{'id': 'a_1'}], delay=0.3)
+        fast_b, url_b = start_stub_provider([{'id': 'b_1'}, {'id': 'b_2'}], delay=0.3)
+        slow, url_slow = start_stub_provider([{'id': 'slow_1'}], delay=3)
+        servers = [fast_a, fast_b, slow]
+        
+        fanout = FanOut(max_workers=4, name='test', default_timeout=1.0)
+        started = time.monotonic()
+        merged, failures = fanout.merge({
+            'a': lambda: requests.get(url_a, timeout=5).json(),
+            'slow': lambda: requests.get(url_slow, timeout=5).json(),
+            'b': lambda: requests.get(url_b, timeout=5).json()
+        })
+        elapsed = time.monotonic() - started
+        
+        # Fast sources run in parallel (~0.3s, not 0.6s) and the slow one is cut at 1s
+        print_result("Slow Provider Does Not Block", elapsed < 1.5, f"Elapsed: {elapsed:.2f}s")
+        assert elapsed < 1.5, f"fan-out took {elapsed:.2f}s; the slow provider was not cut at its 1s timeout"
+        
+        ids = [item['id'] for item in merged]
+        print_result("Partial Results Merged", ids == ['a_1', 'b_1', 'b_2'] and failures == {'slow': 'timeout'},
+                     f"Items: {len(merged)}, Failures: {failures}")
+        assert ids == ['a_1', 'b_1', 'b_2'], ids
+        assert failures == {'slow': 'timeout'}, failures
+        
+        merged, failures = fanout.merge({
+            'a': lambda: requests.get(url_a, timeout=5).json(),
+            'broken': lambda: requests.get('http://127.0.0.1:1/', timeout=1).json()
+        })
+        ids = [item['id'] for item in merged]
+        print_result("Failing Provider Skipped", ids == ['a_1'] and 'broken' in failures,
+                     f"Failures: {list(failures)}")
+        assert ids == ['a_1'], ids
+        assert list(failures) == ['broken'], failures
+    finally:
+        for server in servers:
+            server.shutdown()
+
+def start_fake_openai_server(reply="Fake mentor reply", delay=0):
+    """Start a local OpenAI-compatible /chat/completions server; returns (server, base_url, peers)"""
+    peers = []
+
+    class FakeOpenAIHandler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+
+        def do_POST(self):
+            peers.append(self.client_address)
+            length = int(self.headers.get('Content-Length', 0))
+            request_body = json.loads(self.rfile.read(length) or b'{}')
+            time.sleep(delay)
+
+            if request_body.get('stream'):
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/event-stream')
+                self.send_header('Transfer-Encoding', 'chunked')
+                self.end_headers()
+                for word in reply.split(' '):
+                    chunk = {'id': 'fake', 'object': 'chat.completion.chunk', 'created': 0, 'model': 'fake',
+                             'choices': [{'index': 0, 'delta': {'content': word + ' '}, 'finish_reason': None}]}
+                    data = f"data: {json.dumps(chunk)}\n\n".encode('utf-8')
+                    self.wfile.write(f"{len(data):x}\r\n".encode('ascii') + data + b"\r\n")
+                done = b"data: [DONE]\n\n"
+                self.wfile.write(f"{len(done):x}\r\n".encode('ascii') + done + b"\r\n0\r\n\r\n")
+                return
+
+            body = json.dumps({
+                'id': 'fake', 'object': 'chat.completion', 'created': 0, 'model': 'fake',
+                'choices': [{'index': 0, 'message': {'role': 'assistant', 'content': reply}, 'finish_reason': 'stop'}],
+                'usage': {'prompt_tokens': 1, 'completion_tokens': 1, 'total_tokens': 2}
+            }).encode('utf-8')
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), FakeOpenAIHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}/v1", peers
+
+def test_llm_client_pool():
+    """Test that the LLM client registry reuses one pooled client"""
+    from llm_clients import LLMClientRegistry, make_openai_client
+
+    print("\n" + "="*60)
+    print("TESTING LLM CLIENT POOL")
+    print("="*60)
+    
+    server = None
+    try:
+        server, base_url, peers = start_fake_openai_server()
+        registry = LLMClientRegistry()
+        registry.register('fake', lambda: make_openai_client('test-key', base_url, timeout=5))
+        
+        clients = []
+        workers = [threading.Thread(target=lambda: clients.append(registry.get('fake'))) for _ in range(8)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+        distinct = len({id(client) for client in clients})
+        print_result("Client Built Once Across Threads", distinct == 1, f"Distinct clients: {distinct}")
+        assert len(clients) == 8 and distinct == 1, f"{distinct} distinct clients for {len(clients)} lookups"
+        
+        replies = []
+        for _ in range(3):
+            response = registry.get('fake').chat.completions.create(
+                model='fake', messages=[{'role': 'user', 'content': 'hello'}])
+            replies.append(response.choices[0].message.content)
+        
+        print_result("Keep-Alive Connection Reused", replies == ["Fake mentor reply"] * 3 and len(set(peers)) == 1,
+                     f"Requests: {len(peers)}, Connections: {len(set(peers))}")
+        assert replies == ["Fake mentor reply"] * 3, replies
+        assert len(peers) == 3 and len(set(peers)) == 1, f"{len(peers)} requests over {len(set(peers))} connections"
+    finally:
+        if server:
+            server.shutdown()
+
+def test_facet_counts():
+    """Test combined facet filters and the per-facet counts beside them"""
+    from facet_index import FacetIndex
+
+    print("\n" + "="*60)
+    print("TESTING FACET COUNTS")
+    print("="*60)
+
+    items = [
+        {'id': 1, 'category': 'Tech', 'location': 'Pune', 'skills': ['Python', 'SQL'], 'salary_max_inr': 250000},
+        {'id': 2, 'category': 'Tech', 'location': 'Delhi', 'skills': ['python'], 'salary_max_inr': 400000},
+        {'id': 3, 'category': 'Finance', 'location': 'Pune', 'skills': ['Excel'], 'salary_max_inr': 600000},
+        {'id': 4, 'category': 'Finance', 'location': 'Delhi', 'skills': [], 'salary_max_inr': None},
+        {'id': 5, 'category': 'Design', 'location': 'Pune ', 'skills': ['Figma', 'SQL']}
+    ]
+    index = FacetIndex(
+        {'category': 'category', 'location': 'location', 'skills': 'skills'},
+        {'salary': (lambda item: item.get('salary_max_inr'),
+                    [('under_3l', None, 300000), ('3l_5l', 300000, 500000), ('5l_plus', 500000, None)])})
+    index.build(items)
+
+    matches, counts = index.query()
+    assert [item['id'] for item in matches] == [1, 2, 3, 4, 5]
+    assert counts['category'] == {'Tech': 2, 'Finance': 2, 'Design': 1}, counts['category']
+    assert counts['location'] == {'Pune': 3, 'Delhi': 2}, counts['location']
+    assert counts['skills'] == {'Python': 2, 'SQL': 2, 'Excel': 1, 'Figma': 1}, counts['skills']
+    # Bucket lows are inclusive, highs exclusive; items without a value land nowhere
+    assert counts['salary'] == {'under_3l': 1, '3l_5l': 1, '5l_plus': 1}, counts['salary']
+
+    # Values of one facet are ORed, facets are ANDed, matching ignores case and padding
+    matches, counts = index.query({'category': ['tech', 'DESIGN'], 'location': ['pune']})
+    assert [item['id'] for item in matches] == [1, 5], matches
+    # Each facet's counts apply the other selections but not its own
+    assert counts['category'] == {'Tech': 1, 'Finance': 1, 'Design': 1}, counts['category']
+    assert counts['location'] == {'Pune': 2, 'Delhi': 1}, counts['location']
+    assert counts['skills'] == {'Python': 1, 'SQL': 2, 'Excel': 0, 'Figma': 1}, counts['skills']
+    assert counts['salary'] == {'under_3l': 1, '3l_5l': 0, '5l_plus': 0}, counts['salary']
+
+    # within restricts both the matches and every count
+    matches, counts = index.query({'location': ['Pune']}, within=[items[0], items[1], items[2]])
+    assert [item['id'] for item in matches] == [1, 3], matches
+    assert counts['location'] == {'Pune': 2, 'Delhi': 1}, counts['location']
+    assert counts['category'] == {'Tech': 1, 'Finance': 1, 'Design': 0}, counts['category']
+
+    # Unknown facets are ignored and an unknown value matches nothing
+    matches, _ = index.query({'colour': ['red']})
+    assert len(matches) == 5
+    matches, counts = index.query({'category': ['Legal']})
+    assert matches == [] and counts['category']['Tech'] == 2
+
+    print_result("Combined Facet Counts", True, "OR within, AND across, own selection left out of own counts")
+
+def test_deadline_windows():
+    """Test deadline window boundaries, expiry and cross-feed reminder order"""
+    from datetime import date
+    from deadline_index import DeadlineIndex, iter_reminders
+
+    print("\n" + "="*60)
+    print("TESTING DEADLINE WINDOWS")
+    print("="*60)
+
+    today = date(2026, 3, 10)
+    scholarships = DeadlineIndex()
+    scholarships.build([
+        {'id': 's_week', 'title': 'Week', 'deadline': '2026-03-17'},
+        {'id': 's_past', 'title': 'Past', 'deadline': '2026-03-09'},
+        {'id': 's_today', 'title': 'Today', 'deadline': '2026-03-10T23:59:00'},
+        {'id': 's_rolling', 'title': 'Rolling', 'deadline': 'Rolling'},
+        {'id': 's_none', 'title': 'None'},
+        {'id': 's_later', 'title': 'Later', 'deadline': '2026-03-18'}
+    ])
+    # Unparseable and missing deadlines are left out
+    assert len(scholarships) == 4, len(scholarships)
+
+    ids = lambda items: [item['id'] for item in items]
+    # within=0 still includes deadlines falling today; past deadlines never show
+    assert ids(scholarships.due_within(0, today)) == ['s_today']
+    # today + within is inclusive, the day after is not
+    assert ids(scholarships.due_within(7, today)) == ['s_today', 's_week']
+    assert ids(scholarships.due_within(8, today)) == ['s_today', 's_week', 's_later']
+    # Passed deadlines are trimmed off the index rather than skipped on every query
+    assert len(scholarships) == 3, len(scholarships)
+    assert scholarships.due_within(30, date(2026, 3, 19)) == [] and len(scholarships) == 0
+
+    # A rebuild is never replaced by a trimmed copy of the data it superseded
+    index = DeadlineIndex()
+    index.build([{'id': 'old', 'deadline': '2026-03-01'}, {'id': 'kept', 'deadline': '2026-03-12'}])
+    stale = index._snapshot
+    index.build([{'id': 'new', 'deadline': '2026-03-11'}])
+    index._snapshot, fresh = stale, index._snapshot
+    index._expire(today)
+    assert ids(index._snapshot[1]) == ['kept']
+    index._snapshot = fresh
+    assert ids(index.due_within(5, today)) == ['new']
+
+    internships = DeadlineIndex()
+    internships.build([
+        {'id': 'i_tomorrow', 'title': 'Tomorrow', 'deadline': '2026-03-11'},
+        {'id': 'i_week', 'title': 'Week', 'deadline': '2026-03-17'}
+    ])
+    scholarships.build([
+        {'id': 's_today', 'title': 'Today', 'deadline': '2026-03-10'},
+        {'id': 's_three', 'title': 'Three', 'deadline': '2026-03-13'}
+    ])
+    reminders = list(iter_reminders({'scholarships': scholarships, 'internships': internships}, 7, today))
+    assert [r['id'] for r in reminders] == ['s_today', 'i_tomorrow', 's_three', 'i_week'], reminders
+    assert [r['days_left'] for r in reminders] == [0, 1, 3, 7]
+    assert reminders[0]['message'] == 'Today closes today' and reminders[1]['message'] == 'Tomorrow closes tomorrow'
+    assert reminders[1]['type'] == 'internships'
+
+    print_result("Deadline Windows", True, "Inclusive on both ends, past deadlines expired, reminders merged by date")
+
+def test_session_store():
+    """Test server-side sessions: id-only cookie, rotation on login, cleanup on logout"""
+    import os
+    import tempfile
+    from flask import Flask, session
+    from cache_backend import LocalRedis
+    from session_store import SESSION_ID, SQLiteSessionStore, RedisSessionStore, ServerSideSessionInterface
+
+    print("\n" + "="*60)
+    print("TESTING SESSION STORE")
+    print("="*60)
+
+    with tempfile.TemporaryDirectory() as directory:
+        sqlite_store = SQLiteSessionStore(os.path.join(directory, 'sessions.db'))
+        for store in (sqlite_store, RedisSessionStore(LocalRedis())):
+            app = Flask(__name__)
+            app.secret_key = 'test-secret'
+            app.session_interface = ServerSideSessionInterface(store)
+
+            @app.route('/login')
+            def login():
+                session.rotate()
+                session['user_id'] = 42
+                return 'ok'
+
+            @app.route('/whoami')
+            def whoami():
+                return str(session.get('user_id'))
+
+            @app.route('/logout')
+            def logout():
+                session.clear()
+                return 'ok'
+
+            @app.route('/remember')
+            def remember():
+                session['quiz_results'] = ['Data Scientist']
+                return 'ok'
+
+            @app.route('/static-page')
+            def static_page():
+                return 'ok'
+
+            client = app.test_client()
+            client.get('/login')
+            first_sid = client.get_cookie('session').value
+            # The cookie holds only the id; the data is in the store
+            assert len(first_sid) == 43 and '42' not in first_sid, first_sid
+            assert store.load(first_sid) is not None
+            assert client.get('/whoami').text == '42'
+
+            # A route that never touches the session neither loads nor rewrites it
+            response = client.get('/static-page')
+            assert 'Set-Cookie' not in response.headers and 'Cookie' not in response.vary
+
+            # Logging in again moves the data to a new id and drops the old row
+            client.get('/login')
+            second_sid = client.get_cookie('session').value
+            assert second_sid != first_sid
+            assert store.load(first_sid) is None and store.load(second_sid) is not None
+            assert client.get('/whoami').text == '42'
+
+            # An emptied session deletes its row and the cookie
+            client.get('/logout')
+            assert store.load(second_sid) is None
+            assert client.get_cookie('session') is None
+            assert client.get('/whoami').text == 'None'
+
+            # Malformed or unknown ids start a fresh, empty session
+            client.set_cookie('session', 'not-a-session-id')
+            assert client.get('/whoami').text == 'None'
+            client.set_cookie('session', 'A' * 43)
+            assert client.get('/whoami').text == 'None'
+            # A planted id is never adopted: data written under it goes to a freshly issued id
+            client.get('/remember')
+            planted_sid = client.get_cookie('session').value
+            assert planted_sid != 'A' * 43 and SESSION_ID.match(planted_sid), planted_sid
+            assert store.load('A' * 43) is None and store.load(planted_sid) is not None
+
+        sqlite_store.save('B' * 43, '{}', -1)
+        assert sqlite_store.load('B' * 43) is None
+
+        # The sessions table comes from the storage migrations, whichever opens the file first
+        from storage import MIGRATIONS, Storage
+        assert Storage(os.path.join(directory, 'sessions.db')).schema_version() == len(MIGRATIONS)
+
+    print_result("Server-Side Sessions", True, "SQLite and Redis stores: id-only cookie, rotation, logout cleanup")
+
+def test_cancelled_probe():
+    """Test that a half-open probe cancelled while queued does not wedge its breaker"""
+    from circuit_breaker import CircuitBreaker, HALF_OPEN, CLOSED
+    from llm_dispatch import HedgedDispatcher
+
+    print("\n" + "="*60)
+    print("TESTING CANCELLED BREAKER PROBE")
+    print("="*60)
+
+    dispatcher = HedgedDispatcher(hedge_delay=5, budget=0.3, max_workers=1,
+                                  breaker_factory=lambda name: CircuitBreaker(name, min_calls=1, open_seconds=0.1))
+    breaker = dispatcher.breaker('flaky')
+    breaker.record(10, ok=False, ticket=breaker.allow())
+    time.sleep(0.15)
+
+    # Keep the only pool thread busy so the probe is still queued when the budget runs out
+    release_worker = threading.Event()
+    dispatcher.executor.submit(release_worker.wait)
+    try:
+        assert dispatcher.dispatch([('flaky', lambda message, timeout: 'late')], 'hello') == (None, None)
+        assert breaker.state == HALF_OPEN and not breaker._probe_in_flight
+    finally:
+        release_worker.set()
+
+    # The slot is free again: the next call probes and closes the breaker
+    name, response = dispatcher.dispatch([('flaky', lambda message, timeout: 'back')], 'hello', budget=2)
+    assert (name, response) == ('flaky', 'back')
+    assert breaker.state == CLOSED, breaker.snapshot()
+    dispatcher.executor.shutdown(wait=True)
+
+    print_result("Cancelled Probe Released", True, "Breaker probed and closed after a queued probe was cancelled")
+
+def run_asserting(suite):
+    """Run an assert-based suite for the summary: one result, False when any check fails"""
+    try:
+        suite()
+        return [True]
+    except Exception as e:
+        print_result(suite.__name__, False, f"Error: {e}")
+        return [False]
+
 def main():
     """Run all tests"""
     print("\n" + "="*60)
@@ -220,6 +614,12 @@ def main():
     all_results.extend(test_chatbot())
     all_results.extend(test_authentication())
     all_results.extend(test_quiz_submission())
+    all_results.extend(run_asserting(test_concurrent_fetch))
+    all_results.extend(run_asserting(test_llm_client_pool))
+    all_results.extend(run_asserting(test_facet_counts))
+    all_results.extend(run_asserting(test_deadline_windows))
+    all_results.extend(run_asserting(test_session_store))
+    all_results.extend(run_asserting(test_cancelled_probe))
     
     # Print summary
     print("\n" + "="*60)